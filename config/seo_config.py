@@ -82,10 +82,24 @@ ARTICLE_CONFIGS = {
     }
 }
 
-def get_config_for_file(filename: str) -> Dict[str, Any]:
+# Séries de artigos (ordem de leitura). Também podem ser declaradas no
+# front matter de cada artigo com `series` e `series_order`.
+SERIES_CONFIGS = {
+    'kafka-java': {
+        'title': 'Apache Kafka com Java',
+        'articles': [
+            'parte1-fundamentos.md',
+            'parte2-java.md',
+            'parte-final-avancado.md'
+        ]
+    }
+}
+
+def get_config_for_file(filename: str, front_matter: Dict[str, Any] = None) -> Dict[str, Any]:
     """
     Obtém a configuração completa para um arquivo específico.
-    Combina configurações padrão com configurações específicas do arquivo.
+    Combina configurações padrão com configurações específicas do arquivo
+    e, por último, com o front matter do próprio artigo (se informado).
     """
     # Começar com configurações padrão
     config = DEFAULT_CONFIG.copy()
@@ -95,6 +109,10 @@ def get_config_for_file(filename: str) -> Dict[str, Any]:
         file_config = ARTICLE_CONFIGS[filename]
         config.update(file_config)
     
+    # O front matter do artigo tem precedência sobre os dicionários acima
+    if front_matter:
+        config.update(front_matter)
+    
     # Garantir que campos obrigatórios existam
     if 'title' not in config:
         config['title'] = filename.replace('.md', '').replace('-', ' ').title()
@@ -108,7 +126,7 @@ def get_config_for_file(filename: str) -> Dict[str, Any]:
     # Construir URL completa
     if 'base_url' in config:
         html_filename = filename.replace('.md', '.html')
-        config['canonical_url'] = f"{config['base_url'].rstrip('/')}/{html_filename}"
+        config.setdefault('canonical_url', f"{config['base_url'].rstrip('/')}/{html_filename}")
         
         # URL da imagem social
         if 'social_image' in config:
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+benchmark_memory.py
+
+Benchmark de memória do conversor: compara o pico de alocações (tracemalloc)
+do modo normal com o modo para documentos grandes (mmap + gravação seção
+por seção, ver large_document.py).
+
+Gera documentos sintéticos de vários tamanhos (seções com parágrafos,
+listas, tabelas e blocos de código) e converte cada um nos dois modos. No
+modo normal o pico cresce com o documento; no modo para documentos grandes
+ele deve ficar aproximadamente constante (depende da maior seção).
+
+Uso:
+    python scripts/benchmark_memory.py
+    python scripts/benchmark_memory.py --sizes 0.5 1 2 --json
+    python scripts/benchmark_memory.py --sizes 2 --check 0.5
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+import tracemalloc
+import importlib.util
+from pathlib import Path
+from typing import Any, Dict, List
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+SECTION_TEMPLATE = """## Seção {index}: Partições e Réplicas
+
+O Kafka distribui as mensagens de um tópico entre partições. Cada partição é
+uma sequência ordenada e imutável de registros, e o **offset** identifica a
+posição de cada registro. Veja também a [documentação oficial](https://kafka.apache.org/documentation/).
+
+### Configuração {index}
+
+- `num.partitions`: número padrão de partições
+- `replication.factor`: cópias de cada partição
+- `min.insync.replicas`: réplicas sincronizadas exigidas
+
+| Parâmetro | Valor | Descrição |
+|-----------|-------|-----------|
+| acks | all | Confirmação de todas as réplicas |
+| retries | 3 | Novas tentativas do produtor |
+
+```java
+Properties props = new Properties();
+props.put("bootstrap.servers", "localhost:9092");
+props.put("acks", "all");
+KafkaProducer<String, String> producer = new KafkaProducer<>(props);
+producer.send(new ProducerRecord<>("topico-{index}", "chave", "valor"));
+```
+
+"""
+
+
+def load_converter():
+    """Carrega o format-html-seo.py (nome com hífens, fora do padrão de import)."""
+    spec = importlib.util.spec_from_file_location("format_html_seo", SCRIPTS_DIR / "format-html-seo.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_document(path: Path, size_mb: float) -> int:
+    """Grava um artigo sintético com aproximadamente `size_mb` MB; retorna o tamanho em bytes."""
+    target = int(size_mb * 1024 * 1024)
+    written = 0
+    index = 0
+    with path.open('w', encoding='utf-8') as f:
+        header = "# Guia Completo de Apache Kafka\n\nDocumento sintético para o benchmark de memória.\n\n"
+        f.write(header)
+        written += len(header.encode('utf-8'))
+        while written < target:
+            index += 1
+            section = SECTION_TEMPLATE.format(index=index)
+            f.write(section)
+            written += len(section.encode('utf-8'))
+    return written
+
+
+def measure(function, *args, **kwargs) -> Dict[str, float]:
+    """Executa `function` medindo o pico de alocações Python (tracemalloc) e o tempo."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    started = time.perf_counter()
+    try:
+        function(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'peak_mb': round(peak / (1024 * 1024), 2), 'seconds': round(time.perf_counter() - started, 2)}
+
+
+def run_benchmark(sizes: List[float], workdir: Path) -> List[Dict[str, Any]]:
+    """Mede os dois modos para cada tamanho de documento."""
+    converter = load_converter()
+    converter.warm_up()
+    results = []
+    for size_mb in sizes:
+        md_file = workdir / f"guia-{size_mb:g}mb.md"
+        size = write_document(md_file, size_mb)
+
+        def normal():
+            md_content, _ = converter.read_article(md_file)
+            html, _ = converter.render_article(md_content, md_file)
+            (workdir / "normal.html").write_text(html, encoding='utf-8')
+
+        normal_result = measure(normal)
+        large_result = measure(converter.convert_large_md_to_html, md_file, workdir / "grande.html")
+        results.append({
+            'size_mb': round(size / (1024 * 1024), 2),
+            'normal': normal_result,
+            'large': large_result
+        })
+        md_file.unlink()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de memória: modo normal vs. documentos grandes')
+    parser.add_argument('--sizes', type=float, nargs='+', default=[0.25, 0.5, 1], help='Tamanhos dos documentos em MB')
+    parser.add_argument('--check', type=float, default=None,
+                        help='Falha se o pico do modo grande passar desta fração do pico normal no maior documento')
+    parser.add_argument('--json', action='store_true', help='Saída em JSON')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as tmp:
+        results = run_benchmark(sorted(args.sizes), Path(tmp))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print("[INFO] Benchmark de Memória (pico do tracemalloc)")
+        print("=" * 50)
+        print(f"{'Documento':>10}  {'Normal':>18}  {'Documento grande':>18}")
+        for result in results:
+            normal = result['normal']
+            large = result['large']
+            print(f"{result['size_mb']:>7.2f} MB  "
+                  f"{normal['peak_mb']:>9.2f} MB {normal['seconds']:>5.2f}s  "
+                  f"{large['peak_mb']:>9.2f} MB {large['seconds']:>5.2f}s")
+
+    if args.check is not None:
+        largest = results[-1]
+        ratio = largest['large']['peak_mb'] / largest['normal']['peak_mb']
+        if ratio > args.check:
+            print(f"[ERROR] Pico do modo grande em {ratio:.0%} do modo normal (limite: {args.check:.0%})")
+            sys.exit(1)
+        print(f"[INFO] ✅ Pico do modo grande em {ratio:.0%} do modo normal (limite: {args.check:.0%})")
+
+
+if __name__ == "__main__":
+    main()
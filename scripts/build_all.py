@@ -38,12 +38,13 @@ def clean_output_folder(output_path):
         print(f"🧹 Pasta output limpa: {len(list(output_path.glob('*')))} arquivos removidos")
 
 def get_markdown_files(content_path):
-    """Obtém lista de arquivos Markdown na pasta content."""
-    md_files = list(content_path.glob('*.md'))
-    # Excluir arquivos de documentação
-    exclude_files = {'README.md', 'CHANGELOG.md', 'TODO.md'}
-    md_files = [f for f in md_files if f.name not in exclude_files]
-    return sorted(md_files)
+    """Obtém lista de arquivos Markdown na pasta content (subpastas incluídas)."""
+    from discovery import iter_markdown_files
+    
+    if not content_path.is_dir():
+        return []
+    # README.md, CHANGELOG.md, TODO.md e os padrões do .buildignore são ignorados
+    return sorted(iter_markdown_files(content_path))
 
 def build_all_articles(clean_first=False):
     """Constrói todos os artigos."""
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+build_cache.py
+
+Cache de build endereçado por conteúdo, compartilhável entre máquinas.
+
+Cada artigo renderizado (HTML final, já com o código realçado pelo
+Pygments/codehilite, e os dados coletados na renderização) é guardado sob
+uma chave que combina o conteúdo do Markdown, as opções de renderização e a
+versão do código de renderização (o conversor e os módulos que ele importa,
+ver render_version.py). Outra máquina (runner de CI, outro desenvolvedor) que
+aponte para o mesmo diretório, por exemplo um volume compartilhado, reutiliza
+a renderização em vez de refazê-la.
+
+Além da página final, o cache guarda o corpo renderizado (HTML do Markdown
+pós-processado e meta extraídos) como intermediário. A chave do corpo usa só
+a versão do código do corpo (body_version), não a do conversor inteiro: uma
+mudança apenas no template invalida as páginas, mas os corpos continuam
+válidos e o build só precisa reaplicar o template.
+
+    <cache>/objects/ab/abcdef....json.gz   entrada (página ou corpo, gzip)
+    <cache>/stats.json                     acertos, faltas e espaço liberado
+
+As entradas são gravadas de forma atômica (arquivo temporário + rename) e o
+mtime de cada uma é atualizado a cada acerto; a coleta (gc) remove as menos
+usadas recentemente até o cache caber no orçamento de bytes.
+
+Uso:
+    python scripts/build_cache.py stats
+    python scripts/build_cache.py gc --max-size 256
+"""
+
+import os
+import json
+import gzip
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from catalog import build_fingerprint
+
+# Incrementar quando o formato das entradas mudar
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path(".build") / "cache"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+STAT_KEYS = ('hits', 'misses', 'body_hits', 'body_misses', 'stores', 'evictions', 'evicted_bytes')
+
+
+def get_cache_dir() -> Path:
+    """Diretório do cache (SEO_BUILD_CACHE sobrepõe o padrão .build/cache)."""
+    return Path(os.environ.get('SEO_BUILD_CACHE', DEFAULT_CACHE_DIR))
+
+
+class BuildCache:
+    """
+    Cache de renderizações em disco com despejo LRU por orçamento de bytes.
+
+    Args:
+        root (Path): diretório do cache
+        max_bytes (int): orçamento de espaço usado pelo gc
+        version (str): versão do código de renderização (entra nas chaves
+            das páginas, ver render_version.py)
+        body_version (str): versão do código do corpo (entra nas chaves dos corpos)
+        refresh (bool): não lê entradas (tudo conta como falta), só grava as
+            novas renderizações (start.py --force)
+    """
+
+    def __init__(self, root: Path = None, max_bytes: int = DEFAULT_MAX_BYTES, version: str = '',
+                 body_version: str = '', refresh: bool = False):
+        self.root = Path(root or get_cache_dir())
+        self.objects_dir = self.root / "objects"
+        self.max_bytes = max_bytes
+        self.version = version
+        self.body_version = body_version
+        self.refresh = refresh
+        self.counters = dict.fromkeys(STAT_KEYS, 0)
+
+    def key(self, *parts: Any) -> str:
+        """Chave de uma página: conteúdo + opções + versão do código de renderização."""
+        return build_fingerprint(CACHE_FORMAT_VERSION, self.version, *parts)
+
+    def body_key(self, *parts: Any) -> str:
+        """Chave de um corpo: conteúdo + opções + versão do código do corpo."""
+        return build_fingerprint(CACHE_FORMAT_VERSION, 'body', self.body_version, *parts)
+
+    def _object_path(self, key: str) -> Path:
+        return self.objects_dir / key[:2] / f"{key}.json.gz"
+
+    def _load(self, key: str, counter: str) -> Optional[Dict[str, Any]]:
+        path = self._object_path(key)
+        if self.refresh:
+            self.counters[f'{counter}misses'] += 1
+            return None
+        try:
+            entry = json.loads(gzip.decompress(path.read_bytes()))
+            os.utime(path)  # marca como usada recentemente (LRU)
+        except (OSError, ValueError):
+            self.counters[f'{counter}misses'] += 1
+            return None
+        self.counters[f'{counter}hits'] += 1
+        return entry
+
+    def get(self, key: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Busca uma renderização.
+
+        Returns:
+            tuple ou None: (html, info) ou None se a chave não estiver no cache
+        """
+        entry = self._load(key, '')
+        return (entry['html'], entry['info']) if entry is not None else None
+
+    def get_body(self, key: str) -> Optional[Dict[str, Any]]:
+        """Busca um corpo renderizado (ver render_body no conversor)."""
+        entry = self._load(key, 'body_')
+        return entry['body'] if entry is not None else None
+
+    def put(self, key: str, html: str, info: Dict[str, Any]):
+        """Guarda uma renderização (gravação atômica: leitores nunca veem entrada parcial)."""
+        info = {name: value for name, value in info.items()
+                if name not in ('timings', 'bytes_in', 'bytes_out', 'error', 'body')}
+        self._store(key, {'html': html, 'info': info})
+
+    def put_body(self, key: str, body: Dict[str, Any]):
+        """Guarda um corpo renderizado."""
+        self._store(key, {'body': body})
+
+    def _store(self, key: str, entry: Dict[str, Any]):
+        path = self._object_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = gzip.compress(json.dumps(entry, ensure_ascii=False, default=str).encode('utf-8'), mtime=0)
+
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        except OSError:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        self.counters['stores'] += 1
+
+    def entries(self):
+        """Lista as entradas como (mtime, tamanho, caminho)."""
+        if not self.objects_dir.exists():
+            return []
+        entries = []
+        for path in self.objects_dir.glob("*/*.json.gz"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # removida por outro processo
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def gc(self, max_bytes: Optional[int] = None) -> Dict[str, int]:
+        """
+        Remove as entradas menos usadas recentemente até caber no orçamento.
+
+        Returns:
+            dict: entradas e bytes removidos, e o tamanho final
+        """
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        removed = removed_bytes = 0
+
+        for _, size, path in entries:
+            if total <= budget:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+            removed_bytes += size
+
+        self.counters['evictions'] += removed
+        self.counters['evicted_bytes'] += removed_bytes
+        return {'removed': removed, 'removed_bytes': removed_bytes, 'total_bytes': total}
+
+    def load_stats(self) -> Dict[str, int]:
+        """Contadores acumulados de todas as execuções."""
+        try:
+            stats = json.loads((self.root / "stats.json").read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            stats = {}
+        return {name: int(stats.get(name, 0)) for name in STAT_KEYS}
+
+    def flush_stats(self):
+        """Soma os contadores desta execução aos acumulados em stats.json."""
+        if not any(self.counters.values()):
+            return
+        stats = self.load_stats()
+        for name, value in self.counters.items():
+            stats[name] += value
+        stats['updated_at'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.root / f"stats.json.{os.getpid()}.tmp"
+        tmp_path.write_text(json.dumps(stats, indent=2), encoding='utf-8')
+        os.replace(tmp_path, self.root / "stats.json")
+        self.counters = dict.fromkeys(STAT_KEYS, 0)
+
+    def summary(self) -> Dict[str, Any]:
+        """Estado do cache: entradas, bytes e taxa de acerto acumulada."""
+        stats = self.load_stats()
+        entries = self.entries()
+        lookups = stats['hits'] + stats['misses']
+        body_lookups = stats['body_hits'] + stats['body_misses']
+        return {
+            'dir': str(self.root),
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries),
+            'max_bytes': self.max_bytes,
+            'hit_rate': round(stats['hits'] / lookups, 4) if lookups else None,
+            'body_hit_rate': round(stats['body_hits'] / body_lookups, 4) if body_lookups else None,
+            **stats
+        }
+
+
+def format_bytes(size: int) -> str:
+    """Formata um tamanho em bytes (ex.: 12.3 MB)."""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.1f} {unit}" if unit != 'B' else f"{size} B"
+        size /= 1024
+
+
+def main():
+    """Função principal."""
+    parser = argparse.ArgumentParser(description='Cache de build compartilhado')
+    parser.add_argument('command', choices=['stats', 'gc'], help='Ação a executar')
+    parser.add_argument('--dir', default=None, help='Diretório do cache (padrão: $SEO_BUILD_CACHE ou .build/cache)')
+    parser.add_argument('--max-size', type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024),
+                        help='Orçamento do cache em MB (usado pelo gc)')
+    parser.add_argument('--json', action='store_true', help='Saída em JSON')
+
+    args = parser.parse_args()
+    cache = BuildCache(Path(args.dir) if args.dir else None, int(args.max_size * 1024 * 1024))
+
+    if args.command == 'gc':
+        result = cache.gc()
+        cache.flush_stats()
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            print(f"[INFO] {result['removed']} entrada(s) removida(s), {format_bytes(result['removed_bytes'])} liberado(s)")
+            print(f"[INFO] Tamanho atual: {format_bytes(result['total_bytes'])} (orçamento: {format_bytes(cache.max_bytes)})")
+        return
+
+    summary = cache.summary()
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+
+    hit_rate = f"{summary['hit_rate'] * 100:.1f}%" if summary['hit_rate'] is not None else "-"
+    body_hit_rate = f"{summary['body_hit_rate'] * 100:.1f}%" if summary['body_hit_rate'] is not None else "-"
+    print(f"📦 Cache: {summary['dir']}")
+    print(f"  • Entradas: {summary['entries']} ({format_bytes(summary['bytes'])} de {format_bytes(summary['max_bytes'])})")
+    print(f"  • Acertos: {summary['hits']} | Faltas: {summary['misses']} | Taxa de acerto: {hit_rate}")
+    print(f"  • Corpos: {summary['body_hits']} acerto(s) | {summary['body_misses']} falta(s) | Taxa de acerto: {body_hit_rate}")
+    print(f"  • Gravações: {summary['stores']}")
+    print(f"  • Despejos: {summary['evictions']} ({format_bytes(summary['evicted_bytes'])} liberado(s))")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+build_pipeline.py
+
+Orquestrador assíncrono do build: sobrepõe a E/S de arquivos à renderização.
+
+No laço sequencial do start.py, ler o Markdown, gravar o HTML, copiar
+imagens e comprimir a saída bloqueiam o mesmo laço que renderiza. Aqui cada
+etapa tem seus próprios trabalhadores, ligados por filas limitadas:
+
+    descoberta → leitura → renderização → pós-processamento → gravação → compressão
+                (threads)   (processos)   (threads: imagens)   (threads)   (threads)
+
+As etapas de E/S rodam em threads (asyncio.to_thread) e a renderização roda
+em um pool de processos, então disco e núcleos trabalham ao mesmo tempo. O
+tamanho das filas (queue_size) limita quantos artigos ficam em memória entre
+as etapas: com uma fila cheia, a etapa anterior espera (contrapressão).
+"""
+
+import os
+import gzip
+import time
+import shutil
+import asyncio
+import logging
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from includes import read_article
+from large_document import is_large_document
+from pagination import write_extra_pages
+from image_graph import referenced_images
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+CONVERTER_PATH = SCRIPTS_DIR / "format-html-seo.py"
+
+DEFAULT_QUEUE_SIZE = 8
+DEFAULT_IO_THREADS = 4
+GZIP_LEVEL = 9
+
+# Marca o fim do fluxo em cada fila
+_DONE = object()
+
+# Conversor carregado em cada processo do pool
+_worker_converter = None
+
+
+def _load_worker_converter():
+    """Carrega o format-html-seo.py no processo de renderização (uma vez)."""
+    global _worker_converter
+    if _worker_converter is None:
+        import importlib.util
+        spec = importlib.util.spec_from_file_location("format_html_seo", CONVERTER_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _worker_converter = module
+    return _worker_converter
+
+
+def _init_worker():
+    """Inicializador do pool: carrega o conversor e aquece o Markdown."""
+    _load_worker_converter().warm_up()
+
+
+def _render_worker(md_content: str, md_path: str, options: Dict[str, Any], series_nav=None, body=None):
+    """Renderiza um artigo no processo do pool (sem E/S); com `body`, só aplica o template."""
+    converter = _load_worker_converter()
+    timer = converter.StageTimer()
+    html, info = converter.render_article(md_content, Path(md_path), series_nav=series_nav,
+                                          timer=timer, body=body, **options)
+    info['timings'] = timer.timings
+    return html, info
+
+
+def _render_large_worker(md_path: str, output_file: str, options: Dict[str, Any], series_nav=None):
+    """Converte um documento grande no processo do pool, gravando a saída seção por seção."""
+    info = {}
+    _load_worker_converter().convert_large_md_to_html(md_path, output_file, series_nav=series_nav,
+                                                      info=info, **options)
+    return info
+
+
+def compress_output(html_path: Path, data: Optional[bytes] = None, level: int = GZIP_LEVEL) -> Path:
+    """
+    Grava a versão gzip de um arquivo de saída (artigo.html → artigo.html.gz).
+
+    O cabeçalho gzip não leva data, então a saída é a mesma a cada build.
+    Sem `data`, o arquivo é comprimido em blocos (documentos grandes não
+    passam inteiros pela memória).
+    """
+    html_path = Path(html_path)
+    gz_path = html_path.with_name(html_path.name + '.gz')
+    if data is not None:
+        gz_path.write_bytes(gzip.compress(data, compresslevel=level, mtime=0))
+        return gz_path
+    with html_path.open('rb') as source, gz_path.open('wb') as target:
+        with gzip.GzipFile(filename='', mode='wb', fileobj=target, compresslevel=level, mtime=0) as gz:
+            shutil.copyfileobj(source, gz)
+    return gz_path
+
+
+def page_files(output_file: Path, info: Dict[str, Any]) -> List[Path]:
+    """Páginas 2..N de um artigo paginado (ver pagination.py), ao lado da primeira."""
+    return [Path(output_file).parent / name for name in info.get('extra_pages') or {}]
+
+
+def copy_referenced_images(md_file: Path, images: Iterable[str], output_dir: Path,
+                           page_dir: Optional[Path] = None) -> List[Path]:
+    """
+    Copia para a saída as imagens locais referenciadas pelo artigo.
+
+    Caminhos relativos (ex.: images/foto.png) são resolvidos a partir da pasta
+    do artigo e mantêm o mesmo caminho a partir da pasta da página gerada
+    (`page_dir`, padrão: `output_dir`), sem sair de `output_dir`. URLs,
+    caminhos absolutos e imagens inexistentes são ignorados. Só copia quando
+    a cópia na saída está ausente ou desatualizada.
+    """
+    output_dir = Path(output_dir).resolve()
+    page_dir = Path(page_dir).resolve() if page_dir is not None else output_dir
+    copied = []
+    for src in images:
+        if not src or '://' in src or src.startswith(('/', 'data:', '#')):
+            continue
+        source = Path(md_file).parent / src
+        destination = (page_dir / src).resolve()
+        if not source.is_file() or output_dir not in destination.parents:
+            continue
+
+        source_stat = source.stat()
+        if destination.exists():
+            dest_stat = destination.stat()
+            if dest_stat.st_size == source_stat.st_size and dest_stat.st_mtime_ns >= source_stat.st_mtime_ns:
+                continue
+
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, destination)
+        copied.append(destination)
+    return copied
+
+
+def render_options(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Autor, URL base e paginação do trabalho (mesmas opções do convert_single_article)."""
+    options = {}
+    config = job.get('config')
+    if config:
+        options = {'author': config['author'], 'url': config.get('base_url', '')}
+    if job.get('paginate'):
+        options['paginate'] = job['paginate']
+    return options
+
+
+def render_cache_key(cache, job: Dict[str, Any], md_content: str) -> str:
+    """Chave do cache de build de um trabalho: nome, conteúdo, opções e navegação da série."""
+    return cache.key(job['name'], md_content, render_options(job), job.get('series_nav'))
+
+
+def body_cache_key(cache, job: Dict[str, Any], md_content: str) -> str:
+    """Chave do corpo em cache: nome, conteúdo e URL base (o template não entra)."""
+    return cache.body_key(job['name'], md_content, render_options(job).get('url', ''))
+
+
+class BuildPipeline:
+    """
+    Executa os trabalhos de conversão em etapas concorrentes ligadas por filas.
+
+    Args:
+        workers (int): processos de renderização
+        queue_size (int): capacidade de cada fila entre etapas (contrapressão)
+        io_threads (int): trabalhadores de cada etapa de E/S
+        compress (bool): grava também artigo.html.gz
+        output_dir (Path): pasta de saída (destino das imagens copiadas)
+        stop_on_error (bool): para de alimentar o pipeline após a primeira falha
+        cache (BuildCache): cache de renderizações (opcional)
+    """
+
+    def __init__(self, workers: int = None, queue_size: int = DEFAULT_QUEUE_SIZE,
+                 io_threads: int = DEFAULT_IO_THREADS, compress: bool = False,
+                 output_dir: Path = Path("output"), stop_on_error: bool = True, cache=None):
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.queue_size = max(1, queue_size)
+        self.io_threads = max(1, io_threads)
+        self.compress = compress
+        self.output_dir = Path(output_dir)
+        self.stop_on_error = stop_on_error
+        self.cache = cache
+        self._stopped = False
+        self._pool = None
+
+    # ------------------------------------------------------------------
+    # Etapas (cada uma recebe e devolve o item do trabalho)
+    # ------------------------------------------------------------------
+
+    async def _read(self, item):
+        started = time.perf_counter()
+        if await asyncio.to_thread(is_large_document, item['job']['md_file']):
+            # Documento grande: lido com mmap e gravado seção por seção na renderização
+            item['large'] = True
+            return item
+        item['md_content'], item['includes'] = await asyncio.to_thread(read_article, item['job']['md_file'])
+        item['timings']['read'] = round((time.perf_counter() - started) * 1000, 3)
+        return item
+
+    async def _render(self, item):
+        job = item['job']
+        options = render_options(job)
+        loop = asyncio.get_running_loop()
+        if item.get('large'):
+            # Sem cache nem paginação: guardar a página inteira anularia o ganho de memória
+            options.pop('paginate', None)
+            info = await loop.run_in_executor(
+                self._pool, _render_large_worker, str(job['md_file']), str(job['output_file']),
+                options, job.get('series_nav')
+            )
+            item['timings'].update(info.pop('timings'))
+            item['includes'] = info.pop('includes')
+            item['html'] = None
+            item['info'] = info
+            return item
+
+        md_content = item.pop('md_content')
+        
+        cache_key = body_key = body = None
+        if self.cache is not None:
+            started = time.perf_counter()
+            cache_key = render_cache_key(self.cache, job, md_content)
+            cached = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached is not None:
+                item['html'], item['info'] = cached
+                item['info']['cached'] = True
+                item['timings']['cache'] = round((time.perf_counter() - started) * 1000, 3)
+                return item
+            # Página ausente: o corpo pode estar em cache (ex.: só o template mudou)
+            body_key = body_cache_key(self.cache, job, md_content)
+            body = await asyncio.to_thread(self.cache.get_body, body_key)
+            item['timings']['cache'] = round((time.perf_counter() - started) * 1000, 3)
+        
+        html, info = await loop.run_in_executor(
+            self._pool, _render_worker, md_content, str(job['md_file']), options, job.get('series_nav'), body
+        )
+        item['timings'].update(info.pop('timings'))
+        body_rendered = info.pop('body')
+        item['html'] = html
+        item['info'] = info
+        if cache_key is not None:
+            if body is None:
+                await asyncio.to_thread(self.cache.put_body, body_key, body_rendered)
+            else:
+                info['body_cached'] = True
+            await asyncio.to_thread(self.cache.put, cache_key, html, info)
+        return item
+
+    async def _post_process(self, item):
+        started = time.perf_counter()
+        copied = await asyncio.to_thread(copy_referenced_images, item['job']['md_file'], referenced_images(item['info']),
+                                         self.output_dir, Path(item['job']['output_file']).parent)
+        item['info']['copied_images'] = [str(path) for path in copied]
+        item['timings']['images'] = round((time.perf_counter() - started) * 1000, 3)
+        return item
+
+    async def _write(self, item):
+        if item['html'] is None:
+            # Documento grande: já gravado pela renderização
+            item['data'] = item.pop('html')
+            return item
+        started = time.perf_counter()
+        output_file = Path(item['job']['output_file'])
+        item['data'] = item.pop('html').encode('utf-8')
+        await asyncio.to_thread(output_file.parent.mkdir, parents=True, exist_ok=True)
+        await asyncio.to_thread(output_file.write_bytes, item['data'])
+        if 'extra_pages' in item['info']:
+            await asyncio.to_thread(write_extra_pages, output_file, item['info']['extra_pages'])
+        item['timings']['write'] = round((time.perf_counter() - started) * 1000, 3)
+        return item
+
+    async def _compress(self, item):
+        data = item.pop('data')
+        if self.compress:
+            started = time.perf_counter()
+            await asyncio.to_thread(compress_output, item['job']['output_file'], data)
+            for page in page_files(item['job']['output_file'], item['info']):
+                await asyncio.to_thread(compress_output, page)
+            item['timings']['compress'] = round((time.perf_counter() - started) * 1000, 3)
+        return item
+
+    # ------------------------------------------------------------------
+    # Orquestração
+    # ------------------------------------------------------------------
+
+    async def _stage(self, name: str, handler, inbox: asyncio.Queue, outbox: asyncio.Queue, concurrency: int):
+        """Roda `concurrency` trabalhadores de uma etapa; itens com erro apenas passam adiante."""
+        async def worker():
+            while True:
+                item = await inbox.get()
+                if item is _DONE:
+                    await inbox.put(_DONE)  # avisa os demais trabalhadores da etapa
+                    return
+                if item['error'] is None:
+                    try:
+                        item = await handler(item)
+                    except Exception as e:
+                        item['error'] = f"Erro na etapa {name} de {item['job']['name']}: {e}"
+                await outbox.put(item)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        await outbox.put(_DONE)
+
+    async def _discover(self, jobs: Iterable[Dict[str, Any]], outbox: asyncio.Queue):
+        """
+        Alimenta o pipeline; a fila limitada segura a descoberta quando as etapas atrasam.
+
+        `jobs` pode ser um gerador (ex.: descoberta em streaming): cada
+        trabalho só é pedido quando há espaço na fila, e um pipeline
+        interrompido não consome o trabalho seguinte, que continua disponível
+        para a próxima rodada. O gerador roda no laço de eventos (mesma
+        thread do catálogo SQLite).
+        """
+        iterator = iter(jobs)
+        while not self._stopped:
+            job = next(iterator, _DONE)
+            if job is _DONE:
+                break
+            await outbox.put({'job': job, 'error': None, 'timings': {}, 'started': time.perf_counter()})
+        await outbox.put(_DONE)
+
+    async def _collect(self, inbox: asyncio.Queue, on_result: Optional[Callable], results: List):
+        """Entrega cada resultado assim que o artigo sai da última etapa."""
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                return
+            job = item['job']
+            info = item.get('info') or {}
+            success = item['error'] is None
+            if success:
+                output_file = Path(job['output_file'])
+                info.update({
+                    'includes': item['includes'],
+                    'bytes_in': Path(job['md_file']).stat().st_size,
+                    'bytes_out': output_file.stat().st_size,
+                    'timings': item['timings']
+                })
+            elif self.stop_on_error:
+                self._stopped = True
+
+            result = {
+                'job': job,
+                'success': success,
+                'output_path': str(Path(job['output_file']).resolve()) if success else "",
+                'error': item['error'] or "",
+                'info': info,
+                'elapsed_ms': round((time.perf_counter() - item['started']) * 1000, 3)
+            }
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+
+    async def run_async(self, jobs: Iterable[Dict[str, Any]], on_result: Optional[Callable] = None) -> List[Dict[str, Any]]:
+        """Executa o pipeline até esgotar os trabalhos (ou até a primeira falha)."""
+        self._stopped = False
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in range(6)]
+        stages = [
+            ('leitura', self._read, self.io_threads),
+            ('renderização', self._render, self.workers),
+            ('pós-processamento', self._post_process, self.io_threads),
+            ('gravação', self._write, self.io_threads),
+            ('compressão', self._compress, self.io_threads if self.compress else 1)
+        ]
+        results = []
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker) as pool:
+            self._pool = pool
+            tasks = [self._discover(jobs, queues[0])]
+            for index, (name, handler, concurrency) in enumerate(stages):
+                tasks.append(self._stage(name, handler, queues[index], queues[index + 1], concurrency))
+            tasks.append(self._collect(queues[-1], on_result, results))
+            await asyncio.gather(*tasks)
+            self._pool = None
+
+        return results
+
+    def run(self, jobs: Iterable[Dict[str, Any]], on_result: Optional[Callable] = None) -> List[Dict[str, Any]]:
+        """Versão síncrona de run_async (para o start.py)."""
+        started = time.perf_counter()
+        results = asyncio.run(self.run_async(jobs, on_result))
+        logging.info(f"PIPELINE: {len(results)} artigo(s) em {time.perf_counter() - started:.2f}s "
+                     f"({self.workers} processo(s), filas de {self.queue_size})")
+        return results
@@ -19,19 +19,23 @@ import argparse
 # Adicionar o diretório raiz ao path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Importar o módulo de conversão
-try:
-    # Importar usando importlib para lidar com hífens no nome
-    import importlib.util
-    spec = importlib.util.spec_from_file_location("format_html_seo", Path(__file__).parent.parent / "format-html-seo.py")
-    format_html_seo = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(format_html_seo)
-    MarkdownToHtmlSEO = format_html_seo.MarkdownToHtmlSEO
-except Exception as e:
-    print("❌ Erro: Não foi possível importar o módulo de conversão")
-    print(f"   Erro: {e}")
-    print("   Certifique-se de que o arquivo 'format-html-seo.py' existe no diretório raiz")
-    sys.exit(1)
+sys.path.insert(0, str(Path(__file__).parent))
+
+from conversion_daemon import convert_via_daemon
+
+def load_converter():
+    """Importa o módulo de conversão (só quando o daemon não está em execução)."""
+    try:
+        # Importar usando importlib para lidar com hífens no nome
+        spec = importlib.util.spec_from_file_location("format_html_seo", Path(__file__).parent / "format-html-seo.py")
+        format_html_seo = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(format_html_seo)
+        return format_html_seo
+    except Exception as e:
+        print("❌ Erro: Não foi possível importar o módulo de conversão")
+        print(f"   Erro: {e}")
+        print("   Certifique-se de que o arquivo 'scripts/format-html-seo.py' existe")
+        sys.exit(1)
 
 def setup_paths():
     """Configura os caminhos base do projeto."""
@@ -89,14 +93,15 @@ def build_article(md_file, output_file=None, author="Christian V. Mulato", base_
     print()
     
     try:
-        # Criar o conversor
-        converter = MarkdownToHtmlSEO(author=author, base_url=base_url)
+        # Converter o arquivo (no daemon, se estiver em execução)
+        result = convert_via_daemon(str(md_path), str(output_file), author, base_url)
+        if result is None:
+            result = load_converter().convert_md_to_html(str(md_path), str(output_file), author, base_url)
         
-        # Converter o arquivo
-        result = converter.convert_md_to_html(
-            md_file=str(md_path),
-            html_file=str(output_file)
-        )
+        success, _, error_msg = result
+        if not success:
+            print(f"❌ Erro na conversão: {error_msg}")
+            return False
         
         # Estatísticas
         md_size = md_path.stat().st_size
@@ -0,0 +1,594 @@
+#!/usr/bin/env python3
+"""
+catalog.py
+
+Catálogo persistente (SQLite) dos artigos do SEO Article Builder.
+Guarda os metadados resolvidos de cada artigo, hashes da fonte, contagem de
+palavras, tags, links de saída, imagens referenciadas, o índice de âncoras
+(títulos, ver toc_index.py) e as dependências do build (ver
+dependency_graph.py).
+
+O catálogo é atualizado de forma incremental pelo build (start.py): apenas
+artigos alterados são reconvertidos e regravados. Páginas de listagem,
+sitemap e relatórios consultam o catálogo em vez de reler o Markdown.
+
+Uso:
+    python scripts/catalog.py list
+    python scripts/catalog.py tags
+    python scripts/catalog.py show parte1-fundamentos.md
+    python scripts/catalog.py anchors parte1-fundamentos.md
+    python scripts/catalog.py stats
+"""
+
+import os
+import sys
+import json
+import sqlite3
+import hashlib
+import argparse
+from pathlib import Path
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import unquote, urlsplit
+
+DEFAULT_CATALOG_PATH = Path('.build') / 'catalog.sqlite3'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    path TEXT PRIMARY KEY,
+    stem TEXT NOT NULL,
+    title TEXT,
+    description TEXT,
+    keywords TEXT,
+    author TEXT,
+    category TEXT,
+    reading_time TEXT,
+    canonical_url TEXT,
+    social_image TEXT,
+    source_hash TEXT,
+    source_size INTEGER,
+    source_mtime_ns INTEGER,
+    build_key TEXT,
+    output_path TEXT,
+    output_size INTEGER,
+    word_count INTEGER,
+    built_at TEXT,
+    prose_words INTEGER,
+    code_lines INTEGER,
+    image_count INTEGER,
+    reading_minutes INTEGER,
+    extra_pages TEXT
+);
+CREATE TABLE IF NOT EXISTS tags (
+    path TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (path, tag)
+);
+CREATE TABLE IF NOT EXISTS links (
+    path TEXT NOT NULL,
+    href TEXT NOT NULL,
+    internal INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS images (
+    path TEXT NOT NULL,
+    src TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS anchors (
+    path TEXT NOT NULL,
+    anchor TEXT NOT NULL,
+    title TEXT,
+    level INTEGER NOT NULL,
+    page TEXT NOT NULL,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dependencies (
+    path TEXT NOT NULL,
+    node TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    PRIMARY KEY (path, node)
+);
+CREATE TABLE IF NOT EXISTS listing_pages (
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    pages INTEGER NOT NULL,
+    slug TEXT,
+    PRIMARY KEY (kind, name)
+);
+CREATE INDEX IF NOT EXISTS idx_tags_tag ON tags(tag);
+CREATE INDEX IF NOT EXISTS idx_links_path ON links(path);
+CREATE INDEX IF NOT EXISTS idx_images_path ON images(path);
+CREATE INDEX IF NOT EXISTS idx_anchors_path ON anchors(path);
+CREATE INDEX IF NOT EXISTS idx_articles_category ON articles(category);
+"""
+
+# Colunas criadas depois da primeira versão do catálogo: bancos antigos as
+# recebem vazias (preenchidas na próxima conversão de cada artigo)
+ADDED_COLUMNS = {
+    'articles': [('prose_words', 'INTEGER'), ('code_lines', 'INTEGER'),
+                 ('image_count', 'INTEGER'), ('reading_minutes', 'INTEGER'), ('extra_pages', 'TEXT')],
+    'listing_pages': [('slug', 'TEXT')]
+}
+
+
+def file_digest(path: Path) -> str:
+    """Calcula o SHA-256 do conteúdo de um arquivo."""
+    digest = hashlib.sha256()
+    with Path(path).open('rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_fingerprint(*parts: Any) -> str:
+    """Combina valores (versão do conversor, configuração etc.) em um único hash."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def is_internal_link(href: str, base_url: str = '') -> bool:
+    """Indica se o link aponta para o próprio site (relativo, âncora ou base_url)."""
+    if href.startswith(('mailto:', 'tel:', 'javascript:')):
+        return False
+    if href.startswith(('http://', 'https://', '//')):
+        # Mesmo critério de link_checker.classify e link_graph.resolve_link: a base seguida de /
+        return bool(base_url) and href.startswith(base_url.rstrip('/') + '/')
+    return True
+
+
+class ArticleCatalog:
+    """Acesso ao catálogo SQLite de artigos."""
+
+    def __init__(self, db_path: Path = DEFAULT_CATALOG_PATH):
+        self.db_path = Path(db_path)
+        if str(db_path) != ':memory:':
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        self._add_missing_columns()
+
+    def _add_missing_columns(self):
+        """Migra catálogos gravados antes de ADDED_COLUMNS."""
+        for table, columns in ADDED_COLUMNS.items():
+            existing = {row['name'] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+            for name, kind in columns:
+                if name not in existing:
+                    self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {kind}")
+
+    def close(self):
+        """Grava as alterações pendentes e fecha a conexão."""
+        self.conn.commit()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Atualização incremental
+    # ------------------------------------------------------------------
+
+    def is_up_to_date(self, path: str, md_file: Path, build_key: str, output_file: Path,
+                      dependencies: Optional[Dict[str, str]] = None) -> bool:
+        """Indica se o artigo não precisa ser reconvertido (ver rebuild_reasons)."""
+        return not self.rebuild_reasons(path, md_file, build_key, output_file, dependencies)
+
+    def rebuild_reasons(self, path: str, md_file: Path, build_key: str, output_file: Path,
+                        dependencies: Optional[Dict[str, str]] = None) -> List[str]:
+        """
+        Motivos para reconverter o artigo (lista vazia se estiver atualizado).
+
+        Compara primeiro tamanho e mtime da fonte; somente quando diferem o
+        hash do conteúdo é recalculado (um `touch` não força reconversão).
+        Com `dependencies`, compara também cada nó do grafo de dependências
+        com o registrado no último build.
+        """
+        row = self.get(path)
+        if row is None:
+            return ["nunca convertido"]
+
+        reasons = []
+        if not Path(output_file).exists():
+            reasons.append("saída ausente")
+
+        stat = Path(md_file).stat()
+        if row['source_size'] != stat.st_size or row['source_mtime_ns'] != stat.st_mtime_ns:
+            if row['source_hash'] != file_digest(md_file):
+                reasons.append("fonte alterada")
+            else:
+                self.conn.execute(
+                    "UPDATE articles SET source_size = ?, source_mtime_ns = ? WHERE path = ?",
+                    (stat.st_size, stat.st_mtime_ns, path)
+                )
+
+        recorded = self.dependencies_for(path)
+        if dependencies is not None and recorded:
+            from dependency_graph import changed_nodes
+            reasons.extend(changed_nodes(recorded, dependencies))
+        explained = [reason for reason in reasons if reason != "saída ausente"]
+        if row['build_key'] != build_key and not explained:
+            # Catálogo gravado antes do grafo de dependências
+            reasons.append("configuração ou conversor alterados")
+        return reasons
+
+    def upsert(self, path: str, md_file: Path, output_file: Path, build_key: str,
+               config: Dict[str, Any], info: Dict[str, Any], dependencies: Optional[Dict[str, str]] = None):
+        """
+        Grava (ou substitui) o registro de um artigo recém-convertido.
+
+        Args:
+            path (str): Caminho relativo do artigo em articles_md/
+            md_file (Path): Arquivo Markdown de origem
+            output_file (Path): Arquivo HTML gerado
+            build_key (str): Impressão digital das entradas do build
+            config (dict): Configuração resolvida (seo_config)
+            info (dict): Dados coletados pelo conversor durante a renderização
+            dependencies (dict): Nós do grafo de dependências e suas impressões digitais
+        """
+        md_file = Path(md_file)
+        output_file = Path(output_file)
+        stat = md_file.stat()
+        meta = info.get('meta', {})
+        stats = info.get('stats') or {}
+        base_url = config.get('base_url', '')
+
+        self.conn.execute(
+            """INSERT OR REPLACE INTO articles (
+                path, stem, title, description, keywords, author, category,
+                reading_time, canonical_url, social_image, source_hash,
+                source_size, source_mtime_ns, build_key, output_path,
+                output_size, word_count, built_at, prose_words, code_lines,
+                image_count, reading_minutes, extra_pages
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                path, md_file.stem,
+                meta.get('title', config.get('title')),
+                meta.get('description', config.get('description')),
+                meta.get('keywords', config.get('keywords')),
+                config.get('author'),
+                config.get('category', config.get('default_category')),
+                meta.get('reading_time') or config.get('reading_time', config.get('default_reading_time')),
+                config.get('canonical_url'),
+                meta.get('social_image'),
+                file_digest(md_file), stat.st_size, stat.st_mtime_ns, build_key,
+                output_file.as_posix(),
+                output_file.stat().st_size if output_file.exists() else None,
+                info.get('word_count'),
+                datetime.now().isoformat(),
+                stats.get('prose_words'),
+                stats.get('code_lines'),
+                stats.get('image_count'),
+                stats.get('reading_minutes'),
+                json.dumps(sorted(info.get('extra_pages') or {}))
+            )
+        )
+
+        for table in ('tags', 'links', 'images', 'anchors', 'dependencies'):
+            self.conn.execute(f"DELETE FROM {table} WHERE path = ?", (path,))
+
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO tags (path, tag) VALUES (?, ?)",
+            [(path, str(tag)) for tag in config.get('tags', [])]
+        )
+        self.conn.executemany(
+            "INSERT INTO dependencies (path, node, fingerprint) VALUES (?, ?, ?)",
+            [(path, node, fingerprint) for node, fingerprint in (dependencies or {}).items()]
+        )
+        self.conn.executemany(
+            "INSERT INTO links (path, href, internal) VALUES (?, ?, ?)",
+            [(path, href, int(is_internal_link(href, base_url))) for href in info.get('links', [])]
+        )
+        # A imagem de compartilhamento (og:image) também é uma referência do artigo
+        images = list(info.get('images', []))
+        if meta.get('social_image') and meta['social_image'] not in images:
+            images.append(meta['social_image'])
+        self.conn.executemany(
+            "INSERT INTO images (path, src) VALUES (?, ?)",
+            [(path, src) for src in images]
+        )
+        self._insert_anchors(path, [dict(entry, page=entry.get('page') or output_file.name)
+                                    for entry in info.get('toc', [])])
+        self.conn.commit()
+
+    def _insert_anchors(self, path: str, entries: List[Dict[str, Any]]):
+        """Grava o índice de âncoras de um artigo (entradas com id, title, level e page)."""
+        self.conn.executemany(
+            "INSERT INTO anchors (path, anchor, title, level, page, position) VALUES (?, ?, ?, ?, ?, ?)",
+            [(path, entry['id'], entry.get('title'), entry['level'], entry['page'], position)
+             for position, entry in enumerate(entries)]
+        )
+
+    def prune(self, existing_paths: Iterable[str]) -> List[str]:
+        """Remove do catálogo os artigos cuja fonte não existe mais."""
+        existing = set(existing_paths)
+        removed = [row['path'] for row in self.conn.execute("SELECT path FROM articles")
+                   if row['path'] not in existing]
+        for path in removed:
+            for table in ('articles', 'tags', 'links', 'images', 'anchors', 'dependencies'):
+                self.conn.execute(f"DELETE FROM {table} WHERE path = ?", (path,))
+        self.conn.commit()
+        return removed
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def get(self, path: str) -> Optional[sqlite3.Row]:
+        """Retorna o registro de um artigo ou None."""
+        return self.conn.execute("SELECT * FROM articles WHERE path = ?", (path,)).fetchone()
+
+    def articles(self) -> List[sqlite3.Row]:
+        """Retorna todos os artigos ordenados pelo caminho."""
+        return self.conn.execute("SELECT * FROM articles ORDER BY path").fetchall()
+
+    def articles_by_tag(self, tag: str) -> List[sqlite3.Row]:
+        """Retorna os artigos marcados com a tag informada."""
+        return self.conn.execute(
+            """SELECT a.* FROM articles a JOIN tags t ON t.path = a.path
+               WHERE t.tag = ? ORDER BY a.path""", (tag,)
+        ).fetchall()
+
+    def articles_by_category(self, category: str) -> List[sqlite3.Row]:
+        """Retorna os artigos de uma categoria."""
+        return self.conn.execute(
+            "SELECT * FROM articles WHERE category = ? ORDER BY path", (category,)
+        ).fetchall()
+
+    def tag_counts(self) -> Dict[str, int]:
+        """Retorna o número de artigos por tag."""
+        rows = self.conn.execute("SELECT tag, COUNT(*) AS n FROM tags GROUP BY tag ORDER BY tag")
+        return {row['tag']: row['n'] for row in rows}
+
+    def category_counts(self) -> Dict[str, int]:
+        """Retorna o número de artigos por categoria."""
+        rows = self.conn.execute(
+            """SELECT category, COUNT(*) AS n FROM articles
+               WHERE category IS NOT NULL GROUP BY category ORDER BY category"""
+        )
+        return {row['category']: row['n'] for row in rows}
+
+    def tags_for(self, path: str) -> List[str]:
+        """Retorna as tags de um artigo."""
+        rows = self.conn.execute("SELECT tag FROM tags WHERE path = ? ORDER BY tag", (path,))
+        return [row['tag'] for row in rows]
+
+    def article_tags(self) -> Dict[str, List[str]]:
+        """Retorna as tags de todos os artigos ({path: [tags]}) em uma única consulta."""
+        tags: Dict[str, List[str]] = {}
+        for row in self.conn.execute("SELECT path, tag FROM tags ORDER BY path, tag"):
+            tags.setdefault(row['path'], []).append(row['tag'])
+        return tags
+
+    def links_for(self, path: str, internal_only: bool = False) -> List[str]:
+        """Retorna os links de saída de um artigo."""
+        query = "SELECT href FROM links WHERE path = ?"
+        if internal_only:
+            query += " AND internal = 1"
+        return [row['href'] for row in self.conn.execute(query, (path,))]
+
+    def internal_links(self) -> List[sqlite3.Row]:
+        """Retorna os links internos de todos os artigos (path, href), para análises do corpus."""
+        return self.conn.execute("SELECT path, href FROM links WHERE internal = 1 ORDER BY path").fetchall()
+
+    def image_references(self) -> List[sqlite3.Row]:
+        """
+        Retorna as imagens referenciadas por todos os artigos (path,
+        output_path, src e social, se é a imagem de compartilhamento).
+        """
+        return self.conn.execute(
+            """SELECT DISTINCT i.path, a.output_path, i.src, i.src = a.social_image AS social
+               FROM images i JOIN articles a ON a.path = i.path ORDER BY i.path, i.src"""
+        ).fetchall()
+
+    def extra_pages_for(self, path: str) -> List[str]:
+        """Retorna as páginas 2..N de um artigo paginado (nomes dos arquivos, ao lado da primeira)."""
+        row = self.conn.execute("SELECT extra_pages FROM articles WHERE path = ?", (path,)).fetchone()
+        return json.loads(row['extra_pages']) if row and row['extra_pages'] else []
+
+    def images_for(self, path: str) -> List[str]:
+        """Retorna as imagens referenciadas por um artigo."""
+        return [row['src'] for row in self.conn.execute("SELECT src FROM images WHERE path = ?", (path,))]
+
+    def anchors_for(self, path: str) -> List[Dict[str, Any]]:
+        """Retorna os títulos do artigo ({id, title, level, page}), na ordem do documento."""
+        rows = self.conn.execute(
+            "SELECT anchor, title, level, page FROM anchors WHERE path = ? ORDER BY position", (path,)
+        )
+        return [{'id': row['anchor'], 'title': row['title'], 'level': row['level'], 'page': row['page']}
+                for row in rows]
+
+    def anchor_index(self) -> Dict[str, Set[str]]:
+        """Âncoras de cada página gerada ({caminho do HTML: {ids}}), para validar links entre artigos."""
+        index: Dict[str, Set[str]] = {}
+        rows = self.conn.execute(
+            """SELECT a.output_path, n.page, n.anchor FROM anchors n
+               JOIN articles a ON a.path = n.path WHERE a.output_path IS NOT NULL"""
+        )
+        for row in rows:
+            page = os.path.normpath(Path(row['output_path']).parent / row['page'])
+            index.setdefault(page, set()).add(row['anchor'])
+        return index
+
+    def broken_deep_links(self) -> List[Tuple[str, str]]:
+        """
+        Links internos para uma seção de outro artigo (outro.html#secao) cuja
+        âncora não existe no índice. Links só com #secao (mesma página) e
+        links para páginas fora do catálogo não são verificados.
+
+        Returns:
+            list: (artigo, href) de cada link quebrado
+        """
+        index = self.anchor_index()
+        broken = []
+        rows = self.conn.execute(
+            """SELECT l.path, l.href, a.output_path FROM links l
+               JOIN articles a ON a.path = l.path
+               WHERE l.internal = 1 AND l.href LIKE '%#%' AND a.output_path IS NOT NULL
+               ORDER BY l.path"""
+        )
+        for row in rows:
+            target = urlsplit(row['href'])
+            if target.scheme or target.netloc or not target.path or not target.fragment:
+                continue
+            page = os.path.normpath(Path(row['output_path']).parent / unquote(target.path))
+            if page in index and unquote(target.fragment) not in index[page]:
+                broken.append((row['path'], row['href']))
+        return broken
+
+    def dependencies_for(self, path: str) -> Dict[str, str]:
+        """Retorna os nós de que o artigo depende, com a impressão digital do último build."""
+        rows = self.conn.execute("SELECT node, fingerprint FROM dependencies WHERE path = ? ORDER BY node", (path,))
+        return {row['node']: row['fingerprint'] for row in rows}
+
+    def dependents_of(self, node: str) -> List[str]:
+        """Retorna os artigos que dependem de um nó (ex.: imagem:images/foto.png)."""
+        rows = self.conn.execute("SELECT path FROM dependencies WHERE node = ? ORDER BY path", (node,))
+        return [row['path'] for row in rows]
+
+    # ------------------------------------------------------------------
+    # Exportação e importação (manifestos de shards)
+    # ------------------------------------------------------------------
+
+    def export_records(self) -> List[Dict[str, Any]]:
+        """Exporta os artigos, com tags, links e imagens, como dicionários serializáveis em JSON."""
+        records = []
+        for row in self.articles():
+            record = dict(row)
+            record['extra_pages'] = self.extra_pages_for(row['path'])
+            record['tags'] = self.tags_for(row['path'])
+            record['links'] = [
+                {'href': link['href'], 'internal': bool(link['internal'])}
+                for link in self.conn.execute("SELECT href, internal FROM links WHERE path = ?", (row['path'],))
+            ]
+            record['images'] = self.images_for(row['path'])
+            record['anchors'] = self.anchors_for(row['path'])
+            record['dependencies'] = self.dependencies_for(row['path'])
+            records.append(record)
+        return records
+
+    def import_record(self, record: Dict[str, Any]):
+        """Grava um artigo exportado por export_records (ex.: vindo do manifesto de um shard)."""
+        record = dict(record)
+        tags = record.pop('tags', [])
+        links = record.pop('links', [])
+        images = record.pop('images', [])
+        anchors = record.pop('anchors', [])
+        dependencies = record.pop('dependencies', {})
+        record['extra_pages'] = json.dumps(record.get('extra_pages') or [])
+        path = record['path']
+
+        known = {row['name'] for row in self.conn.execute("PRAGMA table_info(articles)")}
+        columns = [column for column in record if column in known]
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO articles ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            [record[column] for column in columns]
+        )
+
+        for table in ('tags', 'links', 'images', 'anchors', 'dependencies'):
+            self.conn.execute(f"DELETE FROM {table} WHERE path = ?", (path,))
+        self.conn.executemany("INSERT OR IGNORE INTO tags (path, tag) VALUES (?, ?)",
+                              [(path, tag) for tag in tags])
+        self.conn.executemany("INSERT INTO links (path, href, internal) VALUES (?, ?, ?)",
+                              [(path, link['href'], int(link['internal'])) for link in links])
+        self.conn.executemany("INSERT INTO images (path, src) VALUES (?, ?)",
+                              [(path, src) for src in images])
+        self._insert_anchors(path, anchors)
+        self.conn.executemany("INSERT INTO dependencies (path, node, fingerprint) VALUES (?, ?, ?)",
+                              [(path, node, fingerprint) for node, fingerprint in dependencies.items()])
+        self.conn.commit()
+
+    # ------------------------------------------------------------------
+    # Páginas de listagem (tags e categorias)
+    # ------------------------------------------------------------------
+
+    def listing_state(self, kind: str) -> Dict[str, sqlite3.Row]:
+        """Retorna o estado gravado das páginas de listagem de um tipo ('tag' ou 'category')."""
+        rows = self.conn.execute("SELECT * FROM listing_pages WHERE kind = ?", (kind,))
+        return {row['name']: row for row in rows}
+
+    def save_listing_state(self, kind: str, name: str, fingerprint: str, pages: int,
+                           slug: Optional[str] = None):
+        """Registra a impressão digital, o número de páginas e o slug (nome do arquivo) de uma listagem."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO listing_pages (kind, name, fingerprint, pages, slug) VALUES (?, ?, ?, ?, ?)",
+            (kind, name, fingerprint, pages, slug)
+        )
+        self.conn.commit()
+
+    def delete_listing_state(self, kind: str, name: str):
+        """Remove o registro de uma listagem que deixou de existir."""
+        self.conn.execute("DELETE FROM listing_pages WHERE kind = ? AND name = ?", (kind, name))
+        self.conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Resumo numérico do catálogo."""
+        row = self.conn.execute(
+            """SELECT COUNT(*) AS articles, COALESCE(SUM(word_count), 0) AS words,
+                      COALESCE(SUM(code_lines), 0) AS code_lines,
+                      COALESCE(SUM(reading_minutes), 0) AS reading_minutes,
+                      COALESCE(SUM(source_size), 0) AS source_bytes,
+                      COALESCE(SUM(output_size), 0) AS output_bytes
+               FROM articles"""
+        ).fetchone()
+        stats = dict(row)
+        stats['tags'] = self.conn.execute("SELECT COUNT(DISTINCT tag) FROM tags").fetchone()[0]
+        stats['links'] = self.conn.execute("SELECT COUNT(*) FROM links").fetchone()[0]
+        stats['images'] = self.conn.execute("SELECT COUNT(*) FROM images").fetchone()[0]
+        stats['anchors'] = self.conn.execute("SELECT COUNT(*) FROM anchors").fetchone()[0]
+        return stats
+
+
+def main():
+    """Função principal."""
+    parser = argparse.ArgumentParser(description='Consulta o catálogo de artigos')
+    parser.add_argument('command', choices=['list', 'tags', 'show', 'anchors', 'stats'], help='Consulta a executar')
+    parser.add_argument('path', nargs='?', help='Artigo (para os comandos show e anchors)')
+    parser.add_argument('--db', default=str(DEFAULT_CATALOG_PATH), help='Arquivo do catálogo')
+
+    args = parser.parse_args()
+
+    if not Path(args.db).exists():
+        print(f"[ERROR] Catálogo não encontrado: {args.db}")
+        print("💡 Execute primeiro: python start.py")
+        sys.exit(1)
+
+    with ArticleCatalog(args.db) as catalog:
+        if args.command == 'list':
+            for row in catalog.articles():
+                print(f"  • {row['path']}: {row['title']} ({row['word_count']} palavras, {row['reading_time']})")
+        elif args.command == 'tags':
+            for tag, count in catalog.tag_counts().items():
+                print(f"  • {tag}: {count}")
+        elif args.command == 'show':
+            row = catalog.get(args.path or '')
+            if row is None:
+                print(f"[ERROR] Artigo não catalogado: {args.path}")
+                sys.exit(1)
+            record = dict(row)
+            record['tags'] = catalog.tags_for(row['path'])
+            record['links'] = catalog.links_for(row['path'])
+            record['images'] = catalog.images_for(row['path'])
+            record['anchors'] = catalog.anchors_for(row['path'])
+            record['dependencies'] = catalog.dependencies_for(row['path'])
+            print(json.dumps(record, indent=2, ensure_ascii=False))
+        elif args.command == 'anchors':
+            rows = [catalog.get(args.path)] if args.path else catalog.articles()
+            if args.path and rows[0] is None:
+                print(f"[ERROR] Artigo não catalogado: {args.path}")
+                sys.exit(1)
+            for row in rows:
+                print(f"  • {row['path']}")
+                for entry in catalog.anchors_for(row['path']):
+                    indent = "  " * entry['level']
+                    print(f"    {indent}{entry['title']}  → {entry['page']}#{entry['id']}")
+            for path, href in catalog.broken_deep_links():
+                print(f"[ERROR] Âncora inexistente em {path}: {href}")
+        else:
+            print(json.dumps(catalog.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
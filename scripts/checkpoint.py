@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+checkpoint.py
+
+Diário de checkpoint do build (.build/checkpoint.jsonl).
+
+Cada execução do start.py registra, uma linha JSON por evento, os artigos
+planejados e o resultado de cada um assim que ele termina. Se a execução for
+interrompida (falha, Ctrl+C, queda do processo), `start.py --resume` lê o
+diário e reprocessa apenas os artigos que ficaram pendentes ou falharam.
+
+    {"event": "start", "names": ["a.md", "b.md"], "at": "..."}
+    {"event": "done", "name": "a.md", "attempts": 1, "at": "..."}
+    {"event": "failed", "name": "b.md", "attempts": 3, "error": "...", "at": "..."}
+    {"event": "finish", "at": "..."}
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+DEFAULT_CHECKPOINT_PATH = Path(".build") / "checkpoint.jsonl"
+
+
+class CheckpointJournal:
+    """Diário append-only dos artigos concluídos e com falha na execução atual."""
+
+    def __init__(self, path: Path = DEFAULT_CHECKPOINT_PATH):
+        self.path = Path(path)
+        self._stream = None
+
+    def _write(self, event: Dict[str, Any]):
+        event['at'] = datetime.now().isoformat(timespec='seconds')
+        self._stream.write(json.dumps(event, ensure_ascii=False) + '\n')
+        self._stream.flush()
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Lê o estado da última execução registrada.
+
+        Returns:
+            dict: {'planned': nomes, 'done': set, 'failed': nome → evento,
+            'finished': bool}
+        """
+        state = {'planned': [], 'done': set(), 'failed': {}, 'finished': False}
+        if not self.path.exists():
+            return state
+
+        with self.path.open(encoding='utf-8') as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue  # última linha truncada por uma queda
+                kind = event.get('event')
+                if kind == 'start':
+                    state['planned'] = event.get('names', [])
+                elif kind == 'planned':
+                    state['planned'].append(event['name'])
+                elif kind == 'done':
+                    state['done'].add(event['name'])
+                    state['failed'].pop(event['name'], None)
+                elif kind == 'failed':
+                    state['failed'][event['name']] = event
+                elif kind == 'finish':
+                    state['finished'] = True
+        return state
+
+    def remaining(self) -> Optional[List[str]]:
+        """Artigos pendentes ou com falha da última execução (None se ela terminou)."""
+        state = self.load()
+        if not state['planned'] or state['finished']:
+            return None
+        return [name for name in state['planned'] if name not in state['done']]
+
+    def start(self, names: List[str], resume: bool = False):
+        """Abre o diário: uma execução nova o recria; uma retomada continua o anterior."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._stream = self.path.open('a' if resume else 'w', encoding='utf-8')
+        self._write({'event': 'resume' if resume else 'start', 'names': list(names)})
+
+    def plan(self, name: str):
+        """Acrescenta um artigo ao plano (modo streaming: o plano cresce durante o build)."""
+        self._write({'event': 'planned', 'name': name})
+
+    def record(self, name: str, success: bool, attempts: int, error: str = ""):
+        """Registra o resultado final de um artigo."""
+        if success:
+            self._write({'event': 'done', 'name': name, 'attempts': attempts})
+        else:
+            self._write({'event': 'failed', 'name': name, 'attempts': attempts, 'error': error})
+
+    def finish(self):
+        """Marca a execução como concluída (nada a retomar)."""
+        self._write({'event': 'finish'})
+        self.close()
+
+    def close(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+conversion_daemon.py
+
+Daemon de conversão persistente com API local em socket Unix.
+
+Cada execução de start.py, build_single.py, scripts/conversion/*.py ou
+format-html-seo.py paga a inicialização do interpretador e a importação de
+markdown, bs4 e Pygments. O daemon mantém o conversor carregado (e as
+instâncias de Markdown aquecidas) e recebe trabalhos em JSON, uma linha por
+trabalho, devolvendo os eventos de cada trabalho em linhas JSON (NDJSON) à
+medida que terminam.
+
+As ferramentas de linha de comando usam o daemon automaticamente quando ele
+está em execução (defina SEO_NO_DAEMON=1 para desativar).
+
+Protocolo (uma linha JSON por mensagem):
+    → {"op": "convert", "id": 1, "md_file": "/abs/artigo.md", "output_file": "/abs/artigo.html",
+       "author": "...", "url": "...", "lang": "pt-BR"}
+    ← {"event": "accepted", "id": 1}
+    ← {"event": "result", "id": 1, "success": true, "output_path": "...", "error": "", "info": {...}}
+    → {"op": "ping"}        ← {"event": "pong", "pid": 1234, "jobs": 10}
+    → {"op": "shutdown"}    ← {"event": "bye"}
+
+Uso:
+    python scripts/conversion_daemon.py serve     # em primeiro plano
+    python scripts/conversion_daemon.py status
+    python scripts/conversion_daemon.py stop
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import signal
+import logging
+import argparse
+import threading
+import socketserver
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+CONVERTER_PATH = SCRIPTS_DIR / "format-html-seo.py"
+DEFAULT_SOCKET_PATH = SCRIPTS_DIR.parent / ".build" / "converter.sock"
+
+CONNECT_TIMEOUT = 0.5
+
+
+def get_socket_path() -> Path:
+    """Caminho do socket (SEO_CONVERTER_SOCKET sobrepõe o padrão)."""
+    return Path(os.environ.get('SEO_CONVERTER_SOCKET', DEFAULT_SOCKET_PATH))
+
+
+def daemon_disabled() -> bool:
+    """Indica se o uso do daemon foi desativado (SEO_NO_DAEMON=1) ou não é suportado."""
+    return os.environ.get('SEO_NO_DAEMON') == '1' or not hasattr(socket, 'AF_UNIX')
+
+
+# ----------------------------------------------------------------------
+# Cliente
+# ----------------------------------------------------------------------
+
+def _connect(socket_path: Optional[Path] = None) -> Optional[socket.socket]:
+    """Conecta ao daemon; retorna None se ele não estiver em execução."""
+    if daemon_disabled():
+        return None
+    path = Path(socket_path or get_socket_path())
+    if not path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+    sock.settimeout(None)
+    return sock
+
+
+def send_requests(requests: Iterable[Dict[str, Any]], socket_path: Optional[Path] = None) -> Optional[Iterator[Dict[str, Any]]]:
+    """
+    Envia mensagens ao daemon e devolve um iterador com as respostas.
+
+    Returns:
+        iterator ou None: None quando o daemon não está disponível
+    """
+    sock = _connect(socket_path)
+    if sock is None:
+        return None
+
+    def write_requests():
+        # Escreve em paralelo à leitura: lotes grandes não travam nos buffers do socket
+        try:
+            with sock.makefile('wb') as stream:
+                for request in requests:
+                    stream.write(json.dumps(request, default=str).encode('utf-8') + b'\n')
+            sock.shutdown(socket.SHUT_WR)
+        except OSError:
+            pass  # o leitor encerrou a conexão antes (ex.: ping já respondido)
+
+    def responses():
+        writer = threading.Thread(target=write_requests, daemon=True)
+        writer.start()
+        with sock, sock.makefile('rb') as stream:
+            for line in stream:
+                if line.strip():
+                    yield json.loads(line)
+        writer.join()
+
+    return responses()
+
+
+def ping(socket_path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Retorna o estado do daemon ou None se ele não estiver em execução."""
+    responses = send_requests([{'op': 'ping'}], socket_path)
+    if responses is None:
+        return None
+    try:
+        return next(responses, None)
+    except OSError:
+        return None
+
+
+def convert_via_daemon(md_file, output_file=None, author="Christian V. Mulato", url="", lang="pt-BR",
+                       info=None, series_nav=None, socket_path=None, paginate=None):
+    """
+    Envia uma conversão ao daemon, com a mesma assinatura de convert_md_to_html.
+
+    Returns:
+        tuple ou None: (success, output_path, error_message), ou None quando o
+        daemon não está disponível (o chamador converte localmente)
+    """
+    job = {
+        'op': 'convert',
+        'id': 1,
+        'md_file': str(Path(md_file).resolve()),
+        'output_file': str(Path(output_file).resolve()) if output_file else None,
+        'author': author,
+        'url': url,
+        'lang': lang,
+        'series_nav': series_nav,
+        'paginate': paginate
+    }
+    responses = send_requests([job], socket_path)
+    if responses is None:
+        return None
+
+    try:
+        for event in responses:
+            if event.get('event') == 'result':
+                if info is not None:
+                    info.update(event.get('info') or {})
+                return event['success'], event['output_path'], event['error']
+    except (OSError, ValueError):
+        pass
+    # Conexão perdida antes do resultado: o chamador converte localmente
+    return None
+
+
+# ----------------------------------------------------------------------
+# Servidor
+# ----------------------------------------------------------------------
+
+class WarmConverter:
+    """
+    Mantém o módulo format-html-seo.py carregado, recarregando-o se ele ou
+    algum módulo de scripts/ que ele importa mudar (o mesmo conjunto de
+    render_version, usado na versão do cache de build).
+    """
+
+    def __init__(self, path: Path = CONVERTER_PATH):
+        self.path = path
+        self.module = None
+        self.mtimes = None
+        self.lock = threading.Lock()
+
+    def get(self):
+        """Retorna o módulo de conversão carregado."""
+        with self.lock:
+            if str(SCRIPTS_DIR) not in sys.path:
+                sys.path.insert(0, str(SCRIPTS_DIR))
+            from render_version import render_mtimes
+            mtimes = render_mtimes([self.path])
+            if self.module is None or mtimes != self.mtimes:
+                import importlib.util
+                # Os módulos auxiliares saem de sys.modules para serem relidos pelo conversor
+                for path in mtimes:
+                    if path != self.path.resolve():
+                        sys.modules.pop(path.stem, None)
+                spec = importlib.util.spec_from_file_location("format_html_seo", self.path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                module.warm_up()
+                self.module, self.mtimes = module, mtimes
+                logging.info(f"Conversor carregado: {self.path} ({len(mtimes)} módulo(s))")
+            return self.module
+
+
+class ConversionHandler(socketserver.StreamRequestHandler):
+    """Atende uma conexão: lê trabalhos em NDJSON e responde em NDJSON."""
+
+    def send(self, message: Dict[str, Any]):
+        self.wfile.write(json.dumps(message, default=str, ensure_ascii=False).encode('utf-8') + b'\n')
+        self.wfile.flush()
+
+    def handle(self):
+        for raw in self.rfile:
+            if not raw.strip():
+                continue
+            try:
+                request = json.loads(raw)
+            except ValueError as e:
+                self.send({'event': 'error', 'error': f"JSON inválido: {e}"})
+                continue
+
+            op = request.get('op', 'convert')
+            if op == 'ping':
+                self.send({'event': 'pong', 'pid': os.getpid(), 'jobs': self.server.jobs_done})
+            elif op == 'shutdown':
+                self.send({'event': 'bye'})
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+            elif op == 'convert':
+                self.send({'event': 'accepted', 'id': request.get('id')})
+                self.send(self.server.run_job(request))
+            else:
+                self.send({'event': 'error', 'id': request.get('id'), 'error': f"Operação desconhecida: {op}"})
+
+
+class ConversionServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Servidor de conversão com o conversor mantido em memória."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path):
+        self.converter = WarmConverter()
+        self.jobs_done = 0
+        self.jobs_lock = threading.Lock()  # run_job roda em várias threads (ThreadingMixIn)
+        self.converter.get()
+        super().__init__(str(socket_path), ConversionHandler)
+
+    def run_job(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Executa um trabalho de conversão e monta o evento de resultado."""
+        started = time.perf_counter()
+        info = {}
+        try:
+            converter = self.converter.get()
+            success, output_path, error = converter.convert_md_to_html(
+                request['md_file'], request.get('output_file'),
+                request.get('author', 'Christian V. Mulato'), request.get('url', ''),
+                request.get('lang', 'pt-BR'), info=info, series_nav=request.get('series_nav'),
+                paginate=request.get('paginate')
+            )
+        except Exception as e:
+            success, output_path, error = False, "", f"Erro no daemon: {e}"
+        with self.jobs_lock:
+            self.jobs_done += 1
+        return {
+            'event': 'result',
+            'id': request.get('id'),
+            'success': success,
+            'output_path': output_path,
+            'error': error,
+            'info': info,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 2)
+        }
+
+
+def serve(socket_path: Path):
+    """Inicia o daemon em primeiro plano até receber `stop` ou SIGTERM/Ctrl+C."""
+    if not hasattr(socket, 'AF_UNIX'):
+        print("[ERROR] Sockets Unix não são suportados nesta plataforma")
+        return 1
+
+    if ping(socket_path):
+        print(f"[INFO] Daemon já está em execução em {socket_path}")
+        return 0
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        socket_path.unlink()  # socket órfão de uma execução anterior
+
+    server = ConversionServer(socket_path)
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown, daemon=True).start())
+    print(f"[INFO] Daemon de conversão ouvindo em {socket_path} (pid {os.getpid()})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path.exists():
+            socket_path.unlink()
+        print(f"[INFO] Daemon encerrado ({server.jobs_done} conversões atendidas)")
+    return 0
+
+
+def main():
+    """Função principal."""
+    parser = argparse.ArgumentParser(description='Daemon de conversão MD→HTML em socket Unix')
+    parser.add_argument('command', choices=['serve', 'status', 'stop'], help='Ação a executar')
+    parser.add_argument('--socket', default=None, help='Caminho do socket (padrão: .build/converter.sock)')
+
+    args = parser.parse_args()
+    socket_path = Path(args.socket) if args.socket else get_socket_path()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if args.command == 'serve':
+        sys.exit(serve(socket_path))
+
+    status = ping(socket_path)
+    if status is None:
+        print(f"[INFO] Daemon não está em execução ({socket_path})")
+        sys.exit(0 if args.command == 'stop' else 1)
+
+    if args.command == 'status':
+        print(f"[INFO] Daemon em execução: pid {status['pid']}, {status['jobs']} conversões atendidas")
+    else:
+        responses = send_requests([{'op': 'shutdown'}], socket_path)
+        if responses is not None:
+            list(responses)
+        print("[INFO] Daemon encerrado")
+
+
+if __name__ == "__main__":
+    main()
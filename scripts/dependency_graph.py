@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+dependency_graph.py
+
+Grafo de dependências de cada artigo do build.
+
+A saída de um artigo não depende só do seu .md: depende também das imagens
+que ele referencia (articles_md/images/), da sua entrada em ARTICLE_CONFIGS,
+do DEFAULT_CONFIG, da navegação da série, do código de renderização e dos
+arquivos de java_code/ que ele inclui. Cada uma dessas entradas é um nó com
+uma impressão digital:
+
+    conversor                      hash do conversor (template) e dos módulos
+                                   de scripts/ que ele importa (render_digest)
+    config:DEFAULT_CONFIG          configuração global
+    config:ARTICLE_CONFIGS[nome]   entrada do artigo (ou ausente)
+    serie                          navegação anterior/próximo
+    paginacao                      orçamento das páginas (só com --paginate-*)
+    imagem:images/foto.png         hash da imagem (ou ausente)
+    include:parte1-fundamentos/pom.xml   hash do arquivo incluído (ou ausente)
+
+O catálogo guarda as arestas artigo → nó com a impressão digital usada no
+último build. Quando um nó muda, só os artigos que dependem dele são
+reconvertidos, e os nós alterados explicam o motivo (start.py --explain).
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from catalog import build_fingerprint, file_digest
+from includes import INCLUDE_ROOT, read_included, resolve_include
+
+IMAGE_PREFIX = "imagem:"
+INCLUDE_PREFIX = "include:"
+MISSING = "ausente"
+
+
+def local_image_path(md_file: Path, src: str) -> Optional[Path]:
+    """Caminho da imagem local referenciada pelo artigo (None para URLs e caminhos absolutos)."""
+    if not src or '://' in src or src.startswith(('/', 'data:', '#')):
+        return None
+    return Path(md_file).parent / src
+
+
+def image_dependencies(md_file: Path, images: Iterable[str],
+                       digests: Optional[Dict[Path, str]] = None) -> Dict[str, str]:
+    """
+    Nós das imagens locais de um artigo.
+
+    Args:
+        digests (dict): memória dos hashes já calculados nesta execução
+            (imagens compartilhadas por vários artigos são lidas uma vez)
+    """
+    digests = {} if digests is None else digests
+    nodes = {}
+    for src in images:
+        path = local_image_path(md_file, src)
+        if path is None:
+            continue
+        if path not in digests:
+            digests[path] = file_digest(path) if path.is_file() else MISSING
+        nodes[IMAGE_PREFIX + src] = digests[path]
+    return nodes
+
+
+def include_dependencies(includes: Dict[str, Optional[str]], root: Path = INCLUDE_ROOT) -> Dict[str, str]:
+    """
+    Nós dos arquivos incluídos (<!-- include: ... -->) por um artigo.
+
+    Args:
+        includes (dict): caminho incluído → hash já calculado na expansão, ou
+            None para calcular agora (ex.: includes do último build)
+    """
+    nodes = {}
+    for relative, digest in includes.items():
+        if digest is None:
+            try:
+                digest = read_included(resolve_include(relative, root))[0]
+            except (OSError, ValueError):
+                digest = MISSING
+        nodes[INCLUDE_PREFIX + relative] = digest
+    return nodes
+
+
+def recorded_includes(dependencies: Dict[str, str]) -> Dict[str, None]:
+    """Caminhos incluídos segundo os nós registrados no último build."""
+    return {node[len(INCLUDE_PREFIX):]: None for node in dependencies if node.startswith(INCLUDE_PREFIX)}
+
+
+def article_dependencies(name: str, converter_digest: str, default_config: Dict[str, Any],
+                         article_config: Optional[Dict[str, Any]], series_nav=None,
+                         paginate: Optional[Dict[str, int]] = None) -> Dict[str, str]:
+    """
+    Nós de configuração, série, paginação e conversor de um artigo (imagens e
+    includes vêm à parte); `converter_digest` é o render_digest() de
+    render_version.py, não o hash de um único arquivo.
+    """
+    nodes = {
+        'conversor': converter_digest,
+        'config:DEFAULT_CONFIG': build_fingerprint(default_config),
+        f'config:ARTICLE_CONFIGS[{name}]': build_fingerprint(article_config) if article_config is not None else MISSING,
+        'serie': build_fingerprint(series_nav)
+    }
+    if paginate:
+        nodes['paginacao'] = build_fingerprint(paginate)
+    return nodes
+
+
+def with_nodes(dependencies: Dict[str, str], prefix: str, new_nodes: Dict[str, str]) -> Dict[str, str]:
+    """Troca os nós de `dependencies` com o prefixo informado (ex.: IMAGE_PREFIX) pelos novos."""
+    nodes = {node: value for node, value in dependencies.items() if not node.startswith(prefix)}
+    nodes.update(new_nodes)
+    return nodes
+
+
+def changed_nodes(recorded: Dict[str, str], current: Dict[str, str]) -> list:
+    """Descreve os nós alterados, novos ou removidos entre o último build e o atual."""
+    reasons = []
+    for node in sorted(set(recorded) | set(current)):
+        if node not in recorded:
+            reasons.append(f"nova dependência {node}")
+        elif node not in current:
+            reasons.append(f"dependência removida {node}")
+        elif recorded[node] != current[node]:
+            if current[node] == MISSING:
+                reasons.append(f"{node} não existe mais")
+            else:
+                reasons.append(f"{node} alterado")
+    return reasons
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+discovery.py
+
+Descoberta dos artigos em articles_md/, incluindo subpastas.
+
+A busca percorre a árvore com os.scandir em um gerador: cada artigo é
+entregue assim que a sua pasta é lida, sem montar nem ordenar a lista
+completa. Com start.py --stream, o build começa a converter o primeiro
+artigo enquanto o resto da árvore ainda está sendo percorrido.
+
+Pastas e arquivos podem ser ignorados por padrões glob, no
+articles_md/.buildignore (um por linha, # para comentários):
+
+    rascunhos/
+    *.draft.md
+    kafka/antigos/*
+
+Um padrão sem barra vale para o nome em qualquer nível; com barra, vale para
+o caminho relativo a articles_md/. A saída espelha a árvore:
+articles_md/kafka/parte1.md → output/kafka/parte1.html.
+"""
+
+import os
+import logging
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+ARTICLES_DIR = Path("articles_md")
+IGNORE_FILE = ".buildignore"
+
+# Pastas ocultas, imagens e documentação nunca são artigos
+DEFAULT_IGNORE_PATTERNS = ('.*', 'images', 'README.md', 'CHANGELOG.md', 'TODO.md')
+
+
+def load_ignore_patterns(root: Path = ARTICLES_DIR) -> List[str]:
+    """Padrões padrão mais os do <root>/.buildignore (se existir)."""
+    patterns = list(DEFAULT_IGNORE_PATTERNS)
+    ignore_file = Path(root) / IGNORE_FILE
+    if ignore_file.is_file():
+        for line in ignore_file.read_text(encoding='utf-8').splitlines():
+            line = line.strip()
+            if line and not line.startswith('#'):
+                patterns.append(line.rstrip('/'))
+    return patterns
+
+
+def is_ignored(relative: str, patterns: List[str]) -> bool:
+    """Indica se o caminho relativo (com /) casa com algum padrão de exclusão."""
+    name = relative.rsplit('/', 1)[-1]
+    for pattern in patterns:
+        if fnmatch(relative, pattern) if '/' in pattern else fnmatch(name, pattern):
+            return True
+    return False
+
+
+def iter_markdown_files(root: Path = ARTICLES_DIR, patterns: Optional[List[str]] = None,
+                        suffix: str = '.md') -> Iterator[Path]:
+    """
+    Percorre `root` e subpastas entregando os arquivos Markdown um a um.
+
+    A ordem é a do sistema de arquivos (sem ordenar): arquivos de uma pasta
+    saem antes das suas subpastas, e só a pasta corrente fica em memória.
+    """
+    root = Path(root)
+    if patterns is None:
+        patterns = load_ignore_patterns(root)
+
+    pending = [(root, '')]
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError as e:
+            logging.warning(f"PASTA IGNORADA: {directory} ({e})")
+            continue
+
+        subdirs = []
+        with entries:
+            for entry in entries:
+                relative = prefix + entry.name
+                if is_ignored(relative, patterns):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((Path(entry.path), relative + '/'))
+                elif entry.name.endswith(suffix) and entry.is_file():
+                    yield Path(entry.path)
+        pending.extend(reversed(subdirs))
+
+
+def article_name(md_file: Path, root: Path = ARTICLES_DIR) -> str:
+    """
+    Nome do artigo no build: caminho relativo a articles_md/ com /
+    (ex.: kafka/parte1.md). Artigos da raiz mantêm só o nome do arquivo.
+    """
+    return Path(md_file).relative_to(root).as_posix()
+
+
+def output_path_for(md_file: Path, output_dir: Path, root: Path = ARTICLES_DIR) -> Path:
+    """Caminho de saída espelhando a árvore (articles_md/a/b.md → output/a/b.html)."""
+    return Path(output_dir) / Path(md_file).relative_to(root).with_suffix('.html')
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+find_duplicates.py
+
+Análise do corpus para detectar artigos quase duplicados.
+Calcula assinaturas MinHash de cada artigo e usa LSH (banding) para
+encontrar pares candidatos em tempo aproximadamente linear, sem comparar
+todos os artigos entre si.
+
+Para cada par encontrado, informa a similaridade estimada e sugere qual
+artigo deve manter a URL canônica emitida por generate_meta_tags.
+
+Uso:
+    python scripts/find_duplicates.py
+    python scripts/find_duplicates.py --threshold 0.7 --json
+    python scripts/find_duplicates.py --articles articles_md --bands 32 --rows 4
+"""
+
+import sys
+import re
+import json
+import zlib
+import random
+import hashlib
+import argparse
+from pathlib import Path
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from config.seo_config import DEFAULT_CONFIG, ARTICLE_CONFIGS
+except ImportError:
+    DEFAULT_CONFIG = {'base_url': ''}
+    ARTICLE_CONFIGS = {}
+
+# Primo de Mersenne usado no hashing universal (a * x + b) mod P
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+DEFAULT_SHINGLE_SIZE = 5
+DEFAULT_BANDS = 32
+DEFAULT_ROWS = 4
+DEFAULT_THRESHOLD = 0.8
+
+
+def normalize_text(md_content: str) -> List[str]:
+    """Remove a sintaxe Markdown básica e retorna a lista de palavras normalizadas."""
+    text = re.sub(r'!\[(.*?)\]\(.*?\)', r'\1', md_content)
+    text = re.sub(r'\[(.*?)\]\(.*?\)', r'\1', text)
+    text = re.sub(r'[#*_`>|~-]+', ' ', text)
+    return re.findall(r'\w+', text.lower())
+
+
+def shingle_hashes(words: List[str], size: int = DEFAULT_SHINGLE_SIZE) -> set:
+    """Gera o conjunto de hashes (32 bits) dos shingles de `size` palavras."""
+    if not words:
+        return set()
+    if len(words) < size:
+        return {zlib.crc32(' '.join(words).encode('utf-8'))}
+    return {
+        zlib.crc32(' '.join(words[i:i + size]).encode('utf-8'))
+        for i in range(len(words) - size + 1)
+    }
+
+
+def make_permutations(num_perm: int, seed: int = 42) -> List[Tuple[int, int]]:
+    """Gera os coeficientes (a, b) das funções de hash usadas no MinHash."""
+    rng = random.Random(seed)
+    return [
+        (rng.randint(1, MERSENNE_PRIME - 1), rng.randint(0, MERSENNE_PRIME - 1))
+        for _ in range(num_perm)
+    ]
+
+
+def minhash_signature(hashes: set, permutations: List[Tuple[int, int]]) -> Tuple[int, ...]:
+    """Calcula a assinatura MinHash de um conjunto de shingles."""
+    if not hashes:
+        return tuple(MAX_HASH for _ in permutations)
+    values = list(hashes)
+    return tuple(
+        min((a * x + b) % MERSENNE_PRIME for x in values) & MAX_HASH
+        for a, b in permutations
+    )
+
+
+def estimate_similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+    """Estima a similaridade de Jaccard pela fração de posições iguais."""
+    matches = sum(1 for x, y in zip(sig_a, sig_b) if x == y)
+    return matches / len(sig_a)
+
+
+def lsh_candidate_pairs(signatures: Dict[str, Tuple[int, ...]], bands: int, rows: int) -> set:
+    """Agrupa as assinaturas em buckets por banda e retorna os pares candidatos."""
+    candidates = set()
+    for band in range(bands):
+        buckets = defaultdict(list)
+        start = band * rows
+        for name, signature in signatures.items():
+            buckets[signature[start:start + rows]].append(name)
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            members.sort()
+            for i in range(len(members)):
+                for j in range(i + 1, len(members)):
+                    candidates.add((members[i], members[j]))
+    return candidates
+
+
+def canonical_url_for(md_path: Path, base_url: str) -> str:
+    """Reproduz a URL canônica emitida por generate_meta_tags."""
+    url = base_url.rstrip('/') if base_url else ''
+    return f"{url}/{md_path.stem}.html" if url else ""
+
+
+def choose_canonical(a: dict, b: dict) -> Tuple[dict, dict]:
+    """
+    Escolhe qual artigo do par deve manter a URL canônica.
+
+    Preferência: artigo com configuração em ARTICLE_CONFIGS, depois o de
+    maior conteúdo, depois o de nome mais curto (cópias costumam receber
+    sufixos como `_clean` ou `-v2`) e, por fim, a ordem alfabética.
+    """
+    def rank(doc):
+        return (
+            doc['path'].name not in ARTICLE_CONFIGS,
+            -doc['words'],
+            len(doc['path'].stem),
+            doc['path'].name
+        )
+    return (a, b) if rank(a) <= rank(b) else (b, a)
+
+
+def analyze_corpus(md_files: List[Path], threshold: float = DEFAULT_THRESHOLD,
+                   bands: int = DEFAULT_BANDS, rows: int = DEFAULT_ROWS,
+                   shingle_size: int = DEFAULT_SHINGLE_SIZE,
+                   base_url: str = None) -> List[dict]:
+    """
+    Analisa os artigos e retorna os pares quase duplicados.
+
+    Returns:
+        list: um dicionário por par com similaridade, método de detecção,
+              artigo canônico sugerido e URL canônica correspondente.
+    """
+    if base_url is None:
+        base_url = DEFAULT_CONFIG.get('base_url', '')
+
+    permutations = make_permutations(bands * rows)
+    docs = {}
+    signatures = {}
+    exact_groups = defaultdict(list)
+
+    for md_file in md_files:
+        content = md_file.read_text(encoding='utf-8')
+        words = normalize_text(content)
+        key = str(md_file)
+        docs[key] = {'path': md_file, 'words': len(words)}
+        exact_groups[hashlib.sha1(content.encode('utf-8')).hexdigest()].append(key)
+        signatures[key] = minhash_signature(shingle_hashes(words, shingle_size), permutations)
+
+    pairs = {}
+
+    # Duplicatas exatas (inclui arquivos vazios) dispensam estimativa
+    for members in exact_groups.values():
+        members.sort()
+        for i in range(len(members)):
+            for j in range(i + 1, len(members)):
+                pairs[(members[i], members[j])] = (1.0, 'exact')
+
+    for pair in lsh_candidate_pairs(signatures, bands, rows):
+        if pair in pairs:
+            continue
+        similarity = estimate_similarity(signatures[pair[0]], signatures[pair[1]])
+        if similarity >= threshold:
+            pairs[pair] = (similarity, 'minhash')
+
+    results = []
+    for (name_a, name_b), (similarity, method) in sorted(pairs.items(), key=lambda item: -item[1][0]):
+        canonical, duplicate = choose_canonical(docs[name_a], docs[name_b])
+        results.append({
+            'canonical': str(canonical['path']),
+            'duplicate': str(duplicate['path']),
+            'similarity': round(similarity, 3),
+            'method': method,
+            'canonical_url': canonical_url_for(canonical['path'], base_url)
+        })
+    return results
+
+
+def main():
+    """Função principal."""
+    parser = argparse.ArgumentParser(description='Detecta artigos quase duplicados com MinHash/LSH')
+    parser.add_argument('--articles', default='articles_md', help='Pasta com os artigos Markdown')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='Similaridade mínima reportada (0-1)')
+    parser.add_argument('--bands', type=int, default=DEFAULT_BANDS, help='Número de bandas do LSH')
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROWS, help='Linhas por banda do LSH')
+    parser.add_argument('--shingle-size', type=int, default=DEFAULT_SHINGLE_SIZE, help='Palavras por shingle')
+    parser.add_argument('--url', default=None, help='URL base do site (padrão: DEFAULT_CONFIG)')
+    parser.add_argument('--json', action='store_true', help='Saída em JSON')
+
+    args = parser.parse_args()
+
+    articles_dir = Path(args.articles)
+    if not articles_dir.exists():
+        print(f"[ERROR] Pasta não encontrada: {articles_dir}")
+        sys.exit(1)
+
+    md_files = sorted(articles_dir.glob('*.md'))
+    results = analyze_corpus(md_files, args.threshold, args.bands, args.rows,
+                             args.shingle_size, args.url)
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return
+
+    print("[INFO] Detecção de Artigos Quase Duplicados")
+    print("=" * 50)
+    print(f"Artigos analisados: {len(md_files)}")
+    print(f"Pares encontrados (similaridade >= {args.threshold}): {len(results)}")
+
+    for result in results:
+        print()
+        print(f"  • {result['duplicate']} ≈ {result['canonical']}")
+        print(f"    Similaridade: {result['similarity']:.0%} ({result['method']})")
+        print(f"    Canônico sugerido: {result['canonical']}")
+        if result['canonical_url']:
+            print(f"    URL canônica: {result['canonical_url']}")
+
+
+if __name__ == "__main__":
+    main()
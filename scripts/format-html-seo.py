@@ -16,52 +16,137 @@ Uso:
 Requisitos:
     pip install markdown beautifulsoup4
 
+Modo em lote (uma linha JSON por trabalho na entrada e na saída):
+    python format-html-seo.py --batch jobs.ndjson --workers 4
+    cat jobs.ndjson | python format-html-seo.py --batch - > results.ndjson
+
 Exemplo:
     python format-html-seo.py parte1-fundamentos.md
     python format-html-seo.py parte2-java.md parte2-java.html --author="Christian V. Mulato" --url="https://meusite.com"
 """
 
-import markdown
 from pathlib import Path
+import os
+import gc
 import sys
 import re
+import html
 import json
+import time
+import threading
 from datetime import datetime
-from bs4 import BeautifulSoup
 import argparse
 import logging
 
+from discovery import ARTICLES_DIR
+from front_matter import split_front_matter
+from image_graph import social_image_src, social_image_url
+from includes import read_article
+from large_document import MappedDocument, is_large_document
+from pagination import paginate as paginate_body, table_of_contents, write_extra_pages
+from reading_stats import MarkdownStats, format_reading_time, iso_duration, summarize
+from render_version import files_digest, render_modules
+from toc_index import assign_pages, flatten_toc, sidebar_html
+
+# markdown e bs4 são importados sob demanda: quando o daemon de conversão
+# está em execução, o modo linha de comando não paga essas importações.
+MARKDOWN_EXTENSIONS = ['extra', 'toc', 'codehilite', 'tables', 'fenced_code']
+
+# Funções do template: mudanças nelas não invalidam os corpos em cache (ver body_version)
+TEMPLATE_FUNCTIONS = ('generate_structured_data', 'generate_meta_tags', 'generate_series_navigation',
+                      'generate_pagination', 'navigation_links', 'wrap_article', 'wrap_pages')
+
+# Instâncias de Markdown reutilizadas entre conversões (uma por thread)
+_renderers = threading.local()
+
+
+def get_markdown_renderer():
+    """Retorna a instância de Markdown da thread atual, pronta para uma nova conversão."""
+    renderer = getattr(_renderers, 'markdown', None)
+    if renderer is None:
+        import markdown
+        renderer = _renderers.markdown = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+    return renderer.reset()
+
+
+class StageTimer:
+    """Mede a duração (em ms) de cada etapa da conversão."""
+    
+    def __init__(self):
+        self.timings = {}
+        self._last = time.perf_counter()
+    
+    def lap(self, stage):
+        """Registra o tempo decorrido desde a etapa anterior."""
+        now = time.perf_counter()
+        self.timings[stage] = round((now - self._last) * 1000, 3)
+        self._last = now
+
+
+# Pasta dos artigos: a URL de cada página espelha a árvore (ver page_path)
+ARTICLES_ROOT = Path(__file__).resolve().parent.parent / ARTICLES_DIR
+
+
+def page_path(md_path, file_name=None):
+    """
+    Caminho da página no site, espelhando articles_md/ (kafka/um.md →
+    kafka/um.html); `file_name` troca o arquivo (páginas 2..N). Fora de
+    articles_md/, só o nome do arquivo.
+    """
+    md_path = Path(md_path).resolve()
+    try:
+        relative = md_path.relative_to(ARTICLES_ROOT).with_suffix('.html')
+    except ValueError:
+        relative = Path(md_path.with_suffix('.html').name)
+    if file_name:
+        relative = relative.with_name(file_name)
+    return relative.as_posix()
+
+
+def warm_up():
+    """Pré-carrega markdown, extensões, Pygments e BeautifulSoup (usado pelo daemon)."""
+    from bs4 import BeautifulSoup
+    rendered = get_markdown_renderer().convert("# Warm up\n\n```python\nprint('ok')\n```")
+    BeautifulSoup(rendered, 'html.parser')
+
 
 def extract_meta_info(md_content, md_path):
     """Extrai informações meta do conteúdo Markdown para SEO."""
-    lines = md_content.split('\n')
-    
-    # Busca pelo primeiro h1 como título
-    title = md_path.stem.replace('-', ' ').title()
-    for line in lines:
-        if line.startswith('# '):
-            title = line[2:].strip()
-            break
+    return extract_meta_from_lines(md_content.split('\n'), md_path)
+
+
+def extract_meta_from_lines(lines, md_path):
+    """
+    Extrai título, descrição e keywords percorrendo as linhas uma única vez.
     
-    # Gera descrição baseada no primeiro parágrafo
+    Aceita qualquer iterável de linhas, inclusive um gerador (modo para
+    documentos grandes, em que o texto nunca fica inteiro na memória).
+    """
+    title = None
     description = ""
+    keywords = []
     for line in lines:
-        line = line.strip()
-        if line and not line.startswith('#') and not line.startswith('*') and not line.startswith('-'):
+        # Busca pelo primeiro h1 como título
+        if title is None and line.startswith('# '):
+            title = line[2:].strip()
+        
+        # Gera descrição baseada no primeiro parágrafo
+        stripped = line.strip()
+        if not description and stripped and not stripped.startswith('#') and not stripped.startswith('*') and not stripped.startswith('-'):
             # Remove markdown básico
-            description = re.sub(r'\*\*(.*?)\*\*', r'\1', line)
+            description = re.sub(r'\*\*(.*?)\*\*', r'\1', stripped)
             description = re.sub(r'\*(.*?)\*', r'\1', description)
             description = re.sub(r'\[(.*?)\]\(.*?\)', r'\1', description)
             description = description[:160]  # Limita a 160 caracteres
-            break
-    
-    # Extrai keywords baseadas nos cabeçalhos
-    keywords = []
-    for line in lines:
+        
+        # Extrai keywords baseadas nos cabeçalhos
         if line.startswith('## ') or line.startswith('### '):
             keyword = line.replace('#', '').strip().lower()
             keywords.append(keyword)
     
+    if title is None:
+        title = md_path.stem.replace('-', ' ').title()
+    
     # Adiciona palavras-chave baseadas no nome do arquivo
     file_keywords = md_path.stem.replace('-', ' ').split()
     keywords.extend(file_keywords)
@@ -73,6 +158,17 @@ def extract_meta_info(md_content, md_path):
     }
 
 
+def apply_front_matter(meta_info, front_matter):
+    """Sobrepõe às informações extraídas os campos definidos no front matter."""
+    for key in ('title', 'description', 'keywords', 'canonical_url', 'reading_time', 'social_image'):
+        value = front_matter.get(key)
+        if isinstance(value, list):
+            value = ', '.join(str(item) for item in value)
+        if value:
+            meta_info[key] = str(value)
+    return meta_info
+
+
 def generate_structured_data(meta_info, author, url, md_path):
     """Gera dados estruturados Schema.org."""
     structured_data = {
@@ -96,15 +192,37 @@ def generate_structured_data(meta_info, author, url, md_path):
         },
         "mainEntityOfPage": {
             "@type": "WebPage",
-            "@id": f"{url}/{md_path.stem}.html" if url else ""
+            "@id": meta_info.get('canonical_url') or (f"{url}/{page_path(md_path)}" if url else "")
         }
     }
+    if meta_info.get('word_count'):
+        structured_data["wordCount"] = meta_info['word_count']
+    if iso_duration(meta_info.get('reading_time')):
+        structured_data["timeRequired"] = iso_duration(meta_info['reading_time'])
     return json.dumps(structured_data, indent=2)
 
 
 def generate_meta_tags(meta_info, author, url, md_path):
     """Gera tags meta para SEO."""
-    canonical_url = f"{url}/{md_path.stem}.html" if url else ""
+    canonical_url = meta_info.get('canonical_url') or (f"{url}/{page_path(md_path)}" if url else "")
+    
+    # Imagem de compartilhamento: só quando o artigo tem uma (ver image_graph.py)
+    image_url = social_image_url(meta_info.get('social_image'), url, os.path.dirname(page_path(md_path)))
+    og_image_tags = twitter_image_tags = ""
+    if image_url:
+        og_image_tags = f"""
+    <meta property="og:image" content="{image_url}">
+    <meta property="og:image:width" content="1200">
+    <meta property="og:image:height" content="630">"""
+        twitter_image_tags = f"""
+    <meta name="twitter:image" content="{image_url}">"""
+    
+    # Tempo de leitura (exibido por Twitter/X, Slack e outros leitores de cartões)
+    reading_tags = ""
+    if meta_info.get('reading_time'):
+        reading_tags = f"""
+    <meta name="twitter:label1" content="Tempo de leitura">
+    <meta name="twitter:data1" content="{meta_info['reading_time']}">"""
     
     meta_tags = f"""
     <!-- SEO Meta Tags -->
@@ -123,16 +241,12 @@ def generate_meta_tags(meta_info, author, url, md_path):
     <meta property="og:type" content="article">
     <meta property="og:url" content="{canonical_url}">
     <meta property="og:site_name" content="{author}">
-    <meta property="og:locale" content="pt_BR">
-    <meta property="og:image" content="{url}/img/{md_path.stem}.png" if url else "">
-    <meta property="og:image:width" content="1200">
-    <meta property="og:image:height" content="630">
+    <meta property="og:locale" content="pt_BR">{og_image_tags}
     
     <!-- Twitter Cards -->
-    <meta name="twitter:card" content="summary_large_image">
+    <meta name="twitter:card" content="{'summary_large_image' if image_url else 'summary'}">
     <meta name="twitter:title" content="{meta_info['title']}">
-    <meta name="twitter:description" content="{meta_info['description']}">
-    <meta name="twitter:image" content="{url}/img/{md_path.stem}.png" if url else "">
+    <meta name="twitter:description" content="{meta_info['description']}">{twitter_image_tags}{reading_tags}
     
     <!-- Canonical URL -->
     <link rel="canonical" href="{canonical_url}">
@@ -145,61 +259,270 @@ def generate_meta_tags(meta_info, author, url, md_path):
     return meta_tags
 
 
-def convert_md_to_html(md_file, output_file=None, author="Christian V. Mulato", url="", lang="pt-BR"):
+def generate_series_navigation(series_nav):
     """
-    Função principal para converter Markdown para HTML com SEO otimizado.
+    Gera os links de navegação da série.
+    
+    Returns:
+        tuple: (links para o <head>, bloco <nav> para o corpo)
+    """
+    if not series_nav:
+        return "", ""
+    
+    # Títulos e hrefs vêm do front matter: escapados antes de entrar no HTML
+    head_links = []
+    nav_links = []
+    if series_nav.get('prev'):
+        href = html.escape(series_nav['prev']['href'])
+        title = html.escape(series_nav['prev']['title'])
+        head_links.append(f'<link rel="prev" href="{href}">')
+        nav_links.append(f'<a class="series-prev" href="{href}" rel="prev">&larr; {title}</a>')
+    if series_nav.get('next'):
+        href = html.escape(series_nav['next']['href'])
+        title = html.escape(series_nav['next']['title'])
+        # O próximo artigo é pré-carregado para abrir instantaneamente
+        head_links.append(f'<link rel="next" href="{href}">')
+        head_links.append(f'<link rel="prefetch" href="{href}">')
+        nav_links.append(f'<a class="series-next" href="{href}" rel="next">{title} &rarr;</a>')
+    
+    series_title = html.escape(str(series_nav['title']))
+    head_html = "\n    ".join(head_links)
+    nav_html = f"""<nav class="series-nav" aria-label="Série {series_title}">
+            <p class="series-title">Série {series_title} · Parte {series_nav['position']} de {series_nav['total']}</p>
+            {" ".join(nav_links)}
+        </nav>"""
+    return head_html, nav_html
+
+
+def generate_pagination(pagination):
+    """
+    Gera o índice combinado e a navegação de um artigo dividido em páginas.
     
     Args:
-        md_file (str): Caminho para o arquivo Markdown
-        output_file (str): Caminho para o arquivo HTML de saída (opcional)
-        author (str): Nome do autor
-        url (str): URL base do site
-        lang (str): Idioma do conteúdo
+        pagination (dict): page, total, pages ([{file}]) e toc (ver
+            pagination.table_of_contents)
     
     Returns:
-        tuple: (success: bool, output_path: str, error_message: str)
+        tuple: (links para o <head>, índice, bloco <nav> entre páginas)
+    """
+    if not pagination:
+        return "", "", ""
+    
+    page = pagination['page']
+    files = [entry['file'] for entry in pagination['pages']]
+    current = files[page - 1]
+    
+    head_links = []
+    if page > 1:
+        head_links.append(f'<link rel="prev" href="{files[page - 2]}">')
+    if page < len(files):
+        head_links.append(f'<link rel="next" href="{files[page]}">')
+        head_links.append(f'<link rel="prefetch" href="{files[page]}">')
+    
+    toc_items = []
+    for entry in pagination['toc']:
+        href = f"#{entry['anchor']}" if entry['page'] == page else entry['href']
+        css = ' class="current-page"' if entry['page'] == page else ''
+        toc_items.append(f'<li{css}><a href="{href}">{entry["title"]}</a></li>')
+    toc_html = f"""<nav class="page-toc" aria-label="Índice">
+                <p class="page-toc-title">Índice · Página {page} de {len(files)}</p>
+                <ol>
+                    {"".join(toc_items)}
+                </ol>
+            </nav>"""
+    
+    page_links = []
+    for number, file in enumerate(files, 1):
+        if file == current:
+            page_links.append(f'<li><span aria-current="page">{number}</span></li>')
+        else:
+            page_links.append(f'<li><a href="{file}">{number}</a></li>')
+    prev_link = f'<a class="page-prev" href="{files[page - 2]}" rel="prev">&larr; Página anterior</a>' if page > 1 else ''
+    next_link = f'<a class="page-next" href="{files[page]}" rel="next">Próxima página &rarr;</a>' if page < len(files) else ''
+    nav_html = f"""<nav class="page-nav" aria-label="Páginas do artigo">
+            {prev_link}
+            <ol>{"".join(page_links)}</ol>
+            {next_link}
+        </nav>"""
+    return "\n    ".join(head_links), toc_html, nav_html
+
+
+def navigation_links(links, series_nav, pagination=None):
+    """
+    Links do corpo (`links`) mais os links internos que o template acrescenta:
+    anterior/próximo da série e, em artigos paginados, as outras páginas e os
+    itens do índice combinado que apontam para elas (cada um uma vez).
+    """
+    hrefs = [series_nav[key]['href'] for key in ('prev', 'next') if series_nav and series_nav.get(key)]
+    if pagination:
+        page = pagination['page']
+        hrefs += [entry['file'] for entry in pagination['pages'] if entry['number'] != page]
+        hrefs += [entry['href'] for entry in pagination['toc'] if entry['page'] != page]
+    return list(links) + [href for href in dict.fromkeys(hrefs) if href not in links]
+
+
+def postprocess_body(soup, title, url):
+    """
+    Ajusta o HTML do corpo para SEO (alt e lazy loading nas imagens,
+    rel="noopener" nos links externos) e coleta o que o build registra.
+    
+    Returns:
+        tuple: (counts, links, images); counts traz word_count (todo o
+        texto), prose_words (fora dos blocos de código) e code_lines
+    """
+    images = []
+    links = []
+    
+    # Adiciona atributos alt às imagens sem alt
+    for img in soup.find_all('img'):
+        if img.get('src'):
+            images.append(img['src'])
+        if not img.get('alt'):
+            img['alt'] = f"Imagem relacionada a {title}"
+        img['loading'] = 'lazy'  # Lazy loading para performance
+    
+    # Adiciona rel="noopener" para links externos
+    for link in soup.find_all('a', href=True):
+        links.append(link['href'])
+        if link['href'].startswith('http') and not link['href'].startswith(url):
+            link['rel'] = 'noopener noreferrer'
+            link['target'] = '_blank'
+    
+    # Linhas de código contam à parte no tempo de leitura (ver reading_stats.py)
+    code_lines = code_words = 0
+    for pre in soup.find_all('pre'):
+        code = pre.get_text()
+        code_lines += sum(1 for line in code.splitlines() if line.strip())
+        code_words += len(code.split())
+    
+    # Adiciona estrutura semântica
+    word_count = len(soup.get_text().split())
+    counts = {'word_count': word_count, 'prose_words': word_count - code_words, 'code_lines': code_lines}
+    return counts, links, images
+
+
+def render_body(md_content, md_path, url="", timer=None):
+    """
+    Renderiza o corpo do artigo: front matter, meta, Markdown e pós-processamento.
+    
+    O resultado não depende do template nem das tags meta, então pode ser
+    guardado em cache e reaproveitado quando apenas o layout muda (ver
+    body_version e wrap_article).
+    
+    Returns:
+        dict: front_matter, meta, html_body, word_count, stats (contagens e
+        tempo de leitura), toc (títulos, ver toc_index.py), links e images
+    """
+    md_path = Path(md_path)
+    timer = timer or StageTimer()
+    
+    # Separa o front matter (metadados do artigo) do corpo
+    front_matter, md_content = split_front_matter(md_content)
+    url = front_matter.get('base_url', url)
+    url = url.rstrip('/') if url else ''
+    
+    # Extrai informações meta
+    meta_info = extract_meta_info(md_content, md_path)
+    apply_front_matter(meta_info, front_matter)
+    timer.lap('meta')
+    
+    # Converte Markdown para HTML (a extensão toc monta a árvore de títulos)
+    renderer = get_markdown_renderer()
+    html_body = renderer.convert(md_content)
+    toc = flatten_toc(renderer.toc_tokens)
+    timer.lap('markdown')
+    
+    # Processa o HTML para melhorar SEO
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html_body, 'html.parser')
+    
+    counts, links, images = postprocess_body(soup, meta_info['title'], url)
+    html_body = str(soup)
+    meta_info['social_image'] = social_image_src(meta_info.get('social_image'), images)
+    
+    # Tempo de leitura calculado (um reading_time no front matter prevalece)
+    stats = summarize(counts['prose_words'], counts['code_lines'], len(images))
+    meta_info.setdefault('reading_time', format_reading_time(stats['reading_minutes']))
+    meta_info['word_count'] = counts['word_count']
+    timer.lap('postprocess')
+    
+    return {
+        'front_matter': front_matter,
+        'meta': meta_info,
+        'html_body': html_body,
+        'word_count': counts['word_count'],
+        'stats': stats,
+        'toc': toc,
+        'links': links,
+        'images': images
+    }
+
+
+def body_version():
     """
+    Versão do corpo renderizado: este arquivo sem as funções do template
+    (TEMPLATE_FUNCTIONS), os módulos de scripts/ que ele importa (ver
+    render_version.py) e as versões de markdown/bs4/Pygments.
+    
+    Mudanças no template, nas tags meta ou nos dados estruturados não alteram
+    essa versão, então os corpos em cache continuam válidos.
+    """
+    import ast
+    import hashlib
+    import markdown
+    import bs4
     try:
-        md_path = Path(md_file)
-        if not md_path.exists():
-            return False, "", f"Arquivo markdown não encontrado: {md_path}"
-        
-        html_path = Path(output_file) if output_file else md_path.with_suffix('.html')
-        url = url.rstrip('/') if url else ''
-        
-        # Lê o conteúdo do arquivo Markdown
-        with md_path.open(encoding='utf-8') as f:
-            md_content = f.read()
-        
-        # Extrai informações meta
-        meta_info = extract_meta_info(md_content, md_path)
-        
-        # Converte Markdown para HTML
-        html_body = markdown.markdown(md_content, extensions=['extra', 'toc', 'codehilite', 'tables', 'fenced_code'])
-        
-        # Processa o HTML para melhorar SEO
-        soup = BeautifulSoup(html_body, 'html.parser')
-        
-        # Adiciona atributos alt às imagens sem alt
-        for img in soup.find_all('img'):
-            if not img.get('alt'):
-                img['alt'] = f"Imagem relacionada a {meta_info['title']}"
-            img['loading'] = 'lazy'  # Lazy loading para performance
-        
-        # Adiciona rel="noopener" para links externos
-        for link in soup.find_all('a', href=True):
-            if link['href'].startswith('http') and not link['href'].startswith(url):
-                link['rel'] = 'noopener noreferrer'
-                link['target'] = '_blank'
-        
-        # Adiciona estrutura semântica
-        html_body = str(soup)
-        
-        # Gera tags meta e dados estruturados
-        meta_tags = generate_meta_tags(meta_info, author, url, md_path)
-        structured_data = generate_structured_data(meta_info, author, url, md_path)
-        
-        html_template = f"""<!DOCTYPE html>
+        import pygments
+        pygments_version = pygments.__version__
+    except ImportError:
+        pygments_version = None
+    
+    converter = Path(__file__).resolve()
+    tree = ast.parse(converter.read_text(encoding='utf-8'))
+    tree.body = [node for node in tree.body
+                 if not (isinstance(node, ast.FunctionDef) and node.name in TEMPLATE_FUNCTIONS)]
+    helpers = [path for path in render_modules([converter]) if path != converter]
+    
+    parts = [ast.dump(tree), files_digest(helpers)]
+    parts += [markdown.__version__, bs4.__version__, str(pygments_version)]
+    return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
+
+def wrap_article(body, md_path, author="Christian V. Mulato", url="", lang="pt-BR", series_nav=None, timer=None, pagination=None, toc_sidebar=None):
+    """
+    Envolve um corpo já renderizado (render_body) no template da página.
+    
+    Com `pagination` (ver wrap_pages), a página recebe o índice combinado e a
+    navegação entre as páginas do artigo. A barra lateral de conteúdo vem dos
+    títulos do corpo (body['toc']); `toc_sidebar`, se informado, a substitui
+    (usado pelo modo para documentos grandes).
+    
+    Returns:
+        tuple: (html: str, info: dict com meta, front matter, autor, URL,
+        contagem de palavras, links, imagens e o próprio corpo)
+    """
+    md_path = Path(md_path)
+    timer = timer or StageTimer()
+    
+    front_matter = body['front_matter']
+    author = front_matter.get('author', author)
+    url = front_matter.get('base_url', url)
+    url = url.rstrip('/') if url else ''
+    meta_info = body['meta']
+    html_body = body['html_body']
+    
+    # Gera tags meta e dados estruturados
+    meta_tags = generate_meta_tags(meta_info, author, url, md_path)
+    structured_data = generate_structured_data(meta_info, author, url, md_path)
+    series_links, series_html = generate_series_navigation(series_nav)
+    page_links, page_toc, page_nav = generate_pagination(pagination)
+    if page_links:
+        series_links = page_links  # rel="prev/next" passam a apontar para as páginas
+    if toc_sidebar is None:
+        current_page = pagination['pages'][pagination['page'] - 1]['file'] if pagination else None
+        toc_sidebar = sidebar_html(body.get('toc'), current_page)
+    
+    html_template = f"""<!DOCTYPE html>
 <html lang="{lang}" itemscope itemtype="https://schema.org/Article">
 <head>
     <meta charset="UTF-8">
@@ -207,6 +530,7 @@ def convert_md_to_html(md_file, output_file=None, author="Christian V. Mulato",
     <meta http-equiv="X-UA-Compatible" content="IE=edge">
     <title>{meta_info['title']}</title>
     {meta_tags}
+    {series_links}
     
     <!-- Fonts -->
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
@@ -385,6 +709,119 @@ def convert_md_to_html(md_file, output_file=None, author="Christian V. Mulato",
             color: #4a5568;
         }}
         
+        /* Navegação da Série */
+        .series-nav {{
+            display: flex;
+            flex-wrap: wrap;
+            justify-content: space-between;
+            gap: 1rem;
+            margin-top: 3rem;
+            padding-top: 1.5rem;
+            border-top: 2px solid #e2e8f0;
+        }}
+        
+        .series-title {{
+            flex-basis: 100%;
+            margin-bottom: 0;
+            color: #4a5568;
+            font-size: 0.9rem;
+        }}
+        
+        .series-next {{
+            margin-left: auto;
+        }}
+        
+        /* Artigo em Várias Páginas */
+        .page-toc {{
+            background: #f7fafc;
+            border: 1px solid #e2e8f0;
+            border-radius: 8px;
+            padding: 1rem 1.5rem;
+            margin-bottom: 2rem;
+        }}
+        
+        .page-toc-title {{
+            margin-bottom: 0.5rem;
+            color: #4a5568;
+            font-size: 0.9rem;
+        }}
+        
+        .page-toc .current-page a {{
+            font-weight: 600;
+        }}
+        
+        .page-nav {{
+            display: flex;
+            flex-wrap: wrap;
+            align-items: center;
+            justify-content: space-between;
+            gap: 1rem;
+            margin-top: 3rem;
+            padding-top: 1.5rem;
+            border-top: 2px solid #e2e8f0;
+        }}
+        
+        .page-nav ol {{
+            display: flex;
+            gap: 0.75rem;
+            list-style: none;
+            margin: 0;
+            padding: 0;
+        }}
+        
+        .page-nav li {{
+            margin: 0;
+        }}
+        
+        /* Barra Lateral de Conteúdo */
+        .toc-sidebar {{
+            max-width: 900px;
+            margin: 0 auto 2rem;
+            background: #fff;
+            border-radius: 16px;
+            box-shadow: 0 4px 25px rgba(0,0,0,0.08);
+            padding: 1.5rem 2.5rem;
+            font-size: 0.9rem;
+        }}
+        
+        .toc-sidebar-title {{
+            margin-bottom: 0.5rem;
+            color: #4a5568;
+            font-weight: 600;
+        }}
+        
+        .toc-sidebar ol {{
+            list-style: none;
+            margin: 0;
+            padding: 0;
+        }}
+        
+        .toc-sidebar li {{
+            margin: 0.25rem 0;
+        }}
+        
+        .toc-sidebar .toc-level-3 {{
+            padding-left: 1rem;
+        }}
+        
+        .toc-sidebar .toc-other-page a {{
+            color: #718096;
+        }}
+        
+        @media (min-width: 1400px) {{
+            .toc-sidebar {{
+                position: fixed;
+                top: 2rem;
+                left: calc(50% + 450px + 1.5rem);
+                width: calc(50% - 450px - 3rem);
+                max-width: 18rem;
+                max-height: calc(100vh - 4rem);
+                overflow-y: auto;
+                margin: 0;
+                padding: 1.25rem 1.5rem;
+            }}
+        }}
+        
         /* Responsividade */
         @media (max-width: 768px) {{
             .container {{ 
@@ -393,6 +830,12 @@ def convert_md_to_html(md_file, output_file=None, author="Christian V. Mulato",
                 border-radius: 12px;
             }}
             
+            .toc-sidebar {{
+                margin: 0 1rem 1rem;
+                padding: 1.5rem;
+                border-radius: 12px;
+            }}
+            
             h1 {{ font-size: 2rem; }}
             h2 {{ font-size: 1.5rem; }}
             h3 {{ font-size: 1.25rem; }}
@@ -448,6 +891,8 @@ def convert_md_to_html(md_file, output_file=None, author="Christian V. Mulato",
                 color: black;
                 border: 1px solid #dee2e6;
             }}
+            
+            .toc-sidebar {{ display: none; }}
         }}
     </style>
 </head>
@@ -456,11 +901,15 @@ def convert_md_to_html(md_file, output_file=None, author="Christian V. Mulato",
         <article itemscope itemtype="https://schema.org/Article">
             <meta itemprop="author" content="{author}">
             <meta itemprop="datePublished" content="{datetime.now().isoformat()}">
+            {page_toc}
             <div itemprop="articleBody">
                 {html_body}
             </div>
         </article>
+        {page_nav}
+        {series_html}
     </main>
+    {toc_sidebar}
     
     <!-- Scripts -->
     <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js"></script>
@@ -504,10 +953,282 @@ def convert_md_to_html(md_file, output_file=None, author="Christian V. Mulato",
     </script>
 </body>
 </html>"""
+    
+    timer.lap('template')
+    
+    info = {
+        'meta': meta_info,
+        'front_matter': front_matter,
+        'author': author,
+        'url': url,
+        'word_count': body['word_count'],
+        'stats': body.get('stats', {}),
+        'toc': body.get('toc', []),
+        # Os links da navegação (série e páginas) também entram no grafo de links
+        'links': navigation_links(body['links'], series_nav, pagination),
+        'images': body['images'],
+        'body': body
+    }
+    return html_template, info
+
+
+def wrap_pages(body, md_path, author="Christian V. Mulato", url="", lang="pt-BR", series_nav=None, timer=None, paginate=None):
+    """
+    Divide um corpo já renderizado em páginas (ver pagination.py) e envolve
+    cada uma no template, sem renderizar o Markdown de novo.
+    
+    Args:
+        paginate (dict): orçamento por página (max_words e/ou max_bytes)
+    
+    Returns:
+        tuple: (html da primeira página, info); info['extra_pages'] traz
+        {nome do arquivo: html} das páginas 2..N (vazio se o corpo couber
+        em uma página)
+    """
+    md_path = Path(md_path)
+    timer = timer or StageTimer()
+    pages = paginate_body(body['html_body'], md_path.stem, paginate.get('max_words'), paginate.get('max_bytes'))
+    if len(pages) <= 1:
+        html_template, info = wrap_article(body, md_path, author, url, lang, series_nav, timer)
+        info.update({'pages': 1, 'extra_pages': {}})
+        return html_template, info
+    
+    front_matter = body['front_matter']
+    page_url = front_matter.get('base_url', url)
+    page_url = page_url.rstrip('/') if page_url else ''
+    pagination = {'total': len(pages), 'pages': pages, 'toc': table_of_contents(pages)}
+    toc = assign_pages(body.get('toc', []), {anchor: page['file'] for page in pages for anchor in page['anchors']})
+    
+    first_html = info = None
+    extra_pages = {}
+    links = navigation_links(body['links'], series_nav)
+    for page in pages:
+        meta = dict(body['meta'])
+        if page['number'] > 1:
+            # Páginas seguintes: título próprio e a própria URL como canônica
+            meta['title'] = f"{meta['title']} · Página {page['number']} de {len(pages)}"
+            meta['canonical_url'] = f"{page_url}/{page_path(md_path, page['file'])}" if page_url else ''
+        page_body = dict(body, meta=meta, html_body=page['html_body'], toc=toc)
+        html_template, page_info = wrap_article(page_body, md_path, author, url, lang, series_nav,
+                                                timer, dict(pagination, page=page['number']))
+        links = navigation_links(links, None, dict(pagination, page=page['number']))
+        if page['number'] == 1:
+            first_html, info = html_template, page_info
+        else:
+            extra_pages[page['file']] = html_template
+    
+    info.update({'meta': body['meta'], 'body': body, 'toc': toc, 'pages': len(pages), 'extra_pages': extra_pages,
+                 'links': links})
+    return first_html, info
+
+
+def pagination_options(max_words=None, max_bytes=None):
+    """Opção `paginate` a partir dos orçamentos da linha de comando (None se nenhum foi informado)."""
+    options = {key: value for key, value in (('max_words', max_words), ('max_bytes', max_bytes)) if value}
+    return options or None
+
+
+def render_article(md_content, md_path, author="Christian V. Mulato", url="", lang="pt-BR", series_nav=None, timer=None, body=None, paginate=None):
+    """
+    Renderiza um artigo já lido, sem nenhuma operação de E/S.
+    
+    Separada da leitura e da gravação para que o orquestrador do build possa
+    executá-la em um pool de processos enquanto outras etapas fazem E/S.
+    
+    Args:
+        md_content (str): Conteúdo Markdown (com ou sem front matter)
+        md_path (Path): Caminho do artigo (usado no título e nas URLs)
+        author (str): Nome do autor
+        url (str): URL base do site
+        lang (str): Idioma do conteúdo
+        series_nav (dict): Navegação da série (anterior/próximo), se houver
+        timer (StageTimer): Cronômetro das etapas (opcional)
+        body (dict): Corpo já renderizado (do cache); se informado, apenas o
+            template é aplicado
+        paginate (dict): Divide o artigo em páginas (max_words e/ou
+            max_bytes por página, ver wrap_pages)
+    
+    Returns:
+        tuple: (html: str, info: dict com meta, front matter, autor, URL,
+        contagem de palavras, links, imagens e o corpo)
+    """
+    timer = timer or StageTimer()
+    if body is None:
+        body = render_body(md_content, md_path, url, timer)
+    if paginate:
+        return wrap_pages(body, md_path, author, url, lang, series_nav, timer, paginate)
+    return wrap_article(body, md_path, author, url, lang, series_nav, timer)
+
+
+def convert_large_md_to_html(md_file, output_file=None, author="Christian V. Mulato", url="", lang="pt-BR", info=None, series_nav=None):
+    """
+    Converte um documento grande seção por seção, com memória constante.
+
+    O arquivo é lido com mmap (ver large_document.py); a página é gravada
+    aos poucos: o início do template, cada seção (cortada nos títulos # e ##)
+    logo após ser renderizada e, por fim, o fim do template. O pico de memória
+    depende do tamanho da maior seção, não do documento.
+
+    Mesmos argumentos de convert_md_to_html; levanta exceção em caso de erro.
+
+    Returns:
+        str: caminho do arquivo HTML gerado
+    """
+    from bs4 import BeautifulSoup
+    from markdown.extensions.toc import unique
+
+    md_path = Path(md_file)
+    html_path = Path(output_file) if output_file else md_path.with_suffix('.html')
+    timer = StageTimer()
+
+    with MappedDocument(md_path) as document:
+        front_matter = document.front_matter
+        body_url = front_matter.get('base_url', url)
+        body_url = body_url.rstrip('/') if body_url else ''
+
+        # 1ª passada: meta (o corpo ainda não existe, entra no lugar do marcador);
+        # o tempo de leitura do cabeçalho vem das contagens do próprio Markdown
+        markdown_stats = MarkdownStats()
+        meta_info = extract_meta_from_lines(markdown_stats.count(document.lines()), md_path)
+        apply_front_matter(meta_info, front_matter)
+        # O cabeçalho é gravado antes do corpo: a imagem de compartilhamento
+        # só pode vir do front matter
+        meta_info['social_image'] = social_image_src(meta_info.get('social_image'), [])
+        estimate = markdown_stats.summary()
+        meta_info.setdefault('reading_time', format_reading_time(estimate['reading_minutes']))
+        meta_info['word_count'] = estimate['prose_words']
+        timer.lap('meta')
+
+        # A barra lateral fica depois do corpo: entra no fim do template, já
+        # com os títulos de todas as seções
+        placeholder = f"<!-- corpo:{os.urandom(8).hex()} -->"
+        sidebar_placeholder = f"<!-- indice:{os.urandom(8).hex()} -->"
+        body = {'front_matter': front_matter, 'meta': meta_info, 'html_body': placeholder,
+                'word_count': 0, 'links': [], 'images': []}
+        html_template, render_info = wrap_article(body, md_path, author, url, lang, series_nav, timer,
+                                                  toc_sidebar=sidebar_placeholder)
+        head, tail = html_template.split(placeholder, 1)
+        del html_template
+
+        # 2ª passada: cada seção é renderizada e gravada antes de ler a próxima
+        word_count = prose_words = code_lines = 0
+        links = []
+        images = []
+        toc = []
+        heading_ids = set()
+        html_path.parent.mkdir(parents=True, exist_ok=True)
+        with html_path.open('w', encoding='utf-8') as f:
+            f.write(head)
+            for index, section in enumerate(document.sections()):
+                soup = BeautifulSoup(get_markdown_renderer().convert(section), 'html.parser')
+
+                # Ids dos títulos únicos no documento inteiro, como no modo normal
+                for heading in soup.find_all(re.compile(r'^h[1-6]$'), id=True):
+                    heading['id'] = unique(heading['id'], heading_ids)
+                    toc.append({'id': heading['id'], 'title': heading.get_text().strip(), 'level': int(heading.name[1])})
+
+                counts, section_links, section_images = postprocess_body(soup, meta_info['title'], body_url)
+                word_count += counts['word_count']
+                prose_words += counts['prose_words']
+                code_lines += counts['code_lines']
+                links.extend(section_links)
+                images.extend(section_images)
+                if index:
+                    f.write('\n')
+                f.write(str(soup))
+                # A árvore tem ciclos (pai ↔ filhos): sem liberar aqui, as seções
+                # já gravadas se acumulam até a próxima coleta completa
+                soup.decompose()
+                gc.collect(1)
+            f.write(tail.replace(sidebar_placeholder, sidebar_html(toc)))
+        timer.lap('sections')
+        includes = dict(document.includes)
+
+    if info is not None:
+        render_info.pop('body', None)
+        info.update(render_info)
+        info.update({
+            'word_count': word_count,
+            'stats': summarize(prose_words, code_lines, len(images)),
+            'toc': toc,
+            'links': navigation_links(links, series_nav),
+            'images': images,
+            'includes': includes,
+            'large': True,
+            'bytes_in': md_path.stat().st_size,
+            'bytes_out': html_path.stat().st_size,
+            'timings': timer.timings
+        })
+    return str(html_path.resolve())
+
+
+def convert_md_to_html(md_file, output_file=None, author="Christian V. Mulato", url="", lang="pt-BR", info=None, series_nav=None, paginate=None):
+    """
+    Função principal para converter Markdown para HTML com SEO otimizado.
+    
+    Args:
+        md_file (str): Caminho para o arquivo Markdown
+        output_file (str): Caminho para o arquivo HTML de saída (opcional)
+        author (str): Nome do autor
+        url (str): URL base do site
+        lang (str): Idioma do conteúdo
+        info (dict): Se informado, recebe os dados coletados durante a
+            renderização (meta, contagem de palavras, links, imagens,
+            tamanhos em bytes e tempos de cada etapa)
+        series_nav (dict): Navegação da série (anterior/próximo), se houver
+        paginate (dict): Divide artigos longos em páginas (max_words e/ou
+            max_bytes por página); as páginas 2..N ficam ao lado da primeira
+    
+    Returns:
+        tuple: (success: bool, output_path: str, error_message: str)
+    """
+    try:
+        md_path = Path(md_file)
+        if not md_path.exists():
+            return False, "", f"Arquivo markdown não encontrado: {md_path}"
+        
+        html_path = Path(output_file) if output_file else md_path.with_suffix('.html')
+
+        # Documentos grandes: mmap e gravação seção por seção
+        if is_large_document(md_path):
+            if paginate:
+                logging.warning(f"PAGINAÇÃO IGNORADA: {md_path.name} é um documento grande (gravado seção por seção)")
+            render_info = {}
+            output = convert_large_md_to_html(md_path, html_path, author, url, lang, render_info, series_nav)
+            if info is not None:
+                info.update(render_info)
+            logging.info(f"DOCUMENTO GRANDE ({render_info['bytes_in']:,} bytes) convertido seção por seção: {output}")
+            return True, output, ""
+
+        timer = StageTimer()
+
+        # Lê o conteúdo do arquivo Markdown (com os includes de java_code/ expandidos)
+        md_content, includes = read_article(md_path)
+        timer.lap('read')
+        
+        # Renderiza o artigo (front matter, meta, Markdown, pós-processamento e template)
+        html_template, render_info = render_article(md_content, md_path, author, url, lang, series_nav, timer,
+                                                    paginate=paginate)
+        meta_info = render_info['meta']
+        author = render_info['author']
+        url = render_info['url']
         
         # Salva o arquivo HTML
+        html_path.parent.mkdir(parents=True, exist_ok=True)
         with html_path.open('w', encoding='utf-8') as f:
             f.write(html_template)
+        if paginate:
+            write_extra_pages(html_path, render_info['extra_pages'])
+        timer.lap('write')
+        
+        if info is not None:
+            info.update(render_info)
+            info.update({
+                'includes': includes,
+                'bytes_in': md_path.stat().st_size,
+                'bytes_out': html_path.stat().st_size,
+                'timings': timer.timings
+            })
         
         logging.info(f"Arquivo HTML com SEO otimizado gerado: {html_path.resolve()}")
         logging.info(f"Título: {meta_info['title']}")
@@ -516,7 +1237,7 @@ def convert_md_to_html(md_file, output_file=None, author="Christian V. Mulato",
         logging.info(f"Autor: {author}")
         
         if url:
-            logging.info(f"URL: {url}/{md_path.stem}.html")
+            logging.info(f"URL: {url}/{page_path(md_path)}")
         
         return True, str(html_path.resolve()), ""
         
@@ -526,15 +1247,119 @@ def convert_md_to_html(md_file, output_file=None, author="Christian V. Mulato",
         return False, "", error_msg
 
 
+def run_batch_job(job, defaults):
+    """
+    Executa um trabalho do modo em lote e monta a linha de resultado.
+    
+    Args:
+        job (dict): Linha NDJSON com md, output, author, url e lang
+        defaults (dict): Valores usados quando o trabalho não os informa
+    
+    Returns:
+        dict: Resultado com status, caminho de saída, tamanhos e tempos por etapa
+    """
+    started = time.perf_counter()
+    md_file = job.get('md') or job.get('md_file')
+    result = {'line': job.get('_line'), 'id': job.get('id'), 'md': md_file}
+    
+    if not md_file:
+        result.update({'status': 'error', 'error': "Campo 'md' ausente"})
+        return result
+    
+    info = {}
+    success, output_path, error_msg = convert_md_to_html(
+        md_file,
+        job.get('output') or job.get('output_file'),
+        job.get('author', defaults['author']),
+        job.get('url', defaults['url']),
+        job.get('lang', defaults['lang']),
+        info=info
+    )
+    result.update({
+        'status': 'ok' if success else 'error',
+        'output': output_path,
+        'error': error_msg,
+        'bytes_in': info.get('bytes_in'),
+        'bytes_out': info.get('bytes_out'),
+        'timings': info.get('timings', {}),
+        'elapsed_ms': round((time.perf_counter() - started) * 1000, 3)
+    })
+    return result
+
+
+def iter_batch_jobs(stream):
+    """Lê os trabalhos NDJSON; linhas inválidas viram trabalhos com erro."""
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            job = json.loads(line)
+            if not isinstance(job, dict):
+                raise ValueError("o trabalho deve ser um objeto JSON")
+        except ValueError as e:
+            job = {'_error': f"Linha {line_number} inválida: {e}"}
+        job['_line'] = line_number
+        yield job
+
+
+def run_batch(source, workers, defaults, out=None):
+    """
+    Modo em lote: converte trabalhos NDJSON em um pool de processos.
+    
+    Cada trabalho concluído gera uma linha NDJSON na saída, na ordem de
+    término (use `line` ou `id` para correlacionar). O número de trabalhos em
+    andamento é limitado, então a entrada pode ter milhares de linhas.
+    
+    Returns:
+        int: Número de trabalhos com erro
+    """
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+    
+    out = out or sys.stdout
+    stream = sys.stdin if source == '-' else open(source, encoding='utf-8')
+    max_in_flight = max(1, workers) * 4
+    failures = 0
+    
+    def emit(result):
+        nonlocal failures
+        failures += result['status'] != 'ok'
+        out.write(json.dumps(result, ensure_ascii=False) + '\n')
+        out.flush()
+    
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=warm_up) as executor:
+            pending = set()
+            for job in iter_batch_jobs(stream):
+                if '_error' in job:
+                    emit({'line': job['_line'], 'status': 'error', 'error': job['_error']})
+                    continue
+                pending.add(executor.submit(run_batch_job, job, defaults))
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        emit(future.result())
+            for future in wait(pending).done:
+                emit(future.result())
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    
+    return failures
+
+
 def main():
     """Função principal para uso como script independente."""
     # Configuração de argumentos
     parser = argparse.ArgumentParser(description='Converter Markdown para HTML otimizado para SEO')
-    parser.add_argument('markdown_file', help='Arquivo Markdown de entrada')
+    parser.add_argument('markdown_file', nargs='?', help='Arquivo Markdown de entrada')
     parser.add_argument('html_file', nargs='?', help='Arquivo HTML de saída (opcional)')
     parser.add_argument('--author', default='Christian V. Mulato', help='Nome do autor')
     parser.add_argument('--url', default='', help='URL base do site')
     parser.add_argument('--lang', default='pt-BR', help='Idioma do conteúdo')
+    parser.add_argument('--paginate-words', type=int, default=None, help='Divide o artigo em páginas de até N palavras (nos títulos ##)')
+    parser.add_argument('--paginate-bytes', type=int, default=None, help='Divide o artigo em páginas de até N bytes de HTML (nos títulos ##)')
+    parser.add_argument('--batch', metavar='ARQUIVO', help="Modo em lote: lê trabalhos NDJSON do arquivo ('-' para stdin)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Processos do modo em lote')
     
     # Compatibilidade com modo simples
     if len(sys.argv) >= 2 and not sys.argv[1].startswith('-'):
@@ -548,17 +1373,32 @@ def main():
         author = 'Christian V. Mulato'
         url = ''
         lang = 'pt-BR'
+        paginate = None
     else:
         # Modo com argumentos avançados
         args = parser.parse_args()
+        
+        if args.batch:
+            defaults = {'author': args.author, 'url': args.url, 'lang': args.lang}
+            failures = run_batch(args.batch, args.workers, defaults)
+            sys.exit(1 if failures else 0)
+        
+        if not args.markdown_file:
+            parser.error('informe o arquivo Markdown ou use --batch')
+        
         md_file = args.markdown_file
         html_file = args.html_file
         author = args.author
         url = args.url
         lang = args.lang
+        paginate = pagination_options(args.paginate_words, args.paginate_bytes)
     
-    # Executa conversão
-    success, output_path, error_msg = convert_md_to_html(md_file, html_file, author, url, lang)
+    # Executa conversão (no daemon, se estiver em execução)
+    from conversion_daemon import convert_via_daemon
+    result = convert_via_daemon(md_file, html_file, author, url, lang, paginate=paginate)
+    if result is None:
+        result = convert_md_to_html(md_file, html_file, author, url, lang, paginate=paginate)
+    success, output_path, error_msg = result
     
     if success:
         print(f"SUCCESS: Arquivo HTML gerado em: {output_path}")
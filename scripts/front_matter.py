@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+front_matter.py
+
+Leitura de front matter (YAML ou TOML) no início dos artigos Markdown.
+
+    ---                         +++
+    title: Meu Artigo           title = "Meu Artigo"
+    tags: [Kafka, Java]         tags = ["Kafka", "Java"]
+    ---                         +++
+
+read_front_matter() lê apenas os bytes iniciais do arquivo (até o
+delimitador de fechamento), o que permite montar listagens, feeds e
+simulações (dry run) sem ler o corpo dos artigos.
+
+Os valores são normalizados na leitura: `tags` vira sempre uma lista de
+strings (`tags: kafka` ou `tags: "kafka, java"` são aceitos) e `category`
+precisa ser um texto.
+
+Front matter malformado (YAML/TOML inválido, bytes que não são UTF-8 ou
+category que não é texto) gera FrontMatterError. No planejamento do build, read_front_matter registra
+o erro com o caminho do arquivo e segue com o front matter vazio; na
+conversão, o erro faz falhar só aquele artigo.
+"""
+
+import re
+import logging
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+# PyYAML é opcional: sem ele, usa um parser simples de `chave: valor`
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+DELIMITERS = {'---': 'yaml', '+++': 'toml'}
+
+# Erros dos parsers que indicam front matter malformado
+PARSE_ERRORS = tuple(error for error in (
+    getattr(yaml, 'YAMLError', None) if YAML_AVAILABLE else None,
+    getattr(tomllib, 'TOMLDecodeError', None),
+) if error is not None)
+
+# Limite de leitura do cabeçalho: evita ler o corpo de arquivos sem fechamento
+MAX_FRONT_MATTER_BYTES = 64 * 1024
+
+
+class FrontMatterError(ValueError):
+    """Front matter malformado (YAML/TOML inválido, bytes que não são UTF-8 ou valor de tipo errado)."""
+
+
+def normalize_front_matter(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normaliza os campos usados nas listagens: `tags` como lista de strings
+    (um texto é dividido nas vírgulas) e `category` como texto.
+
+    Raises:
+        FrontMatterError: se category for uma lista ou um mapa
+    """
+    if 'tags' in data:
+        tags = data['tags']
+        if tags is None:
+            tags = []
+        elif isinstance(tags, str):
+            tags = tags.split(',')
+        elif not isinstance(tags, (list, tuple)):
+            tags = [tags]
+        data['tags'] = [str(tag).strip() for tag in tags if tag is not None and str(tag).strip()]
+    if data.get('category') is not None:
+        if isinstance(data['category'], (list, tuple, dict)):
+            raise FrontMatterError(f"category deve ser um texto, não {type(data['category']).__name__}: {data['category']!r}")
+        data['category'] = str(data['category']).strip()
+    return data
+
+
+def _parse_scalar(value: str) -> Any:
+    """Converte um valor YAML simples (string, número, booleano ou lista inline)."""
+    value = value.strip()
+    if value.startswith('[') and value.endswith(']'):
+        return [_parse_scalar(item) for item in value[1:-1].split(',') if item.strip()]
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+        return value[1:-1]
+    if value.lower() in ('true', 'false'):
+        return value.lower() == 'true'
+    if re.fullmatch(r'-?\d+', value):
+        return int(value)
+    if re.fullmatch(r'-?\d+\.\d+', value):
+        return float(value)
+    return value
+
+
+def _parse_simple_yaml(raw: str) -> Dict[str, Any]:
+    """Parser mínimo para front matter YAML sem PyYAML (chaves de um nível e listas)."""
+    data = {}
+    current_key = None
+    for line in raw.splitlines():
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+        if line.lstrip().startswith('- ') and current_key:
+            if not isinstance(data.get(current_key), list):
+                data[current_key] = []
+            data[current_key].append(_parse_scalar(line.lstrip()[2:]))
+            continue
+        if ':' in line:
+            key, value = line.split(':', 1)
+            current_key = key.strip()
+            data[current_key] = _parse_scalar(value) if value.strip() else None
+    return data
+
+
+def parse_front_matter(raw: str, fmt: str) -> Dict[str, Any]:
+    """
+    Interpreta o texto do front matter no formato indicado ('yaml' ou 'toml')
+    e normaliza os valores (ver normalize_front_matter).
+
+    Raises:
+        FrontMatterError: se o texto não for YAML/TOML válido ou algum valor
+            tiver o tipo errado
+    """
+    try:
+        if fmt == 'toml':
+            if tomllib is None:
+                logging.warning("Front matter TOML ignorado: instale 'tomli' (Python < 3.11)")
+                return {}
+            data = tomllib.loads(raw)
+        elif YAML_AVAILABLE:
+            data = yaml.safe_load(raw)
+            data = data if isinstance(data, dict) else {}
+        else:
+            data = _parse_simple_yaml(raw)
+    except PARSE_ERRORS as e:
+        raise FrontMatterError(f"front matter {fmt.upper()} inválido: {' '.join(str(e).split())}") from e
+    return normalize_front_matter(data)
+
+
+def split_front_matter(text: str) -> Tuple[Dict[str, Any], str]:
+    """
+    Separa o front matter do corpo de um artigo já lido.
+
+    Returns:
+        tuple: (metadados: dict, corpo Markdown sem o front matter)
+    """
+    text = text.lstrip('\ufeff')
+    first_line, _, rest = text.partition('\n')
+    fmt = DELIMITERS.get(first_line.strip())
+    if fmt is None:
+        return {}, text
+
+    delimiter = first_line.strip()
+    lines = rest.split('\n')
+    for index, line in enumerate(lines):
+        if line.strip() == delimiter:
+            raw = '\n'.join(lines[:index])
+            body = '\n'.join(lines[index + 1:])
+            return parse_front_matter(raw, fmt), body
+
+    # Sem delimitador de fechamento: não é front matter
+    return {}, text
+
+
+def read_front_matter(md_path: Path) -> Dict[str, Any]:
+    """
+    Lê somente o front matter de um arquivo, sem carregar o corpo.
+
+    A leitura para no delimitador de fechamento (ou em MAX_FRONT_MATTER_BYTES),
+    então o custo independe do tamanho do artigo. Front matter malformado é
+    registrado no log (com o caminho) e tratado como vazio.
+    """
+    try:
+        return _read_front_matter(md_path)
+    except (FrontMatterError, UnicodeDecodeError) as e:
+        logging.error(f"FRONT MATTER INVÁLIDO em {md_path}: {e} (ignorado no planejamento; a conversão do artigo falhará)")
+        return {}
+
+
+def _read_front_matter(md_path: Path) -> Dict[str, Any]:
+    with Path(md_path).open('rb') as f:
+        first_line = f.readline(MAX_FRONT_MATTER_BYTES).decode('utf-8-sig').strip()
+        fmt = DELIMITERS.get(first_line)
+        if fmt is None:
+            return {}
+
+        lines = []
+        read_bytes = 0
+        while read_bytes < MAX_FRONT_MATTER_BYTES:
+            line = f.readline(MAX_FRONT_MATTER_BYTES)
+            if not line:
+                break
+            read_bytes += len(line)
+            decoded = line.decode('utf-8')
+            if decoded.strip() == first_line:
+                return parse_front_matter(''.join(lines), fmt)
+            lines.append(decoded)
+
+    logging.warning(f"Front matter sem fechamento em {md_path}: ignorado")
+    return {}
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+image_graph.py
+
+Grafo de referências entre artigos e imagens.
+
+Durante a renderização, o conversor já coleta o src de cada <img> do corpo
+e escolhe a imagem de compartilhamento (og:image/twitter:image); o build
+grava tudo no catálogo (tabela images e coluna social_image). A partir
+desses dados, sem reler o HTML, o script:
+
+- resolve cada referência para o arquivo na saída (com o mesmo caminho
+  relativo à página, como faz copy_referenced_images) e para o arquivo de
+  origem em articles_md/;
+- lista as referências quebradas (imagem inexistente na origem ou na saída),
+  inclusive a imagem de compartilhamento;
+- lista as imagens da pasta de saída que nenhum artigo referencia e, com
+  --prune, as remove.
+
+A imagem de compartilhamento vem do social_image do front matter (um nome
+sem pasta fica em images/) ou, sem ele, da primeira imagem local do corpo;
+sem nenhuma das duas, a página não recebe og:image.
+
+Uso:
+    python scripts/image_graph.py
+    python scripts/image_graph.py --json
+    python scripts/image_graph.py --prune
+    python scripts/image_graph.py --keep 'images/logo*' --prune
+"""
+
+import os
+import sys
+import json
+import argparse
+import posixpath
+from pathlib import Path
+from fnmatch import fnmatch
+from urllib.parse import unquote, urlsplit
+from typing import Any, Dict, Iterable, List, Optional
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from catalog import ArticleCatalog, DEFAULT_CATALOG_PATH
+from discovery import ARTICLES_DIR
+
+DEFAULT_OUTPUT_DIR = Path('output')
+SOCIAL_IMAGE_FOLDER = 'images'
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.avif', '.ico', '.bmp')
+
+
+def is_local_image(src: Optional[str]) -> bool:
+    """Indica se o src aponta para um arquivo do próprio site (não URL, data: ou âncora)."""
+    if not src or src.startswith(('data:', '#', '//')):
+        return False
+    parts = urlsplit(src)
+    return not (parts.scheme or parts.netloc)
+
+
+def social_image_src(configured: Optional[str], images: Iterable[str]) -> Optional[str]:
+    """
+    Imagem de compartilhamento, no formato de um <img src> do artigo: a
+    configurada (um nome sem pasta fica em images/) ou a primeira imagem
+    local do corpo; None quando não há nenhuma.
+    """
+    if configured:
+        configured = str(configured)
+        if '/' in configured or not is_local_image(configured):
+            return configured
+        return f"{SOCIAL_IMAGE_FOLDER}/{configured}"
+    return next((src for src in images if is_local_image(src)), None)
+
+
+def social_image_url(src: Optional[str], url: str = '', folder: str = '') -> Optional[str]:
+    """
+    URL absoluta da imagem de compartilhamento (None sem imagem ou sem
+    base_url); um src relativo parte da pasta da página (`folder`).
+    """
+    if not src:
+        return None
+    if not is_local_image(src):
+        return src
+    if not url:
+        return None
+    path = unquote(urlsplit(src).path)
+    if not path.startswith('/'):
+        path = posixpath.join(folder, path)
+    return f"{url.rstrip('/')}/{posixpath.normpath(path).lstrip('/')}"
+
+
+def referenced_images(info: Dict[str, Any]) -> List[str]:
+    """Imagens do corpo mais a de compartilhamento (se ainda não estiver entre elas)."""
+    images = list(info.get('images', []))
+    social = (info.get('meta') or {}).get('social_image')
+    if social and social not in images:
+        images.append(social)
+    return images
+
+
+def output_image_path(src: str, output_path: str, output_dir: Path) -> Path:
+    """Arquivo da imagem na saída: relativo à página, ou à raiz da saída com / no início."""
+    path = unquote(urlsplit(src).path)
+    if path.startswith('/'):
+        return Path(os.path.normpath(Path(output_dir) / path.lstrip('/')))
+    return Path(os.path.normpath(Path(output_path).parent / path))
+
+
+def source_image_path(src: str, article: str, articles_dir: Path) -> Optional[Path]:
+    """Arquivo da imagem em articles_md/ (None com / no início: só existe na saída)."""
+    path = unquote(urlsplit(src).path)
+    if path.startswith('/'):
+        return None
+    return Path(os.path.normpath(Path(articles_dir) / Path(article).parent / path))
+
+
+def scan_images(output_dir: Path) -> Dict[Path, int]:
+    """Imagens da pasta de saída e seus tamanhos."""
+    found = {}
+    for folder, _, files in os.walk(output_dir):
+        for name in files:
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                path = Path(os.path.normpath(Path(folder) / name))
+                found[path] = path.stat().st_size
+    return found
+
+
+def analyze(catalog: ArticleCatalog, output_dir: Path = DEFAULT_OUTPUT_DIR, articles_dir: Path = ARTICLES_DIR,
+            keep: Iterable[str] = ()) -> Dict[str, Any]:
+    """
+    Monta o grafo artigo → imagem a partir do catálogo e compara com a saída.
+
+    Returns:
+        dict: images ({imagem na saída: [artigos]}), broken (referências
+        quebradas), unused (imagens sem referência) e os totais
+    """
+    output_dir = Path(output_dir)
+    keep = list(keep)
+    graph: Dict[str, List[str]] = {}
+    broken = []
+    external = 0
+    references = catalog.image_references()
+    for row in references:
+        if not is_local_image(row['src']):
+            external += 1
+            continue
+        target = output_image_path(row['src'], row['output_path'], output_dir)
+        graph.setdefault(target.as_posix(), [])
+        if row['path'] not in graph[target.as_posix()]:
+            graph[target.as_posix()].append(row['path'])
+        if target.is_file():
+            continue
+        source = source_image_path(row['src'], row['path'], articles_dir)
+        broken.append({
+            'path': row['path'],
+            'src': row['src'],
+            'social': bool(row['social']),
+            'reason': 'inexistente na origem' if source is not None and not source.is_file() else 'ausente na saída'
+        })
+
+    present = scan_images(output_dir) if output_dir.is_dir() else {}
+    unused = [
+        {'file': path.as_posix(), 'bytes': size}
+        for path, size in sorted(present.items())
+        if path.as_posix() not in graph
+        and not any(fnmatch(path.relative_to(output_dir).as_posix(), pattern) for pattern in keep)
+    ]
+    return {
+        'articles': len({row['path'] for row in references}),
+        'references': len(references),
+        'external': external,
+        'output_images': len(present),
+        'output_bytes': sum(present.values()),
+        'images': dict(sorted(graph.items())),
+        'broken': broken,
+        'unused': unused,
+        'unused_bytes': sum(item['bytes'] for item in unused)
+    }
+
+
+def prune_unused(unused: List[Dict[str, Any]]) -> int:
+    """Remove as imagens sem referência; retorna os bytes liberados."""
+    freed = 0
+    for item in unused:
+        path = Path(item['file'])
+        if path.is_file():
+            path.unlink()
+            freed += item['bytes']
+    return freed
+
+
+def format_size(size: int) -> str:
+    """Tamanho legível (KB ou MB)."""
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MB"
+    return f"{size / 1024:.1f} KB"
+
+
+def main():
+    """Função principal."""
+    parser = argparse.ArgumentParser(description='Imagens sem uso e referências quebradas do corpus')
+    parser.add_argument('--db', default=str(DEFAULT_CATALOG_PATH), help='Arquivo do catálogo')
+    parser.add_argument('--output', default=str(DEFAULT_OUTPUT_DIR), help='Pasta de saída do build')
+    parser.add_argument('--articles', default=str(ARTICLES_DIR), help='Pasta dos artigos em Markdown')
+    parser.add_argument('--keep', action='append', default=[],
+                        help='Padrão glob (relativo à saída) de imagens mantidas mesmo sem referência')
+    parser.add_argument('--prune', action='store_true', help='Remove da saída as imagens sem uso')
+    parser.add_argument('--json', action='store_true', help='Saída em JSON')
+
+    args = parser.parse_args()
+
+    if not Path(args.db).exists():
+        print(f"[ERROR] Catálogo não encontrado: {args.db}")
+        print("💡 Execute primeiro: python start.py")
+        sys.exit(1)
+
+    with ArticleCatalog(args.db) as catalog:
+        result = analyze(catalog, Path(args.output), Path(args.articles), args.keep)
+    if args.prune:
+        result['pruned_bytes'] = prune_unused(result['unused'])
+
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        sys.exit(1 if result['broken'] else 0)
+
+    print("[INFO] Grafo de Imagens")
+    print("=" * 50)
+    print(f"Artigos: {result['articles']} · Referências: {result['references']} "
+          f"(externas: {result['external']}) · Imagens na saída: {result['output_images']} "
+          f"({format_size(result['output_bytes'])})")
+
+    print()
+    if result['broken']:
+        print(f"[ERROR] Referências quebradas: {len(result['broken'])}")
+        for item in result['broken']:
+            kind = " (og:image)" if item['social'] else ""
+            print(f"  • {item['path']} → {item['src']}{kind}: {item['reason']}")
+    else:
+        print("✅ Nenhuma referência quebrada")
+
+    print()
+    print(f"Imagens sem uso na saída: {len(result['unused'])} ({format_size(result['unused_bytes'])})")
+    for item in result['unused']:
+        print(f"  • {item['file']} ({format_size(item['bytes'])})")
+    if args.prune:
+        print(f"✅ {len(result['unused'])} imagem(ns) removida(s), {format_size(result['pruned_bytes'])} liberados")
+    elif result['unused']:
+        print("💡 Use --prune para removê-las")
+
+    sys.exit(1 if result['broken'] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+includes.py
+
+Inclusão de arquivos de java_code/ nos artigos, em tempo de build.
+
+Em vez de copiar à mão trechos do pom.xml, docker-compose.yml, das classes
+Java ou dos schemas Avro para o Markdown, o artigo usa uma diretiva em uma
+linha própria:
+
+    <!-- include: parte1-fundamentos/src/main/java/SimpleProducer.java -->
+    <!-- include: parte1-fundamentos/pom.xml lines=10-42 -->
+
+A diretiva é trocada por um bloco de código cercado (```java, ```xml, ...)
+com o arquivo inteiro ou só o intervalo de linhas (1-based, inclusivo).
+
+A expansão acontece na leitura do artigo, antes das chaves dos caches: o
+conteúdo incluído entra no hash da fonte, então o cache de build nunca
+devolve um trecho desatualizado. Cada arquivo incluído é lido e tem o hash
+calculado uma vez por execução; o hash vira um nó do grafo de dependências
+(include:<caminho>), e editar um arquivo Java reconverte só os artigos que
+o incluem.
+"""
+
+import re
+import hashlib
+import textwrap
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+INCLUDE_ROOT = Path(__file__).resolve().parent.parent / "java_code"
+
+INCLUDE_PATTERN = re.compile(
+    r'^[ \t]*<!--\s*include:\s*(?P<path>\S+?)(?:\s+lines=(?P<start>\d+)(?:-(?P<end>\d+))?)?\s*-->[ \t]*$',
+    re.MULTILINE
+)
+
+# Linguagem do bloco de código pela extensão do arquivo
+LANGUAGES = {
+    '.java': 'java',
+    '.xml': 'xml',
+    '.yml': 'yaml',
+    '.yaml': 'yaml',
+    '.properties': 'properties',
+    '.avsc': 'json',
+    '.json': 'json',
+    '.sh': 'bash',
+    '.md': 'markdown',
+    '.txt': 'text'
+}
+
+# (caminho, tamanho, mtime) → (hash, linhas): cada arquivo é lido uma vez por execução
+_file_cache: Dict[Tuple[str, int, int], Tuple[str, list]] = {}
+
+
+def resolve_include(relative: str, root: Path = INCLUDE_ROOT) -> Path:
+    """Caminho de um arquivo incluído, que precisa estar dentro de `root`."""
+    root = Path(root).resolve()
+    path = (root / relative).resolve()
+    if root not in path.parents:
+        raise ValueError(f"Include fora de {root.name}/: {relative}")
+    if not path.is_file():
+        raise ValueError(f"Arquivo incluído não encontrado: {root.name}/{relative}")
+    return path
+
+
+def read_included(path: Path) -> Tuple[str, list]:
+    """Hash SHA-256 e linhas de um arquivo incluído (com cache por execução)."""
+    stat = path.stat()
+    cache_key = (str(path), stat.st_size, stat.st_mtime_ns)
+    if cache_key not in _file_cache:
+        data = path.read_bytes()
+        _file_cache[cache_key] = (hashlib.sha256(data).hexdigest(), data.decode('utf-8').splitlines())
+    return _file_cache[cache_key]
+
+
+def code_block(lines: list, language: str) -> str:
+    """Bloco de código cercado, com uma cerca maior que qualquer ``` do conteúdo."""
+    text = '\n'.join(lines)
+    fence = '```'
+    while fence in text:
+        fence += '`'
+    return f"{fence}{language}\n{text}\n{fence}"
+
+
+def expand_includes(md_content: str, root: Path = INCLUDE_ROOT) -> Tuple[str, Dict[str, str]]:
+    """
+    Troca as diretivas de include pelos blocos de código.
+
+    Returns:
+        tuple: (Markdown expandido, {caminho incluído: hash do arquivo})
+
+    Raises:
+        ValueError: arquivo ausente, fora de java_code/ ou intervalo inválido
+    """
+    includes = {}
+
+    def replace(match):
+        relative = match.group('path')
+        digest, lines = read_included(resolve_include(relative, root))
+        includes[relative] = digest
+
+        if match.group('start'):
+            start = int(match.group('start'))
+            end = int(match.group('end') or start)
+            if not 1 <= start <= end <= len(lines):
+                raise ValueError(f"Intervalo inválido em {relative}: lines={start}-{end} (arquivo com {len(lines)} linhas)")
+            lines = textwrap.dedent('\n'.join(lines[start - 1:end])).splitlines()
+
+        return code_block(lines, LANGUAGES.get(Path(relative).suffix.lower(), ''))
+
+    if '<!--' not in md_content:
+        return md_content, includes
+    return INCLUDE_PATTERN.sub(replace, md_content), includes
+
+
+def read_article(md_file: Path, root: Optional[Path] = None) -> Tuple[str, Dict[str, str]]:
+    """Lê um artigo e expande os includes (ver expand_includes)."""
+    md_content = Path(md_file).read_text(encoding='utf-8')
+    return expand_includes(md_content, root or INCLUDE_ROOT)
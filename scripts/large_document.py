@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+large_document.py
+
+Leitura de documentos Markdown muito grandes (guias de vários MB) sem
+carregá-los inteiros na memória.
+
+No modo normal, o conversor mantém ao mesmo tempo o Markdown, as listas de
+linhas, o HTML do corpo, a árvore do BeautifulSoup e a página final: o pico
+de memória é várias vezes o tamanho do arquivo. Aqui o arquivo é mapeado com
+mmap e percorrido linha a linha:
+
+    1ª passada: metadados (título, descrição, palavras-chave)
+    2ª passada: seções, cortadas nos títulos de nível 1 e 2 (# e ##) fora
+                de blocos de código, renderizadas e gravadas uma a uma
+
+Só uma seção por vez fica em memória. As diretivas de include (ver
+includes.py) são expandidas linha a linha, e as definições de links por
+referência ([id]: url) são repetidas em todas as seções para que os links
+continuem funcionando. Notas de rodapé ([^1]) valem só dentro da seção em
+que foram definidas.
+"""
+
+import os
+import re
+import mmap
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from front_matter import DELIMITERS, MAX_FRONT_MATTER_BYTES, parse_front_matter
+from includes import INCLUDE_PATTERN, expand_includes
+
+# A partir deste tamanho o conversor usa o modo para documentos grandes
+LARGE_DOCUMENT_BYTES = int(os.environ.get('SEO_LARGE_DOCUMENT_BYTES', 2 * 1024 * 1024))
+
+SECTION_HEADING = re.compile(r'^#{1,2} ')
+REFERENCE_DEFINITION = re.compile(r'^ {0,3}\[(?!\^)[^\]]+\]:\s*\S')
+FENCE = re.compile(r'^\s*(`{3,}|~{3,})')
+
+
+def is_large_document(md_file: Path, threshold: Optional[int] = None) -> bool:
+    """Indica se o arquivo deve ser convertido no modo para documentos grandes."""
+    threshold = LARGE_DOCUMENT_BYTES if threshold is None else threshold
+    try:
+        return Path(md_file).stat().st_size >= threshold
+    except OSError:
+        return False
+
+
+class MappedDocument:
+    """
+    Artigo Markdown mapeado em memória (mmap), lido linha a linha.
+
+    Uso:
+        with MappedDocument(path) as document:
+            meta = extract(document.lines())
+            for section in document.sections():
+                ...
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.front_matter: Dict[str, Any] = {}
+        self.includes: Dict[str, str] = {}
+        self._file = None
+        self._map = None
+        self._body_start = 0
+        self._references: Optional[List[str]] = None
+
+    def __enter__(self):
+        self._file = self.path.open('rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:3] == b'\xef\xbb\xbf':
+            self._body_start = 3
+        self._read_front_matter()
+        return self
+
+    def __exit__(self, *exc):
+        self._map.close()
+        self._file.close()
+
+    def _raw_lines(self, start: int) -> Iterator[tuple]:
+        """(linha decodificada, posição após a linha) a partir de `start`."""
+        data = self._map
+        size = len(data)
+        position = start
+        while position < size:
+            end = data.find(b'\n', position)
+            if end == -1:
+                end = size
+            yield data[position:end].decode('utf-8'), end + 1
+            position = end + 1
+
+    def _read_front_matter(self):
+        """Como split_front_matter, mas só lê o cabeçalho (até MAX_FRONT_MATTER_BYTES)."""
+        lines = self._raw_lines(self._body_start)
+        first = next(lines, None)
+        if first is None or DELIMITERS.get(first[0].strip()) is None:
+            return
+
+        delimiter = first[0].strip()
+        raw = []
+        for line, after in lines:
+            if after - self._body_start > MAX_FRONT_MATTER_BYTES:
+                return
+            if line.strip() == delimiter:
+                self.front_matter = parse_front_matter('\n'.join(raw), DELIMITERS[delimiter])
+                self._body_start = after
+                return
+            raw.append(line)
+
+    def lines(self) -> Iterator[str]:
+        """Linhas do corpo (sem o front matter), com as diretivas de include expandidas."""
+        for line, _ in self._raw_lines(self._body_start):
+            if '<!--' in line and INCLUDE_PATTERN.match(line):
+                expanded, includes = expand_includes(line)
+                self.includes.update(includes)
+                yield from expanded.split('\n')
+            else:
+                yield line
+
+    def reference_definitions(self) -> List[str]:
+        """Definições de links por referência ([id]: url) fora de blocos de código."""
+        if self._references is None:
+            self._references = []
+            fence = None
+            for line in self.lines():
+                fence = _update_fence(fence, line)
+                if fence is None and REFERENCE_DEFINITION.match(line):
+                    self._references.append(line)
+        return self._references
+
+    def sections(self) -> Iterator[str]:
+        """
+        Seções do corpo, cortadas antes de cada título # ou ## fora de blocos
+        de código; cada seção recebe as definições de links por referência.
+        """
+        references = self.reference_definitions()
+        suffix = '\n\n' + '\n'.join(references) if references else ''
+        section: List[str] = []
+        fence = None
+        for line in self.lines():
+            if fence is None and SECTION_HEADING.match(line) and any(part.strip() for part in section):
+                yield '\n'.join(section) + suffix
+                section = []
+            fence = _update_fence(fence, line)
+            section.append(line)
+        if section:
+            yield '\n'.join(section) + suffix
+
+
+def _update_fence(fence: Optional[str], line: str) -> Optional[str]:
+    """Acompanha a abertura e o fechamento de blocos de código cercados (``` ou ~~~)."""
+    match = FENCE.match(line)
+    if not match:
+        return fence
+    marker = match.group(1)
+    if fence is None:
+        return marker
+    if marker[0] == fence[0] and len(marker) >= len(fence) and not line.strip()[len(marker):].strip():
+        return None
+    return fence
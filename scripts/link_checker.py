@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+link_checker.py
+
+Verificação dos links do site gerado (pasta output/).
+
+Primeiro monta o índice do build: todos os arquivos da saída e os ids de
+cada página HTML (títulos, notas de rodapé, qualquer elemento com id ou
+<a name>). Depois verifica cada href interno, incluindo os #ancora que o
+script da página intercepta (um alvo inexistente simplesmente não rola a
+página). A leitura das páginas e a verificação rodam em um pool de
+processos, em lotes.
+
+Com --external, os links externos também são verificados, com limite de
+requisições simultâneas (--concurrency), limite de taxa (--rate), cache
+dos resultados com validade (--cache-ttl) e um resolvedor substituível:
+--rewrite redireciona um prefixo de URL (ex.: para um servidor local de
+testes) e --resolver carrega outra função (módulo:nome) que recebe a URL e
+retorna (ok, status, detalhe).
+
+Uso:
+    python scripts/link_checker.py
+    python scripts/link_checker.py --output output --jobs 4 --json
+    python scripts/link_checker.py --external --concurrency 8 --rate 5
+    python scripts/link_checker.py --external --rewrite https://kafka.apache.org=http://127.0.0.1:8000
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import posixpath
+import importlib
+import threading
+from pathlib import Path
+from html.parser import HTMLParser
+from urllib.parse import unquote, urlsplit
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from config.seo_config import DEFAULT_CONFIG
+except ImportError:
+    DEFAULT_CONFIG = {'base_url': ''}
+
+DEFAULT_CACHE_PATH = Path('.build') / 'external_links.json'
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RATE = 10.0
+DEFAULT_TIMEOUT = 10.0
+CHUNK_SIZE = 64
+
+SKIPPED_SCHEMES = ('mailto', 'tel', 'javascript', 'data')
+
+# Resolvedor externo: recebe a URL e retorna (ok, status HTTP ou None, detalhe)
+Resolver = Callable[[str], Tuple[bool, Optional[int], str]]
+
+
+class _PageParser(HTMLParser):
+    """Coleta os ids/names e os hrefs de uma página."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.ids: Set[str] = set()
+        self.hrefs: List[Tuple[str, int]] = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if attrs.get('id'):
+            self.ids.add(attrs['id'])
+        if tag == 'a' and attrs.get('name'):
+            self.ids.add(attrs['name'])
+        if tag in ('a', 'area') and attrs.get('href') is not None:
+            self.hrefs.append((attrs['href'], self.getpos()[0]))
+
+    handle_startendtag = handle_starttag
+
+
+def parse_page(path: str) -> Tuple[str, List[str], List[Tuple[str, int]]]:
+    """Lê uma página: (caminho, ids, [(href, linha)])."""
+    parser = _PageParser()
+    parser.feed(Path(path).read_text(encoding='utf-8', errors='replace'))
+    parser.close()
+    return path, sorted(parser.ids), parser.hrefs
+
+
+def _parse_pages(paths: List[str]) -> List[Tuple[str, List[str], List[Tuple[str, int]]]]:
+    return [parse_page(path) for path in paths]
+
+
+def chunks(items: List[Any], size: int = CHUNK_SIZE) -> Iterable[List[Any]]:
+    """Divide uma lista em lotes (menos tarefas no pool para sites com muitas páginas)."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def classify(href: str, base_url: str = '') -> str:
+    """'internal', 'external' ou 'skip' (mailto:, tel:, javascript:, data: e # sozinho)."""
+    parts = urlsplit(href.strip())
+    if parts.scheme in SKIPPED_SCHEMES or href.strip() in ('', '#'):
+        return 'skip'
+    if parts.scheme or parts.netloc:
+        if base_url and href.startswith(base_url.rstrip('/') + '/'):
+            return 'internal'
+        return 'external' if parts.scheme in ('http', 'https', '') else 'skip'
+    return 'internal'
+
+
+def resolve_internal(href: str, page: str, base_url: str = '') -> Tuple[str, str]:
+    """
+    Caminho do alvo (relativo à pasta de saída, com '/') e a âncora de um
+    href interno, a partir da página (também relativa à pasta de saída).
+    """
+    href = href.strip()
+    if base_url and href.startswith(base_url.rstrip('/') + '/'):
+        href = href[len(base_url.rstrip('/')):]
+    parts = urlsplit(href)
+    path = unquote(parts.path)
+    if not path:
+        target = page
+    elif path.startswith('/'):
+        target = path.lstrip('/') or '.'
+    else:
+        target = posixpath.normpath(posixpath.join(posixpath.dirname(page), path))
+    if path.endswith('/') or target == '.':
+        target = posixpath.normpath(posixpath.join(target, 'index.html'))
+    return target, unquote(parts.fragment)
+
+
+# Índice do build compartilhado pelos processos de verificação
+_index: Dict[str, Any] = {}
+
+
+def _init_checker(files: Set[str], anchors: Dict[str, Set[str]], base_url: str):
+    _index.update(files=files, anchors=anchors, base_url=base_url)
+
+
+def check_internal(page: str, href: str, files: Set[str], anchors: Dict[str, Set[str]],
+                   base_url: str = '') -> Optional[str]:
+    """Verifica um href interno contra o índice; retorna o motivo da falha ou None."""
+    target, fragment = resolve_internal(href, page, base_url)
+    if target.startswith('../'):
+        return "aponta para fora da pasta de saída"
+    if target not in files:
+        if target + '/index.html' in files or target + '.html' in files:
+            return None  # servidor resolve /pasta e /pagina sem extensão
+        return f"arquivo inexistente: {target}"
+    if fragment and target in anchors and fragment not in anchors[target]:
+        return f"âncora inexistente: {target}#{fragment}"
+    return None
+
+
+def _check_batch(batch: List[Tuple[str, str, int]]) -> List[Dict[str, Any]]:
+    broken = []
+    for page, href, line in batch:
+        reason = check_internal(page, href, _index['files'], _index['anchors'], _index['base_url'])
+        if reason:
+            broken.append({'page': page, 'href': href, 'line': line, 'reason': reason})
+    return broken
+
+
+def build_index(output_dir: Path, jobs: int = 1) -> Tuple[Set[str], Dict[str, Set[str]], Dict[str, List[Tuple[str, int]]]]:
+    """
+    Índice do build: arquivos da saída, ids de cada página e os hrefs de cada página.
+
+    Returns:
+        tuple: (arquivos, {página: ids}, {página: [(href, linha)]}), com
+        caminhos relativos à pasta de saída
+    """
+    output_dir = Path(output_dir)
+    files = {path.relative_to(output_dir).as_posix() for path in output_dir.rglob('*') if path.is_file()}
+    pages = sorted(str(output_dir / name) for name in files if name.endswith('.html'))
+
+    if jobs > 1 and len(pages) > CHUNK_SIZE:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            parsed = [result for batch in pool.map(_parse_pages, chunks(pages)) for result in batch]
+    else:
+        parsed = _parse_pages(pages)
+
+    anchors = {}
+    hrefs = {}
+    for path, ids, page_hrefs in parsed:
+        name = Path(path).relative_to(output_dir).as_posix()
+        anchors[name] = set(ids)
+        hrefs[name] = page_hrefs
+    return files, anchors, hrefs
+
+
+def check_internal_links(files: Set[str], anchors: Dict[str, Set[str]], hrefs: Dict[str, List[Tuple[str, int]]],
+                         base_url: str = '', jobs: int = 1) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Verifica os hrefs internos de todas as páginas, em lotes distribuídos
+    entre processos.
+
+    Returns:
+        tuple: (links verificados, [{page, href, line, reason}] dos quebrados)
+    """
+    links = [(page, href, line) for page, page_hrefs in sorted(hrefs.items())
+             for href, line in page_hrefs if classify(href, base_url) == 'internal']
+
+    if jobs > 1 and len(links) > CHUNK_SIZE:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_checker,
+                                 initargs=(files, anchors, base_url)) as pool:
+            broken = [entry for batch in pool.map(_check_batch, chunks(links)) for entry in batch]
+    else:
+        _init_checker(files, anchors, base_url)
+        broken = _check_batch(links)
+    return len(links), broken
+
+
+# ----------------------------------------------------------------------
+# Links externos
+# ----------------------------------------------------------------------
+
+class RateLimiter:
+    """Limite de taxa compartilhado entre threads (requisições por segundo)."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Bloqueia até a próxima requisição permitida."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class HttpResolver:
+    """
+    Resolvedor padrão: HEAD (ou GET, se o servidor recusar HEAD) com urllib.
+
+    Args:
+        rewrite (dict): {prefixo: substituto} aplicado à URL antes da
+            requisição (ex.: apontar um domínio para um servidor local)
+        timeout (float): tempo limite de cada requisição, em segundos
+    """
+
+    def __init__(self, rewrite: Optional[Dict[str, str]] = None, timeout: float = DEFAULT_TIMEOUT):
+        self.rewrite = rewrite or {}
+        self.timeout = timeout
+
+    def __call__(self, url: str) -> Tuple[bool, Optional[int], str]:
+        import urllib.error
+        import urllib.request
+
+        for prefix, replacement in self.rewrite.items():
+            if url.startswith(prefix):
+                url = replacement + url[len(prefix):]
+                break
+        headers = {'User-Agent': 'SEO-Article-Builder-LinkChecker/1.0'}
+        for method in ('HEAD', 'GET'):
+            request = urllib.request.Request(url, method=method, headers=headers)
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    return True, response.status, ''
+            except urllib.error.HTTPError as e:
+                if method == 'HEAD' and e.code in (403, 405, 501):
+                    continue
+                return False, e.code, str(e.reason)
+            except (urllib.error.URLError, OSError, ValueError) as e:
+                return False, None, str(getattr(e, 'reason', e))
+        return False, None, "sem resposta"
+
+
+def load_resolver(spec: str) -> Resolver:
+    """Carrega um resolvedor a partir de 'módulo:nome' (função ou objeto chamável)."""
+    module_name, _, attribute = spec.partition(':')
+    if not attribute:
+        raise ValueError(f"Resolvedor inválido (use módulo:nome): {spec}")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+class ExternalLinkCache:
+    """Resultados das verificações externas em JSON, válidos por `ttl` segundos."""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_CACHE_TTL):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Resultado em cache ainda válido, ou None."""
+        entry = self.entries.get(url)
+        if entry and time.time() - entry['checked_at'] < self.ttl:
+            return entry
+        return None
+
+    def put(self, url: str, ok: bool, status: Optional[int], detail: str):
+        """Guarda o resultado de uma verificação."""
+        self.entries[url] = {'ok': ok, 'status': status, 'detail': detail, 'checked_at': time.time()}
+
+    def save(self):
+        """Grava o cache, descartando entradas vencidas."""
+        now = time.time()
+        entries = {url: entry for url, entry in self.entries.items() if now - entry['checked_at'] < self.ttl}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(entries, ensure_ascii=False, indent=1), encoding='utf-8')
+
+
+def check_external_links(hrefs: Dict[str, List[Tuple[str, int]]], resolver: Resolver,
+                         cache: Optional[ExternalLinkCache] = None, concurrency: int = DEFAULT_CONCURRENCY,
+                         rate: float = DEFAULT_RATE, base_url: str = '') -> Tuple[Dict[str, int], List[Dict[str, Any]]]:
+    """
+    Verifica cada URL externa uma única vez, com no máximo `concurrency`
+    requisições simultâneas e `rate` requisições por segundo.
+
+    Returns:
+        tuple: ({urls, cached, requested}, [{page, href, line, status, reason}] dos quebrados)
+    """
+    pages_by_url: Dict[str, List[Tuple[str, int]]] = {}
+    for page, page_hrefs in sorted(hrefs.items()):
+        for href, line in page_hrefs:
+            if classify(href, base_url) == 'external':
+                url = href.strip()
+                if url.startswith('//'):
+                    url = 'https:' + url
+                pages_by_url.setdefault(url.split('#', 1)[0], []).append((page, line))
+
+    results = {}
+    pending = []
+    for url in pages_by_url:
+        entry = cache.get(url) if cache else None
+        if entry is not None:
+            results[url] = entry
+        else:
+            pending.append(url)
+
+    limiter = RateLimiter(rate)
+
+    def resolve(url):
+        limiter.wait()
+        try:
+            return url, resolver(url)
+        except Exception as e:
+            return url, (False, None, str(e))
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        for url, (ok, status, detail) in pool.map(resolve, pending):
+            results[url] = {'ok': ok, 'status': status, 'detail': detail}
+            if cache:
+                cache.put(url, ok, status, detail)
+    if cache:
+        cache.save()
+
+    broken = [
+        {'page': page, 'href': url, 'line': line, 'status': result['status'],
+         'reason': f"HTTP {result['status']}" if result['status'] else result['detail']}
+        for url, result in sorted(results.items()) if not result['ok']
+        for page, line in pages_by_url[url]
+    ]
+    summary = {'urls': len(pages_by_url), 'cached': len(pages_by_url) - len(pending), 'requested': len(pending)}
+    return summary, broken
+
+
+def parse_rewrites(values: Optional[List[str]]) -> Dict[str, str]:
+    """Converte ['prefixo=substituto', ...] em dicionário."""
+    rewrites = {}
+    for value in values or []:
+        prefix, separator, replacement = value.partition('=')
+        if not separator:
+            raise ValueError(f"--rewrite inválido (use prefixo=substituto): {value}")
+        rewrites[prefix] = replacement
+    return rewrites
+
+
+def main():
+    """Função principal."""
+    parser = argparse.ArgumentParser(description='Verifica links internos, âncoras e (opcionalmente) externos da saída')
+    parser.add_argument('--output', default='output', help='Pasta com o site gerado')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1, help='Processos da verificação interna')
+    parser.add_argument('--url', default=None, help='URL base do site (padrão: DEFAULT_CONFIG); links com ela são internos')
+    parser.add_argument('--external', action='store_true', help='Verifica também os links externos')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help='Requisições externas simultâneas')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE, help='Requisições externas por segundo (0 = sem limite)')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='Tempo limite de cada requisição (s)')
+    parser.add_argument('--cache', default=str(DEFAULT_CACHE_PATH), help='Cache dos resultados externos')
+    parser.add_argument('--cache-ttl', type=float, default=DEFAULT_CACHE_TTL, help='Validade do cache externo (s; 0 = sem cache)')
+    parser.add_argument('--rewrite', action='append', metavar='PREFIXO=SUBSTITUTO',
+                        help='Redireciona URLs externas (ex.: para um servidor local de testes)')
+    parser.add_argument('--resolver', default=None, metavar='MODULO:NOME', help='Resolvedor externo alternativo')
+    parser.add_argument('--json', action='store_true', help='Saída em JSON')
+
+    args = parser.parse_args()
+
+    output_dir = Path(args.output)
+    if not output_dir.exists():
+        print(f"[ERROR] Pasta não encontrada: {output_dir}")
+        print("💡 Execute primeiro: python start.py")
+        sys.exit(1)
+
+    base_url = (args.url if args.url is not None else DEFAULT_CONFIG.get('base_url', '')).rstrip('/')
+    jobs = max(1, args.jobs)
+
+    started = time.perf_counter()
+    files, anchors, hrefs = build_index(output_dir, jobs)
+    checked, broken = check_internal_links(files, anchors, hrefs, base_url, jobs)
+    report = {
+        'pages': len(anchors),
+        'files': len(files),
+        'internal': {'checked': checked, 'broken': broken}
+    }
+
+    if args.external:
+        try:
+            resolver = load_resolver(args.resolver) if args.resolver else HttpResolver(parse_rewrites(args.rewrite), args.timeout)
+        except (ImportError, AttributeError, ValueError) as e:
+            print(f"[ERROR] {e}")
+            sys.exit(1)
+        cache = ExternalLinkCache(Path(args.cache), args.cache_ttl) if args.cache_ttl > 0 else None
+        summary, external_broken = check_external_links(hrefs, resolver, cache, args.concurrency, args.rate, base_url)
+        report['external'] = dict(summary, broken=external_broken)
+    report['seconds'] = round(time.perf_counter() - started, 3)
+
+    failed = bool(report['internal']['broken'] or report.get('external', {}).get('broken'))
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        sys.exit(1 if failed else 0)
+
+    print("[INFO] Verificação de Links")
+    print("=" * 50)
+    print(f"Páginas: {report['pages']} · Arquivos na saída: {report['files']}")
+    print(f"Links internos verificados: {checked} ({len(broken)} quebrado(s))")
+    for entry in broken:
+        print(f"  • {entry['page']}:{entry['line']} → {entry['href']} ({entry['reason']})")
+    if 'external' in report:
+        external = report['external']
+        print(f"Links externos: {external['urls']} URL(s), {external['cached']} do cache, "
+              f"{external['requested']} verificada(s) ({len(external['broken'])} quebrado(s))")
+        for entry in external['broken']:
+            print(f"  • {entry['page']}:{entry['line']} → {entry['href']} ({entry['reason']})")
+
+    if failed:
+        print("[ERROR] Há links quebrados")
+        sys.exit(1)
+    print(f"[INFO] ✅ Todos os links resolvem ({report['seconds']}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+link_graph.py
+
+Análise do grafo de links internos do corpus.
+
+Os links de cada artigo já foram extraídos do HTML renderizado e guardados
+no catálogo pelo build (ver catalog.py); aqui eles são resolvidos para o
+artigo de destino (inclusive páginas 2..N de artigos paginados e URLs com
+a base_url do site) e viram uma matriz de adjacência esparsa. Sobre ela:
+
+- PageRank (iteração de potência, fator de amortecimento 0.85);
+- grau de entrada e de saída de cada artigo;
+- artigos órfãos (nenhum outro artigo aponta para eles);
+- sugestões de links internos para artigos pouco conectados: artigos com
+  tags, categoria e série em comum, priorizados pelo PageRank.
+
+Os links guardados incluem os da navegação que o template acrescenta
+(anterior/próximo da série, páginas de um artigo paginado), não só os do
+corpo em Markdown.
+
+NumPy e SciPy são opcionais (não estão em requirements.txt): instalados, o
+cálculo é vetorizado e processa 100 mil páginas em segundos; sem eles, a
+mesma iteração roda em Python puro.
+
+Uso:
+    python scripts/link_graph.py
+    python scripts/link_graph.py --top 20 --suggest 5 --json
+    python scripts/link_graph.py --weak 2 --damping 0.9
+"""
+
+import re
+import sys
+import json
+import time
+import argparse
+import posixpath
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    import scipy.sparse as sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    sparse = None
+    SCIPY_AVAILABLE = False
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from config.seo_config import DEFAULT_CONFIG, SERIES_CONFIGS
+except ImportError:
+    DEFAULT_CONFIG = {'base_url': ''}
+    SERIES_CONFIGS = {}
+
+from catalog import ArticleCatalog, DEFAULT_CATALOG_PATH
+from pagination import PAGE_SUFFIX
+
+DEFAULT_DAMPING = 0.85
+DEFAULT_TOLERANCE = 1e-10
+DEFAULT_MAX_ITERATIONS = 100
+DEFAULT_WEAK_DEGREE = 1
+DEFAULT_SUGGESTIONS = 3
+DEFAULT_TOP = 10
+
+# Candidatos considerados por tag ao sugerir links (os de maior PageRank)
+CANDIDATES_PER_TAG = 50
+
+EXTRA_PAGE = re.compile(re.escape(PAGE_SUFFIX) + r'\d+(?=\.html$)')
+
+
+class LinkGraph:
+    """
+    Grafo dirigido de links entre artigos.
+
+    Attributes:
+        nodes (list): caminhos dos artigos (índice = posição)
+        sources, targets (list): arestas únicas (origem → destino), sem laços
+    """
+
+    def __init__(self, nodes: List[str], edges: List[Tuple[int, int]]):
+        self.nodes = nodes
+        self.sources = [source for source, _ in edges]
+        self.targets = [target for _, target in edges]
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def degrees(self) -> Tuple[List[int], List[int]]:
+        """Graus de entrada e de saída de cada artigo."""
+        if NUMPY_AVAILABLE:
+            n = len(self.nodes)
+            in_degree = np.bincount(np.asarray(self.targets, dtype=np.int64), minlength=n)
+            out_degree = np.bincount(np.asarray(self.sources, dtype=np.int64), minlength=n)
+            return in_degree.tolist(), out_degree.tolist()
+        in_degree = [0] * len(self.nodes)
+        out_degree = [0] * len(self.nodes)
+        for source, target in zip(self.sources, self.targets):
+            out_degree[source] += 1
+            in_degree[target] += 1
+        return in_degree, out_degree
+
+    def pagerank(self, damping: float = DEFAULT_DAMPING, tolerance: float = DEFAULT_TOLERANCE,
+                 max_iterations: int = DEFAULT_MAX_ITERATIONS) -> Tuple[List[float], int]:
+        """
+        PageRank por iteração de potência; o peso dos artigos sem links de
+        saída é redistribuído igualmente.
+
+        Returns:
+            tuple: (PageRank de cada artigo, iterações executadas)
+        """
+        if not self.nodes:
+            return [], 0
+        if NUMPY_AVAILABLE:
+            return self._pagerank_vectorized(damping, tolerance, max_iterations)
+        return self._pagerank_python(damping, tolerance, max_iterations)
+
+    def _pagerank_vectorized(self, damping, tolerance, max_iterations):
+        n = len(self.nodes)
+        sources = np.asarray(self.sources, dtype=np.int64)
+        targets = np.asarray(self.targets, dtype=np.int64)
+        out_degree = np.bincount(sources, minlength=n).astype(np.float64)
+        dangling = out_degree == 0
+        weights = 1.0 / out_degree[sources] if len(sources) else np.zeros(0)
+
+        if SCIPY_AVAILABLE:
+            # Matriz de transição esparsa (coluna = origem), multiplicada a cada iteração
+            matrix = sparse.csr_matrix((weights, (targets, sources)), shape=(n, n))
+            spread = matrix.dot
+        else:
+            spread = lambda rank: np.bincount(targets, weights=rank[sources] * weights, minlength=n)
+
+        rank = np.full(n, 1.0 / n)
+        iterations = 0
+        for iterations in range(1, max_iterations + 1):
+            updated = damping * spread(rank) + (damping * rank[dangling].sum() + 1.0 - damping) / n
+            delta = np.abs(updated - rank).sum()
+            rank = updated
+            if delta < tolerance * n:
+                break
+        return rank.tolist(), iterations
+
+    def _pagerank_python(self, damping, tolerance, max_iterations):
+        n = len(self.nodes)
+        _, out_degree = self.degrees()
+        rank = [1.0 / n] * n
+        iterations = 0
+        for iterations in range(1, max_iterations + 1):
+            dangling_sum = sum(value for value, degree in zip(rank, out_degree) if degree == 0)
+            base = (damping * dangling_sum + 1.0 - damping) / n
+            updated = [base] * n
+            for source, target in zip(self.sources, self.targets):
+                updated[target] += damping * rank[source] / out_degree[source]
+            delta = sum(abs(new - old) for new, old in zip(updated, rank))
+            rank = updated
+            if delta < tolerance * n:
+                break
+        return rank, iterations
+
+
+def page_key(output_path: str) -> str:
+    """Chave da página de um artigo: a primeira página (stem-pagina-2.html → stem.html)."""
+    return EXTRA_PAGE.sub('', posixpath.normpath(output_path))
+
+
+def resolve_link(href: str, output_path: str, base_url: str = '', output_root: str = '') -> Optional[str]:
+    """
+    Caminho de saída (normalizado) apontado por um href interno, ou None
+    (só âncora); hrefs com / no início partem de `output_root`.
+    """
+    base_url = base_url.rstrip('/')
+    if base_url and href.startswith(base_url + '/'):
+        href = href[len(base_url):]
+    parts = urlsplit(href)
+    if parts.scheme or parts.netloc or not parts.path:
+        return None
+    path = unquote(parts.path)
+    if path.startswith('/'):
+        return posixpath.normpath(posixpath.join(output_root, path.lstrip('/')))
+    return posixpath.normpath(posixpath.join(posixpath.dirname(output_path), path))
+
+
+def build_graph(catalog: ArticleCatalog, base_url: str = '') -> Tuple[LinkGraph, Dict[str, Any]]:
+    """
+    Monta o grafo a partir dos links internos guardados no catálogo.
+
+    Returns:
+        tuple: (grafo, {'links': links lidos, 'unresolved': links para
+        páginas fora do catálogo})
+    """
+    articles = catalog.articles()
+    nodes = [row['path'] for row in articles]
+    index = {row['path']: position for position, row in enumerate(articles)}
+    by_page = {page_key(row['output_path']): index[row['path']] for row in articles if row['output_path']}
+    output_paths = {row['path']: row['output_path'] for row in articles}
+    folders = [posixpath.dirname(path) for path in output_paths.values() if path]
+    output_root = posixpath.commonpath(folders) if folders else ''
+
+    edges = set()
+    links = unresolved = 0
+    for row in catalog.internal_links():
+        output_path = output_paths.get(row['path'])
+        if not output_path:
+            continue
+        links += 1
+        target_path = resolve_link(row['href'], output_path, base_url, output_root)
+        if target_path is None:
+            continue  # âncora na própria página
+        target = by_page.get(page_key(target_path))
+        if target is None:
+            unresolved += 1
+        elif target != index[row['path']]:
+            edges.add((index[row['path']], target))
+    return LinkGraph(nodes, sorted(edges)), {'links': links, 'unresolved': unresolved}
+
+
+def suggest_links(graph: LinkGraph, ranks: List[float], in_degree: List[int],
+                  attributes: Dict[str, Dict[str, Any]], weak_degree: int = DEFAULT_WEAK_DEGREE,
+                  limit: int = DEFAULT_SUGGESTIONS) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Sugere, para cada artigo pouco conectado (grau de entrada até
+    `weak_degree`), artigos que deveriam apontar para ele: os que têm mais
+    tags em comum, mesma categoria ou série, com o PageRank como desempate.
+    Artigos que já apontam para ele ficam de fora.
+
+    Returns:
+        dict: {artigo: [{source, shared (tags, categoria e série em comum), pagerank}]}
+    """
+    nodes = graph.nodes
+    linked = set(zip(graph.sources, graph.targets))
+    by_rank = sorted(range(len(nodes)), key=lambda node: -ranks[node])
+
+    # Índice invertido (tag, categoria, série) → artigos de maior PageRank primeiro
+    members: Dict[str, List[int]] = {}
+    for node in by_rank:
+        for key in feature_keys(attributes.get(nodes[node], {})):
+            group = members.setdefault(key, [])
+            if len(group) < CANDIDATES_PER_TAG:
+                group.append(node)
+
+    suggestions = {}
+    for node in range(len(nodes)):
+        if in_degree[node] > weak_degree:
+            continue
+        features = feature_keys(attributes.get(nodes[node], {}))
+        scores: Dict[int, int] = {}
+        for key in features:
+            for candidate in members.get(key, []):
+                if candidate != node and (candidate, node) not in linked:
+                    scores[candidate] = scores.get(candidate, 0) + 1
+        best = sorted(scores, key=lambda candidate: (-scores[candidate], -ranks[candidate]))[:limit]
+        suggestions[nodes[node]] = [
+            {'source': nodes[candidate], 'shared': scores[candidate], 'pagerank': round(ranks[candidate], 6)}
+            for candidate in best
+        ]
+    return suggestions
+
+
+def feature_keys(attributes: Dict[str, Any]) -> List[str]:
+    """Chaves de afinidade de um artigo: tags, categoria e série."""
+    keys = [f"tag:{tag.lower()}" for tag in attributes.get('tags', [])]
+    if attributes.get('category'):
+        keys.append(f"categoria:{attributes['category'].lower()}")
+    if attributes.get('series'):
+        keys.append(f"serie:{attributes['series']}")
+    return keys
+
+
+def analyze(catalog: ArticleCatalog, base_url: str = '', damping: float = DEFAULT_DAMPING,
+            weak_degree: int = DEFAULT_WEAK_DEGREE, suggestions: int = DEFAULT_SUGGESTIONS) -> Dict[str, Any]:
+    """Análise completa do grafo (ver o docstring do módulo)."""
+    started = time.perf_counter()
+    graph, counts = build_graph(catalog, base_url)
+    in_degree, out_degree = graph.degrees()
+    ranks, iterations = graph.pagerank(damping)
+
+    tags = catalog.article_tags()
+    attributes = {
+        row['path']: {'tags': tags.get(row['path'], []), 'category': row['category'],
+                      'series': series_of(row['path'])}
+        for row in catalog.articles()
+    }
+
+    articles = [
+        {'path': path, 'pagerank': round(ranks[node], 6), 'in_degree': in_degree[node], 'out_degree': out_degree[node]}
+        for node, path in enumerate(graph.nodes)
+    ]
+    articles.sort(key=lambda article: -article['pagerank'])
+    return {
+        'backend': 'scipy' if SCIPY_AVAILABLE else 'numpy' if NUMPY_AVAILABLE else 'python',
+        'articles': articles,
+        'edges': len(graph.sources),
+        'links': counts['links'],
+        'unresolved': counts['unresolved'],
+        'iterations': iterations,
+        'orphans': [article['path'] for article in articles if article['in_degree'] == 0],
+        'suggestions': suggest_links(graph, ranks, in_degree, attributes, weak_degree, suggestions),
+        'seconds': round(time.perf_counter() - started, 3)
+    }
+
+
+def series_of(path: str) -> Optional[str]:
+    """Série do artigo em SERIES_CONFIGS (None se não fizer parte de uma)."""
+    name = posixpath.basename(path)
+    for series, config in SERIES_CONFIGS.items():
+        if name in config.get('articles', []):
+            return series
+    return None
+
+
+def main():
+    """Função principal."""
+    parser = argparse.ArgumentParser(description='PageRank, órfãos e sugestões de links internos do corpus')
+    parser.add_argument('--db', default=str(DEFAULT_CATALOG_PATH), help='Arquivo do catálogo')
+    parser.add_argument('--url', default=None, help='URL base do site (padrão: DEFAULT_CONFIG)')
+    parser.add_argument('--damping', type=float, default=DEFAULT_DAMPING, help='Fator de amortecimento do PageRank')
+    parser.add_argument('--weak', type=int, default=DEFAULT_WEAK_DEGREE,
+                        help='Grau de entrada máximo de um artigo pouco conectado')
+    parser.add_argument('--suggest', type=int, default=DEFAULT_SUGGESTIONS, help='Sugestões por artigo')
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP, help='Artigos exibidos no ranking')
+    parser.add_argument('--json', action='store_true', help='Saída em JSON')
+
+    args = parser.parse_args()
+
+    if not Path(args.db).exists():
+        print(f"[ERROR] Catálogo não encontrado: {args.db}")
+        print("💡 Execute primeiro: python start.py")
+        sys.exit(1)
+
+    base_url = args.url if args.url is not None else DEFAULT_CONFIG.get('base_url', '')
+    with ArticleCatalog(args.db) as catalog:
+        result = analyze(catalog, base_url, args.damping, args.weak, args.suggest)
+
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return
+
+    print("[INFO] Grafo de Links Internos")
+    print("=" * 50)
+    print(f"Artigos: {len(result['articles'])} · Links internos: {result['links']} · "
+          f"Arestas entre artigos: {result['edges']}")
+    print(f"PageRank: {result['iterations']} iteração(ões), backend {result['backend']} ({result['seconds']}s)")
+    if result['unresolved']:
+        print(f"Links para páginas fora do catálogo: {result['unresolved']}")
+
+    print()
+    print("Maior PageRank:")
+    for article in result['articles'][:args.top]:
+        print(f"  • {article['path']}: {article['pagerank']:.4f} "
+              f"(entrada: {article['in_degree']}, saída: {article['out_degree']})")
+
+    print()
+    print(f"Artigos órfãos (nenhum link de outro artigo): {len(result['orphans'])}")
+    for path in result['orphans'][:args.top]:
+        print(f"  • {path}")
+
+    suggestions = {path: items for path, items in result['suggestions'].items() if items}
+    if suggestions:
+        print()
+        print("💡 Sugestões de links internos:")
+        for path, items in list(suggestions.items())[:args.top]:
+            sources = ', '.join(f"{item['source']} ({item['shared']} em comum)" for item in items)
+            print(f"  • Apontar para {path} a partir de: {sources}")
+
+
+if __name__ == "__main__":
+    main()
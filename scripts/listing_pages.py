@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+listing_pages.py
+
+Gera as páginas de índice por tag (output/tags/) e por categoria
+(output/categories/) a partir do catálogo de artigos.
+
+As páginas usam apenas os metadados catalogados: nenhum artigo é relido ou
+renderizado. Cada listagem guarda uma impressão digital dos seus membros e
+metadados, e só é regravada quando ela muda. Listagens grandes são paginadas.
+
+Nomes diferentes podem gerar o mesmo slug ("C", "C#" e "C++" viram "c"): o
+primeiro fica com o slug puro e os demais recebem um sufixo ("c--2",
+"c--3"...). O slug de cada listagem é gravado no catálogo e mantido enquanto
+ela existir, para que os endereços não mudem quando surge uma tag nova.
+"""
+
+import os
+import re
+import html
+import logging
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from catalog import ArticleCatalog, build_fingerprint
+
+# Incrementar quando o HTML das listagens mudar (força a regeração)
+LISTING_TEMPLATE_VERSION = 2
+
+DEFAULT_PAGE_SIZE = 20
+
+LISTING_DIRS = {
+    'tag': 'tags',
+    'category': 'categories'
+}
+
+LISTING_TITLES = {
+    'tag': 'Artigos com a tag',
+    'category': 'Artigos da categoria'
+}
+
+
+def slugify(text: str) -> str:
+    """Converte um nome de tag/categoria em um nome de arquivo seguro."""
+    text = unicodedata.normalize('NFKD', str(text)).encode('ascii', 'ignore').decode('ascii')
+    slug = re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+    return slug or 'sem-nome'
+
+
+def listing_slugs(names: Iterable[str], previous: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """
+    Atribui a cada nome um slug único. Os nomes que já têm slug gravado
+    (`previous`) o mantêm; os demais, em ordem alfabética, ficam com
+    slugify(nome) ou, se ele já estiver em uso, com um sufixo "--N" (slugify
+    nunca produz "--", então o sufixo não colide com outro nome nem com o
+    "-N" das páginas seguintes).
+    """
+    previous = previous or {}
+    names = sorted(names)
+    slugs: Dict[str, str] = {}
+    taken = set()
+    for name in names:
+        slug = previous.get(name)
+        if slug and slug not in taken:
+            slugs[name] = slug
+            taken.add(slug)
+    for name in names:
+        if name in slugs:
+            continue
+        base = slug = slugify(name)
+        suffix = 2
+        while slug in taken:
+            slug = f"{base}--{suffix}"
+            suffix += 1
+        slugs[name] = slug
+        taken.add(slug)
+    return slugs
+
+
+def page_filename(slug: str, page: int) -> str:
+    """Nome do arquivo da página `page` (a primeira não tem sufixo)."""
+    return f"{slug}.html" if page == 1 else f"{slug}-{page}.html"
+
+
+def render_listing_page(kind: str, name: str, rows: List, page: int, total_pages: int,
+                        listing_dir: Path, base_url: str = '', slug: Optional[str] = None) -> str:
+    """Monta o HTML de uma página de listagem (`slug`: nome do arquivo; padrão slugify(name))."""
+    slug = slug or slugify(name)
+    title = f"{LISTING_TITLES[kind]} {name}"
+    if total_pages > 1:
+        title += f" - Página {page} de {total_pages}"
+
+    items = []
+    for row in rows:
+        href = os.path.relpath(row['output_path'], listing_dir).replace(os.sep, '/')
+        words = f"{row['word_count']:,} palavras".replace(',', '.') if row['word_count'] else None
+        details = ' · '.join(filter(None, [row['category'], row['reading_time'], words]))
+        items.append(f"""            <li>
+                <a href="{html.escape(href)}">{html.escape(row['title'] or row['stem'])}</a>
+                <p>{html.escape(row['description'] or '')}</p>
+                <small>{html.escape(details)}</small>
+            </li>""")
+
+    head_links = []
+    nav_links = []
+    url_prefix = f"{base_url.rstrip('/')}/{LISTING_DIRS[kind]}" if base_url else ''
+    if url_prefix:
+        head_links.append(f'<link rel="canonical" href="{url_prefix}/{page_filename(slug, page)}">')
+    if page > 1:
+        previous = page_filename(slug, page - 1)
+        head_links.append(f'<link rel="prev" href="{previous}">')
+        nav_links.append(f'<a href="{previous}" rel="prev">&larr; Anterior</a>')
+    if page < total_pages:
+        following = page_filename(slug, page + 1)
+        head_links.append(f'<link rel="next" href="{following}">')
+        nav_links.append(f'<a href="{following}" rel="next">Próxima &rarr;</a>')
+
+    head_html = '\n    '.join(head_links)
+    items_html = '\n'.join(items)
+
+    return f"""<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{html.escape(title)}</title>
+    <meta name="description" content="{html.escape(title)}">
+    <meta name="robots" content="index, follow">
+    {head_html}
+    <style>
+        body {{ font-family: 'Inter', 'Segoe UI', system-ui, -apple-system, sans-serif; background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%); color: #2d3748; line-height: 1.7; margin: 0; }}
+        .container {{ max-width: 900px; margin: 2rem auto; background: #fff; border-radius: 16px; box-shadow: 0 4px 25px rgba(0,0,0,0.08); padding: 3rem 2.5rem; }}
+        h1 {{ color: #1a202c; margin-top: 0; }}
+        ul {{ list-style: none; padding: 0; }}
+        li {{ border-bottom: 1px solid #e2e8f0; padding: 1rem 0; }}
+        li p {{ margin: 0.25rem 0; }}
+        a {{ color: #667eea; text-decoration: none; font-weight: 500; }}
+        a:hover {{ color: #764ba2; text-decoration: underline; }}
+        nav {{ display: flex; justify-content: space-between; margin-top: 1.5rem; }}
+    </style>
+</head>
+<body>
+    <main class="container" role="main">
+        <h1>{html.escape(title)}</h1>
+        <ul>
+{items_html}
+        </ul>
+        <nav aria-label="Paginação">{' '.join(nav_links)}</nav>
+    </main>
+</body>
+</html>
+"""
+
+
+def _remove_pages(listing_dir: Path, slug: str, first: int, last: int):
+    """Remove páginas que deixaram de existir (listagem encolheu ou sumiu)."""
+    for page in range(first, last + 1):
+        page_path = listing_dir / page_filename(slug, page)
+        if page_path.exists():
+            page_path.unlink()
+
+
+def generate_listing_pages(catalog: ArticleCatalog, output_dir: Path, base_url: str = '',
+                           page_size: int = DEFAULT_PAGE_SIZE, force: bool = False) -> dict:
+    """
+    Gera (ou atualiza) as listagens por tag e por categoria.
+
+    Returns:
+        dict: contagem de listagens regravadas, inalteradas e removidas
+    """
+    summary = {'written': 0, 'unchanged': 0, 'removed': 0}
+
+    for kind, directory in LISTING_DIRS.items():
+        listing_dir = Path(output_dir) / directory
+        listing_dir.mkdir(parents=True, exist_ok=True)
+        state = catalog.listing_state(kind)
+
+        if kind == 'tag':
+            names = catalog.tag_counts()
+            members_of = catalog.articles_by_tag
+        else:
+            names = catalog.category_counts()
+            members_of = catalog.articles_by_category
+
+        # Slug gravado de cada listagem (catálogos antigos não têm: slugify)
+        stored = {name: row['slug'] or slugify(name) for name, row in state.items()}
+        slugs = listing_slugs(names, {name: row['slug'] for name, row in state.items() if row['slug']})
+        taken = set(slugs.values())
+
+        for name in names:
+            rows = members_of(name)
+            slug = slugs[name]
+            total_pages = max(1, -(-len(rows) // page_size))
+            fingerprint = build_fingerprint(
+                LISTING_TEMPLATE_VERSION, page_size, base_url, slug,
+                [(row['path'], row['title'], row['description'], row['category'],
+                  row['reading_time'], row['word_count'], row['output_path']) for row in rows]
+            )
+
+            previous = state.get(name)
+            if (not force and previous is not None and previous['fingerprint'] == fingerprint
+                    and (listing_dir / page_filename(slug, 1)).exists()):
+                summary['unchanged'] += 1
+                continue
+
+            for page in range(1, total_pages + 1):
+                page_rows = rows[(page - 1) * page_size:page * page_size]
+                page_html = render_listing_page(kind, name, page_rows, page, total_pages,
+                                                listing_dir, base_url, slug)
+                (listing_dir / page_filename(slug, page)).write_text(page_html, encoding='utf-8')
+
+            if previous is not None:
+                if stored[name] != slug and stored[name] not in taken:
+                    _remove_pages(listing_dir, stored[name], 1, previous['pages'])
+                elif stored[name] == slug and previous['pages'] > total_pages:
+                    _remove_pages(listing_dir, slug, total_pages + 1, previous['pages'])
+
+            catalog.save_listing_state(kind, name, fingerprint, total_pages, slug)
+            summary['written'] += 1
+            logging.info(f"LISTAGEM ATUALIZADA: {directory}/{page_filename(slug, 1)} ({len(rows)} artigo(s))")
+
+        # Listagens sem membros são removidas (a não ser que o slug já seja de outra)
+        for name, row in state.items():
+            if name not in names:
+                if stored[name] not in taken:
+                    _remove_pages(listing_dir, stored[name], 1, row['pages'])
+                catalog.delete_listing_state(kind, name)
+                summary['removed'] += 1
+                logging.info(f"LISTAGEM REMOVIDA: {directory}/{page_filename(stored[name], 1)}")
+
+    return summary
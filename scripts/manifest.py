@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+manifest.py
+
+Manifesto de build: exportação em JSON dos registros do catálogo.
+
+Cada shard de um build distribuído (start.py --shard i/N) grava, na sua
+pasta de saída, um manifest.json com os artigos que converteu. A etapa de
+junção (merge_shards.py) carrega os manifestos em um catálogo em memória e
+gera os artefatos globais sem renderizar nada de novo.
+
+Os caminhos de saída no manifesto são relativos à pasta de saída do shard,
+para que os arquivos possam ser copiados para qualquer destino.
+"""
+
+import os
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from catalog import ArticleCatalog
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def write_manifest(catalog: ArticleCatalog, output_dir: Path, shard: Optional[str] = None) -> Path:
+    """Grava o manifesto dos artigos catalogados em <output_dir>/manifest.json."""
+    output_dir = Path(output_dir)
+    records = catalog.export_records()
+    for record in records:
+        if record.get('output_path'):
+            record['output_path'] = os.path.relpath(record['output_path'], output_dir).replace(os.sep, '/')
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'shard': shard,
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'articles': records
+    }
+    manifest_path = output_dir / MANIFEST_NAME
+    manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=1), encoding='utf-8')
+    return manifest_path
+
+
+def read_manifest(manifest_path: Path) -> Dict[str, Any]:
+    """Lê um manifesto, validando a versão."""
+    manifest = json.loads(Path(manifest_path).read_text(encoding='utf-8'))
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError(f"Versão de manifesto não suportada em {manifest_path}: {manifest.get('version')}")
+    return manifest
+
+
+def import_manifest(catalog: ArticleCatalog, manifest: Dict[str, Any], output_dir: Path) -> int:
+    """
+    Carrega os artigos de um manifesto no catálogo, com os caminhos de saída
+    apontando para `output_dir`.
+
+    Returns:
+        int: número de artigos importados
+    """
+    for record in manifest['articles']:
+        record = dict(record)
+        if record.get('output_path'):
+            record['output_path'] = (Path(output_dir) / record['output_path']).as_posix()
+        catalog.import_record(record)
+    return len(manifest['articles'])
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+merge_shards.py
+
+Junção de um build distribuído (start.py --shard i/N).
+
+Cada shard gera os HTML dos seus artigos e um manifest.json parcial. Este
+script copia as saídas dos shards para a pasta final, carrega os manifestos
+em um catálogo em memória e gera os artefatos de todo o corpus (sitemap,
+feed, índice de busca e páginas de tag/categoria) sem renderizar nenhum
+artigo.
+
+Uso:
+    # Local, com vários processos e pastas de saída separadas:
+    python start.py --shard 1/3 & python start.py --shard 2/3 & python start.py --shard 3/3 & wait
+    python scripts/merge_shards.py
+
+    # Com as pastas dos shards coletadas de outras máquinas:
+    python scripts/merge_shards.py shard1/ shard2/ shard3/ --output output
+"""
+
+import sys
+import shutil
+import posixpath
+import logging
+import argparse
+from pathlib import Path
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from catalog import ArticleCatalog
+from manifest import MANIFEST_NAME, read_manifest, import_manifest
+from site_artifacts import build_site_artifacts
+
+try:
+    from config.seo_config import DEFAULT_CONFIG
+except ImportError:
+    DEFAULT_CONFIG = {'base_url': ''}
+
+DEFAULT_SHARD_GLOB = ".build/shard-*/output"
+
+
+def copy_shard_outputs(shard_dir: Path, manifest: dict, output_dir: Path) -> int:
+    """
+    Copia os HTML (e .html.gz) listados no manifesto, incluindo as páginas
+    2..N dos artigos paginados, e as imagens do shard.
+    """
+    copied = 0
+    for record in manifest['articles']:
+        relative = record.get('output_path')
+        if not relative:
+            continue
+        folder = posixpath.dirname(relative)
+        pages = [relative] + [posixpath.join(folder, page) for page in record.get('extra_pages') or []]
+        for name in [name for page in pages for name in (page, page + '.gz')]:
+            source = shard_dir / name
+            if source.exists():
+                destination = output_dir / name
+                destination.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source, destination)
+                copied += 1
+
+    images_dir = shard_dir / "images"
+    if images_dir.is_dir():
+        shutil.copytree(images_dir, output_dir / "images", dirs_exist_ok=True)
+    return copied
+
+
+def check_shard_set(manifests: dict) -> list:
+    """Verifica se todos os shards de 1 a N estão presentes; retorna os avisos."""
+    warnings = []
+    declared = {}
+    for shard_dir, manifest in manifests.items():
+        if manifest.get('shard'):
+            index, count = (int(part) for part in manifest['shard'].split('/'))
+            declared.setdefault(count, set()).add(index)
+
+    if len(declared) > 1:
+        warnings.append(f"Manifestos de partições diferentes: {sorted(declared)} shards")
+    for count, indexes in declared.items():
+        missing = sorted(set(range(1, count + 1)) - indexes)
+        if missing:
+            warnings.append(f"Shards ausentes (de {count}): {', '.join(map(str, missing))}")
+    return warnings
+
+
+def merge_shards(shard_dirs, output_dir: Path, base_url: str = '') -> int:
+    """
+    Junta as saídas dos shards em `output_dir` e gera os artefatos globais.
+
+    Returns:
+        int: 0 em caso de sucesso, 1 se houver erro
+    """
+    output_dir = Path(output_dir)
+    manifests = {}
+    for shard_dir in shard_dirs:
+        manifest_path = Path(shard_dir) / MANIFEST_NAME
+        if not manifest_path.exists():
+            print(f"[ERROR] Manifesto não encontrado: {manifest_path}")
+            return 1
+        try:
+            manifests[Path(shard_dir)] = read_manifest(manifest_path)
+        except ValueError as e:
+            print(f"[ERROR] {e}")
+            return 1
+
+    if not manifests:
+        print("[ERROR] Nenhum shard informado")
+        print(f"💡 Execute primeiro: python start.py --shard 1/N (saída padrão: {DEFAULT_SHARD_GLOB})")
+        return 1
+
+    for warning in check_shard_set(manifests):
+        print(f"[WARNING] {warning}")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    owners = {}
+    with ArticleCatalog(':memory:') as catalog:
+        for shard_dir, manifest in manifests.items():
+            for record in manifest['articles']:
+                if record['path'] in owners:
+                    print(f"[ERROR] {record['path']} aparece em dois shards: {owners[record['path']]} e {shard_dir}")
+                    return 1
+                owners[record['path']] = shard_dir
+
+            files = copy_shard_outputs(shard_dir, manifest, output_dir)
+            articles = import_manifest(catalog, manifest, output_dir)
+            print(f"[INFO] Shard {manifest.get('shard') or shard_dir}: {articles} artigo(s), {files} arquivo(s) copiado(s)")
+
+        build_site_artifacts(catalog, output_dir, base_url, force=True)
+        total = catalog.stats()['articles']
+
+    print(f"[INFO] Junção concluída: {total} artigo(s) em {output_dir}/")
+    return 0
+
+
+def main():
+    """Função principal."""
+    parser = argparse.ArgumentParser(description='Junta as saídas de um build distribuído (start.py --shard i/N)')
+    parser.add_argument('shards', nargs='*', help=f'Pastas de saída dos shards (padrão: {DEFAULT_SHARD_GLOB})')
+    parser.add_argument('--output', default='output', help='Pasta de saída final')
+    parser.add_argument('--base-url', default=DEFAULT_CONFIG['base_url'], help='URL base do site')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
+
+    shard_dirs = [Path(shard) for shard in args.shards] or sorted(Path('.').glob(DEFAULT_SHARD_GLOB))
+    sys.exit(merge_shards(shard_dirs, Path(args.output), args.base_url))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+page_budgets.py
+
+Orçamentos de peso por página, verificados no build.
+
+Depois de gravar um artigo, o build mede cada página gerada (a primeira e,
+em artigos paginados, as seguintes):
+
+- html_bytes: tamanho do HTML;
+- image_bytes: soma dos arquivos de imagem locais referenciados (<img src>),
+  já copiados para a saída;
+- render_blocking: recursos que bloqueiam a renderização no <head> (folhas
+  de estilo sem media="print" e scripts externos sem async/defer), como as
+  fontes do Google e o tema do highlight.js do template;
+- inline_script_bytes: JavaScript embutido na página (o JSON-LD não conta).
+
+Os limites padrão ficam em DEFAULT_BUDGETS e podem ser ajustados com a chave
+page_budgets em DEFAULT_CONFIG, em ARTICLE_CONFIGS ou no front matter do
+artigo (só as métricas informadas mudam); um limite None desliga a métrica.
+Os números de cada página vão para o relatório do build
+(.build/build_report.json), para que uma regressão apareça entre builds.
+"""
+
+from pathlib import Path
+from html.parser import HTMLParser
+from urllib.parse import unquote, urlsplit
+from typing import Any, Dict, List, Optional
+
+DEFAULT_BUDGETS = {
+    'html_bytes': 100 * 1024,
+    'image_bytes': 1024 * 1024,
+    'render_blocking': 2,
+    'inline_script_bytes': 2 * 1024
+}
+
+METRIC_LABELS = {
+    'html_bytes': 'HTML',
+    'image_bytes': 'imagens',
+    'render_blocking': 'recursos bloqueantes',
+    'inline_script_bytes': 'script embutido'
+}
+
+SCRIPT_TYPES = ('', 'text/javascript', 'application/javascript', 'module')
+
+
+class _WeightParser(HTMLParser):
+    """Coleta as imagens, os recursos bloqueantes do <head> e o tamanho dos scripts embutidos."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.images: List[str] = []
+        self.render_blocking: List[str] = []
+        self.inline_script_bytes = 0
+        self._in_head = False
+        self._inline_script = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'head':
+            self._in_head = True
+        elif tag == 'body':
+            self._in_head = False
+        elif tag == 'img' and attrs.get('src'):
+            self.images.append(attrs['src'])
+        elif tag == 'link' and self._in_head:
+            rel = (attrs.get('rel') or '').lower().split()
+            if 'stylesheet' in rel and (attrs.get('media') or 'all') not in ('print', 'none') and 'disabled' not in attrs:
+                self.render_blocking.append(attrs.get('href') or '')
+        elif tag == 'script':
+            script_type = (attrs.get('type') or '').lower()
+            if attrs.get('src'):
+                if self._in_head and 'async' not in attrs and 'defer' not in attrs and script_type != 'module':
+                    self.render_blocking.append(attrs['src'])
+            else:
+                self._inline_script = script_type in SCRIPT_TYPES
+
+    def handle_endtag(self, tag):
+        if tag == 'head':
+            self._in_head = False
+        elif tag == 'script':
+            self._inline_script = False
+
+    def handle_data(self, data):
+        if self._inline_script:
+            self.inline_script_bytes += len(data.encode('utf-8'))
+
+
+def resolve_budgets(config: Optional[Dict[str, Any]] = None) -> Dict[str, Optional[int]]:
+    """Limites do artigo: DEFAULT_BUDGETS sobrepostos pelo page_budgets da configuração."""
+    return {**DEFAULT_BUDGETS, **((config or {}).get('page_budgets') or {})}
+
+
+def local_image_path(src: str, page: Path, output_dir: Path) -> Optional[Path]:
+    """Arquivo da imagem na saída (None para imagens externas ou data:)."""
+    parts = urlsplit(src)
+    if parts.scheme or parts.netloc:
+        return None
+    path = unquote(parts.path)
+    if path.startswith('/'):
+        return Path(output_dir) / path.lstrip('/')
+    return Path(page).parent / path
+
+
+def measure_page(page: Path, output_dir: Path) -> Dict[str, Any]:
+    """
+    Mede uma página gerada.
+
+    Returns:
+        dict: html_bytes, image_bytes, images (locais encontradas),
+        render_blocking, render_blocking_urls e inline_script_bytes
+    """
+    page = Path(page)
+    data = page.read_bytes()
+    parser = _WeightParser()
+    parser.feed(data.decode('utf-8', errors='replace'))
+    parser.close()
+
+    image_files = set()
+    for src in parser.images:
+        path = local_image_path(src, page, output_dir)
+        if path is not None and path.is_file():
+            image_files.add(path.resolve())
+
+    return {
+        'html_bytes': len(data),
+        'image_bytes': sum(path.stat().st_size for path in image_files),
+        'images': len(image_files),
+        'render_blocking': len(parser.render_blocking),
+        'render_blocking_urls': parser.render_blocking,
+        'inline_script_bytes': parser.inline_script_bytes
+    }
+
+
+def over_budget(metrics: Dict[str, Any], budgets: Dict[str, Optional[int]]) -> List[Dict[str, Any]]:
+    """Métricas acima do limite: [{metric, value, budget}]."""
+    return [
+        {'metric': metric, 'value': metrics[metric], 'budget': budget}
+        for metric, budget in budgets.items()
+        if budget is not None and metric in metrics and metrics[metric] > budget
+    ]
+
+
+def format_metric(metric: str, value: int) -> str:
+    """Valor legível de uma métrica (bytes em KB)."""
+    if metric.endswith('_bytes'):
+        return f"{value / 1024:.1f} KB"
+    return str(value)
+
+
+def check_pages(pages: List[Path], output_dir: Path, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Mede as páginas de um artigo e compara com os limites.
+
+    Returns:
+        dict: {'pages': {arquivo: métricas}, 'violations': [{page, metric,
+        value, budget}]}
+    """
+    budgets = resolve_budgets(config)
+    measured = {}
+    violations = []
+    for page in pages:
+        page = Path(page)
+        metrics = measure_page(page, output_dir)
+        measured[page.name] = metrics
+        violations.extend(dict(violation, page=page.name) for violation in over_budget(metrics, budgets))
+    return {'pages': measured, 'violations': violations}
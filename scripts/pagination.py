@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+pagination.py
+
+Divisão de artigos muito longos em várias páginas.
+
+O corte acontece no corpo já renderizado (render_body), nos títulos <h2> do
+nível principal: o Markdown não é renderizado de novo, e um corpo vindo do
+cache de corpos é paginado sem custo extra. As seções são agrupadas em
+ordem até o orçamento de palavras e/ou bytes de cada página; uma seção maior
+que o orçamento fica sozinha na sua página.
+
+A primeira página mantém o nome do artigo e as seguintes ganham um sufixo:
+
+    output/guia-completo.html
+    output/guia-completo-pagina-2.html
+    output/guia-completo-pagina-3.html
+
+Cada página leva o índice combinado (todas as seções, com links entre as
+páginas), a navegação entre páginas, <link rel="prev/next"> e a própria URL
+como canônica.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PAGE_SUFFIX = "-pagina-"
+
+# Os blocos do corpo começam no início da linha; <h2 dentro de <pre> vem escapado
+H2_BOUNDARY = re.compile(r'^(?=<h2[\s>])', re.MULTILINE)
+H2_HEADING = re.compile(r'<h2[^>]*?\bid="(?P<id>[^"]*)"[^>]*>(?P<title>.*?)</h2>', re.DOTALL)
+TAG = re.compile(r'<[^>]+>')
+ELEMENT_ID = re.compile(r'<[a-zA-Z][^>]*?\sid="([^"]+)"')
+LOCAL_HREF = re.compile(r'href="#([^"]+)"')
+
+
+def page_file_name(stem: str, number: int) -> str:
+    """Nome do arquivo da página (a primeira mantém o nome do artigo)."""
+    return f"{stem}.html" if number == 1 else f"{stem}{PAGE_SUFFIX}{number}.html"
+
+
+def split_sections(html_body: str) -> List[str]:
+    """Corta o corpo antes de cada <h2> do nível principal (a introdução fica na primeira parte)."""
+    return [part for part in H2_BOUNDARY.split(html_body) if part.strip()]
+
+
+def section_words(fragment: str) -> int:
+    """Palavras do texto de um trecho de HTML."""
+    return len(TAG.sub(' ', fragment).split())
+
+
+def plan_pages(sections: List[str], max_words: Optional[int] = None,
+               max_bytes: Optional[int] = None) -> List[List[str]]:
+    """Agrupa as seções em páginas, em ordem, sem passar do orçamento (exceto seções maiores que ele)."""
+    pages: List[List[str]] = []
+    words = size = 0
+    for section in sections:
+        section_size = len(section.encode('utf-8'))
+        count = section_words(section) if max_words else 0
+        fits = pages and (not max_words or words + count <= max_words) and (not max_bytes or size + section_size <= max_bytes)
+        if not fits:
+            pages.append([])
+            words = size = 0
+        pages[-1].append(section)
+        words += count
+        size += section_size
+    return pages
+
+
+def paginate(html_body: str, stem: str, max_words: Optional[int] = None,
+             max_bytes: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Divide o corpo em páginas.
+
+    Returns:
+        list: uma entrada por página com number, file, html_body, anchors
+        (ids dos elementos da página) e headings ([(id, título)] dos <h2> da
+        página); uma só entrada se o corpo couber
+    """
+    pages = []
+    anchors = {}
+    for number, sections in enumerate(plan_pages(split_sections(html_body), max_words, max_bytes), 1):
+        html = '\n'.join(sections)
+        file = page_file_name(stem, number)
+        page_anchors = ELEMENT_ID.findall(html)
+        anchors.update((anchor, file) for anchor in page_anchors)
+        pages.append({
+            'number': number,
+            'file': file,
+            'html_body': html,
+            'anchors': page_anchors,
+            'headings': [(match.group('id'), TAG.sub('', match.group('title')).strip())
+                         for match in H2_HEADING.finditer(html)]
+        })
+
+    # Links internos (#secao) para uma seção que foi para outra página
+    if len(pages) > 1:
+        for page in pages:
+            def relink(match, current=page['file']):
+                target = anchors.get(match.group(1), current)
+                return match.group(0) if target == current else f'href="{target}#{match.group(1)}"'
+            page['html_body'] = LOCAL_HREF.sub(relink, page['html_body'])
+    return pages
+
+
+def table_of_contents(pages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Índice combinado: cada <h2> de todas as páginas, com o link para a página certa."""
+    return [
+        {'page': page['number'], 'href': f"{page['file']}#{anchor}", 'anchor': anchor, 'title': title}
+        for page in pages
+        for anchor, title in page['headings']
+    ]
+
+
+def write_extra_pages(output_file: Path, extra_pages: Optional[Dict[str, str]]) -> List[Path]:
+    """
+    Grava as páginas 2..N ao lado da primeira e remove páginas que sobraram
+    de um build anterior (artigo que encolheu ou deixou de ser paginado).
+
+    Returns:
+        list: caminhos das páginas gravadas
+    """
+    output_file = Path(output_file)
+    extra_pages = extra_pages or {}
+    written = []
+    for name, html in extra_pages.items():
+        path = output_file.parent / name
+        path.write_text(html, encoding='utf-8')
+        written.append(path)
+
+    page_name = re.compile(re.escape(output_file.stem + PAGE_SUFFIX) + r'\d+\.html(?:\.gz)?')
+    for stale in output_file.parent.glob(f"{output_file.stem}{PAGE_SUFFIX}*"):
+        if page_name.fullmatch(stale.name) and stale.name.split('.html', 1)[0] + '.html' not in extra_pages:
+            stale.unlink()
+    return written
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+reading_stats.py
+
+Tempo de leitura calculado a partir das contagens da renderização.
+
+Em vez do tempo digitado à mão em ARTICLE_CONFIGS ("15 min"), o conversor
+conta, no mesmo pós-processamento que já percorre o HTML, as palavras do
+texto corrido, as linhas de código e as imagens. O tempo estimado é:
+
+    palavras / 200 por minuto
+    + linhas de código / 20 por minuto (código é lido mais devagar)
+    + 12 s pela primeira imagem, 11 s pela segunda... (mínimo de 3 s cada)
+
+O resultado vai para as tags meta, para o JSON-LD (timeRequired e
+wordCount) e para o catálogo/manifesto. Um reading_time no front matter do
+artigo continua tendo precedência.
+"""
+
+import re
+import math
+from typing import Dict, Iterable, Iterator, Optional
+
+WORDS_PER_MINUTE = 200
+CODE_LINES_PER_MINUTE = 20
+IMAGE_SECONDS = 12
+MIN_IMAGE_SECONDS = 3
+
+FENCE = re.compile(r'^\s*(`{3,}|~{3,})')
+MARKDOWN_IMAGE = re.compile(r'!\[[^\]]*\]\(')
+
+
+def reading_minutes(prose_words: int, code_lines: int = 0, image_count: int = 0) -> int:
+    """Minutos de leitura estimados (arredondados para cima, mínimo de 1)."""
+    seconds = prose_words * 60 / WORDS_PER_MINUTE + code_lines * 60 / CODE_LINES_PER_MINUTE
+    seconds += sum(max(MIN_IMAGE_SECONDS, IMAGE_SECONDS - index) for index in range(image_count))
+    return max(1, math.ceil(seconds / 60))
+
+
+def format_reading_time(minutes: int) -> str:
+    """Texto exibido (mesmo formato do reading_time das configurações: "8 min")."""
+    return f"{minutes} min"
+
+
+def iso_duration(reading_time: Optional[str]) -> Optional[str]:
+    """Duração ISO 8601 para o Schema.org ("8 min" → "PT8M"); None se não houver número."""
+    match = re.search(r'\d+', str(reading_time or ''))
+    return f"PT{int(match.group())}M" if match else None
+
+
+def summarize(prose_words: int, code_lines: int, image_count: int) -> Dict[str, int]:
+    """Contagens do artigo com o tempo de leitura estimado."""
+    return {
+        'prose_words': prose_words,
+        'code_lines': code_lines,
+        'image_count': image_count,
+        'reading_minutes': reading_minutes(prose_words, code_lines, image_count)
+    }
+
+
+class MarkdownStats:
+    """
+    Contagens aproximadas direto do Markdown, linha a linha.
+
+    Usado no modo para documentos grandes, em que o cabeçalho da página
+    (tags meta e JSON-LD) é gravado antes de as seções serem renderizadas.
+    """
+
+    def __init__(self):
+        self.prose_words = 0
+        self.code_lines = 0
+        self.image_count = 0
+
+    def count(self, lines: Iterable[str]) -> Iterator[str]:
+        """Repassa as linhas contando palavras, linhas de código e imagens."""
+        fence = None
+        for line in lines:
+            match = FENCE.match(line)
+            if match and (fence is None or match.group(1)[0] == fence[0] and len(match.group(1)) >= len(fence)):
+                fence = match.group(1) if fence is None else None
+            elif fence is not None:
+                self.code_lines += bool(line.strip())
+            else:
+                self.image_count += len(MARKDOWN_IMAGE.findall(line))
+                self.prose_words += len(line.replace('#', ' ').split())
+            yield line
+
+    def summary(self) -> Dict[str, int]:
+        """Contagens e tempo de leitura (ver summarize)."""
+        return summarize(self.prose_words, self.code_lines, self.image_count)
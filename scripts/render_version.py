@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+render_version.py
+
+Versão do código que renderiza os artigos.
+
+A página gerada não depende só do conversor (format-html-seo.py): depende
+também dos módulos de scripts/ que ele importa, direta ou indiretamente
+(front matter, includes, paginação, tempo de leitura, índice de títulos,
+imagens, documentos grandes...), e da navegação das séries (series.py). Os
+imports de nível de módulo desses arquivos são lidos com ast, sem importar
+nada, e o conjunto resultante é a base de:
+
+- a versão das páginas no cache de build (BuildCache.version);
+- o nó "conversor" do grafo de dependências (dependency_graph.py);
+- a versão dos corpos em cache (body_version, no conversor);
+- o recarregamento do daemon de conversão quando algum arquivo muda.
+
+Imports feitos dentro de funções (ex.: o cliente do daemon no modo linha de
+comando) não entram: não fazem parte da renderização.
+"""
+
+import ast
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Set
+
+from catalog import build_fingerprint, file_digest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+CONVERTER_PATH = SCRIPTS_DIR / "format-html-seo.py"
+RENDER_ROOTS = (CONVERTER_PATH, SCRIPTS_DIR / "series.py")
+
+
+def _module_imports(nodes: Iterable[ast.stmt]) -> Iterable[str]:
+    """Nomes importados no nível do módulo (inclusive dentro de try/if), sem entrar em funções e classes."""
+    for node in nodes:
+        if isinstance(node, ast.Import):
+            yield from (alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.module and not node.level:
+                yield node.module.split('.')[0]
+        elif isinstance(node, (ast.Try, ast.If)):
+            for block in (node.body, node.orelse, getattr(node, 'finalbody', []),
+                          *(handler.body for handler in getattr(node, 'handlers', []))):
+                yield from _module_imports(block)
+
+
+def local_imports(path: Path) -> Set[Path]:
+    """Arquivos de scripts/ importados no nível do módulo por `path`."""
+    stat = Path(path).stat()
+    return set(_local_imports(Path(path), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=None)
+def _local_imports(path: Path, mtime_ns: int, size: int) -> frozenset:
+    """local_imports memorizado pelo mtime e tamanho (o daemon consulta a cada trabalho)."""
+    tree = ast.parse(path.read_text(encoding='utf-8'), filename=str(path))
+    found = set()
+    for name in _module_imports(tree.body):
+        candidate = SCRIPTS_DIR / f"{name}.py"
+        if candidate.is_file():
+            found.add(candidate)
+    return frozenset(found)
+
+
+def render_modules(roots: Iterable[Path] = RENDER_ROOTS) -> List[Path]:
+    """Os arquivos de `roots` e todos os módulos de scripts/ que eles importam, em ordem."""
+    pending = [Path(root).resolve() for root in roots]
+    seen: Set[Path] = set()
+    while pending:
+        path = pending.pop()
+        if path in seen or not path.is_file():
+            continue
+        seen.add(path)
+        pending.extend(local_imports(path) - seen)
+    return sorted(seen)
+
+
+def files_digest(paths: Iterable[Path]) -> str:
+    """Impressão digital de um conjunto de arquivos (hash de cada um, pelo nome)."""
+    return build_fingerprint([(Path(path).name, file_digest(path)) for path in paths])
+
+
+def render_digest(roots: Iterable[Path] = RENDER_ROOTS) -> str:
+    """Impressão digital do código de renderização."""
+    return files_digest(render_modules(roots))
+
+
+def render_mtimes(roots: Iterable[Path] = RENDER_ROOTS) -> Dict[Path, int]:
+    """mtime (ns) de cada arquivo do código de renderização."""
+    return {path: path.stat().st_mtime_ns for path in render_modules(roots)}
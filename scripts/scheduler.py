@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+scheduler.py
+
+Ordenação dos trabalhos de conversão pelo custo esperado (maior primeiro).
+
+Em um build paralelo, a ordem de `glob("*.md")` decide o escalonamento: um
+guia longo que começa por último deixa o build esperando só por ele. Aqui os
+trabalhos são ordenados do mais caro para o mais barato (LPT - longest
+processing time first), o que aproxima o menor tempo total (makespan).
+
+O custo de cada artigo vem do relatório do build anterior
+(.build/build_report.json, soma dos tempos das etapas) e, sem histórico, do
+tamanho do arquivo-fonte convertido pela taxa ms/byte observada.
+
+Para builds distribuídos (start.py --shard i/N), assign_shards() reparte o
+corpus entre N máquinas de forma determinística.
+"""
+
+import json
+import heapq
+import hashlib
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+DEFAULT_REPORT_PATH = Path(".build") / "build_report.json"
+
+# Taxa usada quando ainda não há nenhum histórico (ms por byte do Markdown)
+DEFAULT_MS_PER_BYTE = 0.005
+
+
+def load_build_report(report_path: Path = DEFAULT_REPORT_PATH) -> Dict[str, Any]:
+    """Lê o relatório do build anterior (vazio se não existir ou estiver corrompido)."""
+    report_path = Path(report_path)
+    if not report_path.exists():
+        return {}
+    try:
+        return json.loads(report_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError) as e:
+        logging.warning(f"Relatório de build ignorado ({report_path}): {e}")
+        return {}
+
+
+def write_build_report(report: Dict[str, Any], report_path: Path = DEFAULT_REPORT_PATH):
+    """Grava o relatório do build."""
+    report_path = Path(report_path)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+
+
+def job_cost_ms(info: Dict[str, Any]) -> float:
+    """Custo de um artigo convertido: soma dos tempos das etapas (sem espera em fila)."""
+    return round(sum((info.get('timings') or {}).values()), 3)
+
+
+def ms_per_byte(history: Dict[str, Dict[str, Any]]) -> float:
+    """Taxa ms/byte observada no histórico (ou o padrão, sem histórico)."""
+    total_ms = sum(entry.get('cost_ms') or 0 for entry in history.values() if entry.get('bytes_in'))
+    total_bytes = sum(entry.get('bytes_in') or 0 for entry in history.values() if entry.get('cost_ms'))
+    if total_ms > 0 and total_bytes > 0:
+        return total_ms / total_bytes
+    return DEFAULT_MS_PER_BYTE
+
+
+def estimate_costs(jobs: List[Dict[str, Any]], report: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Estima o custo (ms) de cada trabalho.
+
+    Artigos com histórico usam o custo medido no último build, ajustado se o
+    tamanho do arquivo mudou; os demais usam tamanho × taxa ms/byte.
+    """
+    history = report.get('articles', {})
+    rate = ms_per_byte(history)
+    costs = {}
+    for job in jobs:
+        size = Path(job['md_file']).stat().st_size
+        entry = history.get(job['name'])
+        if entry and entry.get('cost_ms') and entry.get('bytes_in'):
+            costs[job['name']] = entry['cost_ms'] * size / entry['bytes_in']
+        else:
+            costs[job['name']] = size * rate
+    return costs
+
+
+def order_longest_first(jobs: List[Dict[str, Any]], costs: Dict[str, float]) -> List[Dict[str, Any]]:
+    """Ordena os trabalhos do maior para o menor custo (nome desempata)."""
+    return sorted(jobs, key=lambda job: (-costs.get(job['name'], 0.0), job['name']))
+
+
+def predict_makespan(ordered_costs: List[float], workers: int) -> float:
+    """Simula o escalonamento guloso (próximo trabalho no trabalhador livre) e devolve o tempo total em ms."""
+    finish_times = [0.0] * max(1, workers)
+    for cost in ordered_costs:
+        earliest = heapq.heappop(finish_times)
+        heapq.heappush(finish_times, earliest + cost)
+    return round(max(finish_times), 3)
+
+
+def build_report(previous: Dict[str, Any], schedule: Dict[str, Any],
+                 converted: Dict[str, Dict[str, Any]], actual_makespan_ms: float) -> Dict[str, Any]:
+    """
+    Monta o novo relatório: escalonamento escolhido, makespan previsto e real, e
+    o histórico por artigo (artigos não convertidos mantêm a medição anterior).
+    """
+    articles = dict(previous.get('articles', {}))
+    for name, data in converted.items():
+        if (not data['success'] or data.get('cached')) and name in articles:
+            # Falhas e restaurações do cache não medem a renderização: mantém o custo
+            # anterior (as medidas das páginas gravadas, se houver, são as novas)
+            measured = {key: data[key] for key in ('pages', 'budget_violations') if key in data}
+            data = {**articles[name], 'success': data['success'], **measured}
+        articles[name] = data
+
+    return {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'workers': schedule['workers'],
+        'order': schedule['order'],
+        'predicted_costs_ms': {name: round(cost, 3) for name, cost in schedule['costs'].items()},
+        'predicted_makespan_ms': schedule['predicted_makespan_ms'],
+        'actual_makespan_ms': round(actual_makespan_ms, 3),
+        'articles': articles
+    }
+
+
+def plan_schedule(jobs: List[Dict[str, Any]], workers: int, report: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Ordena os trabalhos pelo custo esperado e prevê o tempo total.
+
+    Returns:
+        dict: {'jobs': trabalhos ordenados, 'order': nomes, 'costs': custo por
+        artigo, 'workers': trabalhadores, 'predicted_makespan_ms': previsão}
+    """
+    costs = estimate_costs(jobs, report)
+    ordered = order_longest_first(jobs, costs)
+    return {
+        'jobs': ordered,
+        'order': [job['name'] for job in ordered],
+        'costs': costs,
+        'workers': workers,
+        'predicted_makespan_ms': predict_makespan([costs[job['name']] for job in ordered], workers)
+    }
+
+
+def stream_schedule(jobs: Iterable[Dict[str, Any]], workers: int) -> Dict[str, Any]:
+    """
+    Escalonamento do modo streaming: os trabalhos seguem na ordem de
+    descoberta, sem previsão (ordenar pelo custo exigiria a lista completa).
+
+    Returns:
+        dict: mesmo formato de plan_schedule; 'jobs' é um gerador e 'order'
+        é preenchida à medida que os trabalhos são consumidos
+    """
+    order = []
+
+    def feed():
+        for job in jobs:
+            order.append(job['name'])
+            yield job
+
+    return {
+        'jobs': feed(),
+        'order': order,
+        'costs': {},
+        'workers': workers,
+        'predicted_makespan_ms': 0.0
+    }
+
+
+def stable_hash(name: str) -> int:
+    """Hash estável do nome do artigo (igual em qualquer máquina e execução)."""
+    return int(hashlib.sha1(name.encode('utf-8')).hexdigest()[:12], 16)
+
+
+def assign_shards(jobs: List[Dict[str, Any]], shard_count: int) -> Dict[str, int]:
+    """
+    Reparte os trabalhos entre `shard_count` shards, equilibrando o custo.
+
+    O custo usado é o tamanho da fonte (o relatório de build é local de cada
+    máquina e daria partições diferentes em cada nó). Os trabalhos são
+    distribuídos do maior para o menor, sempre no shard menos carregado; o
+    hash estável desempata, então todos os nós chegam à mesma partição sem
+    depender da ordem do glob.
+
+    Returns:
+        dict: nome do artigo → índice do shard (0 a shard_count - 1)
+    """
+    costs = {job['name']: Path(job['md_file']).stat().st_size + 1 for job in jobs}
+    ordered = sorted(jobs, key=lambda job: (-costs[job['name']], stable_hash(job['name'])))
+    loads = [(0, shard) for shard in range(shard_count)]
+    assignment = {}
+    for job in ordered:
+        load, shard = heapq.heappop(loads)
+        assignment[job['name']] = shard
+        heapq.heappush(loads, (load + costs[job['name']], shard))
+    return assignment
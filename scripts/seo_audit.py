@@ -0,0 +1,552 @@
+#!/usr/bin/env python3
+"""
+seo_audit.py
+
+Auditoria de SEO das páginas geradas (pasta output/).
+
+São auditadas as páginas dos artigos, inclusive as páginas 2..N dos artigos
+paginados, a partir dos output_path do catálogo. As listagens por tag e
+por categoria (listing_pages.py) não têm og:image nem description própria e
+ficam de fora; --all-pages audita todos os HTML da saída.
+
+Cada regra é uma função registrada com o decorador @rule; ela recebe os
+dados extraídos da página (título, tags meta, títulos <h1>, imagens...) e o
+contexto da auditoria, e gera as violações encontradas. Outras regras podem
+ser carregadas com --rules modulo (o módulo só precisa registrar as suas
+funções com @rule) e selecionadas com --only/--skip.
+
+As páginas são auditadas em um pool de processos, com o tempo gasto por
+regra. O resultado de cada página fica no manifesto da auditoria
+(.build/audit_manifest.json); na próxima execução, só as páginas alteradas
+(tamanho/mtime e, se preciso, SHA-256) são auditadas de novo. Mudanças nas
+regras ou nos limites invalidam o manifesto inteiro, e uma página também é
+reauditada quando muda algum arquivo que as regras consultaram (ex.: a
+imagem do og:image passou a existir).
+
+Uso:
+    python scripts/seo_audit.py
+    python scripts/seo_audit.py --json > audit.json
+    python scripts/seo_audit.py --only title-length description-truncated --force
+    python scripts/seo_audit.py --rules minhas_regras --fail-on warning
+    python scripts/seo_audit.py --all-pages
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import inspect
+import argparse
+import importlib
+from pathlib import Path
+from html.parser import HTMLParser
+from urllib.parse import unquote, urlsplit
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from config.seo_config import DEFAULT_CONFIG
+except ImportError:
+    DEFAULT_CONFIG = {'base_url': ''}
+
+from catalog import ArticleCatalog, DEFAULT_CATALOG_PATH
+
+DEFAULT_MANIFEST_PATH = Path('.build') / 'audit_manifest.json'
+MANIFEST_VERSION = 1
+CHUNK_SIZE = 16
+
+TITLE_MAX_LENGTH = 60
+DESCRIPTION_MIN_LENGTH = 50
+DESCRIPTION_MAX_LENGTH = 160
+SENTENCE_END = '.!?…)"\''
+
+SEVERITIES = ('error', 'warning')
+
+
+class Rule:
+    """Regra de auditoria registrada (ver @rule)."""
+
+    def __init__(self, name: str, severity: str, function: Callable, description: str):
+        self.name = name
+        self.severity = severity
+        self.function = function
+        self.description = description
+
+    def source(self) -> str:
+        """Código da regra (entra na versão do manifesto)."""
+        try:
+            return inspect.getsource(self.function)
+        except (OSError, TypeError):
+            return self.function.__qualname__
+
+
+RULES: Dict[str, Rule] = {}
+
+
+def rule(name: str, severity: str = 'warning'):
+    """
+    Registra uma regra de auditoria.
+
+    A função recebe (page, context) e gera mensagens (str) para cada
+    violação. Exemplo:
+
+        @rule('title-present', severity='error')
+        def title_present(page, context):
+            if not page.title:
+                yield "página sem <title>"
+    """
+    if severity not in SEVERITIES:
+        raise ValueError(f"Severidade inválida para {name}: {severity}")
+
+    def register(function):
+        RULES[name] = Rule(name, severity, function, (function.__doc__ or '').strip())
+        return function
+    return register
+
+
+class PageFacts(HTMLParser):
+    """Dados da página usados pelas regras, extraídos em uma única leitura."""
+
+    def __init__(self, name: str):
+        super().__init__(convert_charrefs=True)
+        self.name = name
+        self.lang = None
+        self.title = None
+        self.meta: Dict[str, str] = {}
+        self.links: Dict[str, str] = {}
+        self.h1: List[str] = []
+        self.images_without_alt: List[str] = []
+        self._text_target = None
+        self._text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'html':
+            self.lang = attrs.get('lang')
+        elif tag == 'meta':
+            key = attrs.get('name') or attrs.get('property')
+            if key and 'content' in attrs and key not in self.meta:
+                self.meta[key] = attrs['content'] or ''
+        elif tag == 'link' and attrs.get('rel') and attrs.get('href') is not None:
+            self.links.setdefault(attrs['rel'], attrs['href'])
+        elif tag == 'img':
+            if not attrs.get('alt'):
+                self.images_without_alt.append(attrs.get('src') or '')
+        elif tag in ('title', 'h1') and self._text_target is None:
+            self._text_target = tag
+            self._text = []
+
+    def handle_startendtag(self, tag, attrs):
+        if tag not in ('title', 'h1'):
+            self.handle_starttag(tag, attrs)
+
+    def handle_data(self, data):
+        if self._text_target:
+            self._text.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == self._text_target:
+            text = ' '.join(''.join(self._text).split())
+            if tag == 'title':
+                self.title = text if self.title is None else self.title
+            else:
+                self.h1.append(text)
+            self._text_target = None
+
+
+class AuditContext:
+    """
+    Contexto da auditoria: pasta de saída, URL base e limites. Registra os
+    arquivos consultados pelas regras (file_exists), que passam a fazer
+    parte da validade do resultado da página no manifesto.
+    """
+
+    def __init__(self, output_dir: Path, base_url: str = '', limits: Optional[Dict[str, int]] = None):
+        self.output_dir = Path(output_dir)
+        self.base_url = base_url.rstrip('/')
+        self.limits = dict(limits or {})
+        self.checked_files: Dict[str, bool] = {}
+
+    def local_path(self, page: str, url: str) -> Optional[str]:
+        """Caminho na saída (relativo, com '/') de uma URL do próprio site; None se externa."""
+        if self.base_url and url.startswith(self.base_url + '/'):
+            url = url[len(self.base_url):]
+        parts = urlsplit(url)
+        if parts.scheme or parts.netloc:
+            return None
+        path = unquote(parts.path)
+        if path.startswith('/'):
+            return os.path.normpath(path.lstrip('/')).replace(os.sep, '/')
+        return os.path.normpath(os.path.join(os.path.dirname(page), path)).replace(os.sep, '/')
+
+    def file_exists(self, relative_path: str) -> bool:
+        """Indica se o arquivo existe na saída (e registra a consulta)."""
+        exists = (self.output_dir / relative_path).is_file()
+        self.checked_files[relative_path] = exists
+        return exists
+
+
+# ----------------------------------------------------------------------
+# Regras padrão
+# ----------------------------------------------------------------------
+
+@rule('title-present', severity='error')
+def title_present(page, context):
+    """A página tem um <title> não vazio."""
+    if not page.title:
+        yield "página sem <title>"
+
+
+@rule('title-length')
+def title_length(page, context):
+    """O <title> cabe no resultado de busca (TITLE_MAX_LENGTH caracteres)."""
+    limit = context.limits.get('title_max_length', TITLE_MAX_LENGTH)
+    if page.title and len(page.title) > limit:
+        yield f"título com {len(page.title)} caracteres (máximo recomendado: {limit})"
+
+
+@rule('description-present', severity='error')
+def description_present(page, context):
+    """A página tem <meta name="description">."""
+    if not page.meta.get('description', '').strip():
+        yield "página sem meta description"
+
+
+@rule('description-length')
+def description_length(page, context):
+    """A meta description tem entre DESCRIPTION_MIN_LENGTH e DESCRIPTION_MAX_LENGTH caracteres."""
+    description = page.meta.get('description', '').strip()
+    minimum = context.limits.get('description_min_length', DESCRIPTION_MIN_LENGTH)
+    maximum = context.limits.get('description_max_length', DESCRIPTION_MAX_LENGTH)
+    if description and len(description) < minimum:
+        yield f"description com {len(description)} caracteres (mínimo recomendado: {minimum})"
+    elif len(description) > maximum:
+        yield f"description com {len(description)} caracteres (máximo recomendado: {maximum})"
+
+
+@rule('description-truncated')
+def description_truncated(page, context):
+    """A meta description não foi cortada no meio de uma palavra (corte de extract_meta_info)."""
+    description = page.meta.get('description', '').strip()
+    maximum = context.limits.get('description_max_length', DESCRIPTION_MAX_LENGTH)
+    if len(description) >= maximum - 5 and description[-1] not in SENTENCE_END:
+        yield f"description cortada no meio de uma palavra: \"…{description[-30:]}\""
+
+
+@rule('single-h1', severity='error')
+def single_h1(page, context):
+    """A página tem exatamente um <h1>."""
+    if len(page.h1) != 1:
+        yield f"{len(page.h1)} títulos <h1> (esperado: 1)"
+
+
+@rule('og-image-exists', severity='error')
+def og_image_exists(page, context):
+    """O og:image existe na pasta de saída (quando aponta para o próprio site)."""
+    image = page.meta.get('og:image', '').strip()
+    if not image:
+        yield "página sem og:image"
+        return
+    local = context.local_path(page.name, image)
+    if local is not None and not context.file_exists(local):
+        yield f"og:image inexistente na saída: {local}"
+
+
+@rule('canonical-url')
+def canonical_url(page, context):
+    """A página declara uma URL canônica absoluta."""
+    canonical = page.links.get('canonical', '')
+    if not canonical:
+        yield "página sem <link rel=\"canonical\"> (defina base_url ou canonical_url)"
+    elif not urlsplit(canonical).scheme:
+        yield f"URL canônica relativa: {canonical}"
+
+
+@rule('html-lang')
+def html_lang(page, context):
+    """O elemento <html> declara o idioma."""
+    if not page.lang:
+        yield "<html> sem atributo lang"
+
+
+@rule('img-alt')
+def img_alt(page, context):
+    """Todas as imagens têm texto alternativo."""
+    for src in page.images_without_alt:
+        yield f"imagem sem alt: {src}"
+
+
+# ----------------------------------------------------------------------
+# Execução
+# ----------------------------------------------------------------------
+
+def load_rule_modules(modules: List[str]):
+    """Importa módulos com regras adicionais (registradas com @rule)."""
+    for module in modules:
+        importlib.import_module(module)
+
+
+def select_rules(only: Optional[List[str]] = None, skip: Optional[List[str]] = None) -> List[Rule]:
+    """Regras a executar, na ordem de registro."""
+    unknown = [name for name in (only or []) + (skip or []) if name not in RULES]
+    if unknown:
+        raise ValueError(f"Regra(s) desconhecida(s): {', '.join(unknown)}")
+    return [entry for name, entry in RULES.items()
+            if (not only or name in only) and name not in (skip or [])]
+
+
+def rules_version(rules: List[Rule], base_url: str, limits: Dict[str, int]) -> str:
+    """Versão do conjunto de regras (código, severidades e limites) usada no manifesto."""
+    parts = [(entry.name, entry.severity, entry.source()) for entry in rules]
+    payload = json.dumps([MANIFEST_VERSION, parts, base_url, limits], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def audit_page(name: str, html: str, rules: List[Rule], context: AuditContext) -> Dict[str, Any]:
+    """
+    Audita uma página.
+
+    Returns:
+        dict: violations ([{rule, severity, message}]), timings (ms por
+        regra) e checked_files (arquivos consultados e se existiam)
+    """
+    page = PageFacts(name)
+    page.feed(html)
+    page.close()
+
+    context.checked_files = {}
+    violations = []
+    timings = {}
+    for entry in rules:
+        started = time.perf_counter()
+        for message in entry.function(page, context) or ():
+            violations.append({'rule': entry.name, 'severity': entry.severity, 'message': message})
+        timings[entry.name] = (time.perf_counter() - started) * 1000
+    return {'violations': violations, 'timings': timings, 'checked_files': dict(context.checked_files)}
+
+
+# Regras e contexto de cada processo do pool
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(modules: List[str], rule_names: List[str], output_dir: str, base_url: str, limits: Dict[str, int]):
+    load_rule_modules(modules)
+    _worker['rules'] = [RULES[name] for name in rule_names]
+    _worker['context'] = AuditContext(Path(output_dir), base_url, limits)
+
+
+def _audit_batch(names: List[str]) -> List[Tuple[str, Dict[str, Any]]]:
+    context = _worker['context']
+    results = []
+    for name in names:
+        html = (context.output_dir / name).read_text(encoding='utf-8', errors='replace')
+        results.append((name, audit_page(name, html, _worker['rules'], context)))
+    return results
+
+
+def page_digest(path: Path) -> str:
+    """SHA-256 do conteúdo de uma página."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def load_manifest(path: Path, version: str) -> Dict[str, Any]:
+    """Resultados da última auditoria (vazio se o manifesto não existir ou as regras mudaram)."""
+    try:
+        manifest = json.loads(Path(path).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return manifest.get('pages', {}) if manifest.get('rules_version') == version else {}
+
+
+def save_manifest(path: Path, version: str, pages: Dict[str, Any]):
+    """Grava o manifesto da auditoria."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    manifest = {'version': MANIFEST_VERSION, 'rules_version': version, 'pages': pages}
+    path.write_text(json.dumps(manifest, ensure_ascii=False, indent=1), encoding='utf-8')
+
+
+def is_unchanged(entry: Optional[Dict[str, Any]], path: Path, output_dir: Path) -> bool:
+    """
+    Indica se o resultado guardado da página ainda vale: mesmo conteúdo
+    (tamanho/mtime ou SHA-256) e os arquivos consultados pelas regras no
+    mesmo estado. Atualiza tamanho/mtime da entrada quando só o mtime mudou.
+    """
+    if not entry:
+        return False
+    stat = path.stat()
+    if (entry['size'], entry['mtime_ns']) != (stat.st_size, stat.st_mtime_ns):
+        if entry['size'] != stat.st_size or entry['digest'] != page_digest(path):
+            return False
+        entry.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+    return all((output_dir / name).is_file() == exists for name, exists in entry.get('checked_files', {}).items())
+
+
+def article_pages(catalog: ArticleCatalog, output_dir: Path) -> List[str]:
+    """Páginas dos artigos catalogados (a primeira e as 2..N), relativas à pasta de saída."""
+    names = []
+    for row in catalog.articles():
+        first = os.path.relpath(row['output_path'], output_dir).replace(os.sep, '/')
+        folder = os.path.dirname(first)
+        names.append(first)
+        names.extend(f"{folder}/{name}" if folder else name for name in catalog.extra_pages_for(row['path']))
+    return names
+
+
+def run_audit(output_dir: Path, rules: List[Rule], base_url: str = '', limits: Optional[Dict[str, int]] = None,
+              manifest_path: Optional[Path] = DEFAULT_MANIFEST_PATH, jobs: int = 1, force: bool = False,
+              modules: Optional[List[str]] = None, pages: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Audita as páginas HTML da saída, reaproveitando do manifesto as que não mudaram.
+
+    Args:
+        pages (list): páginas a auditar, relativas à saída (padrão: todos os
+            HTML de output_dir; ver article_pages)
+
+    Returns:
+        dict: pages, audited, reused, violations ([{page, rule, severity,
+        message}]), rules ({regra: {severity, ms, violations}}) e seconds
+    """
+    started = time.perf_counter()
+    output_dir = Path(output_dir)
+    limits = limits or {}
+    version = rules_version(rules, base_url, limits)
+    previous = {} if force or manifest_path is None else load_manifest(manifest_path, version)
+
+    if pages is None:
+        names = sorted(path.relative_to(output_dir).as_posix() for path in output_dir.rglob('*.html'))
+    else:
+        names = sorted(name for name in set(pages) if (output_dir / name).is_file())
+    pages = {}
+    pending = []
+    for name in names:
+        if is_unchanged(previous.get(name), output_dir / name, output_dir):
+            pages[name] = previous[name]
+        else:
+            pending.append(name)
+
+    worker_args = (modules or [], [entry.name for entry in rules], str(output_dir), base_url, limits)
+    if jobs > 1 and len(pending) > CHUNK_SIZE:
+        batches = [pending[start:start + CHUNK_SIZE] for start in range(0, len(pending), CHUNK_SIZE)]
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=worker_args) as pool:
+            audited = [result for batch in pool.map(_audit_batch, batches) for result in batch]
+    else:
+        _init_worker(*worker_args)
+        audited = _audit_batch(pending)
+
+    rule_stats = {entry.name: {'severity': entry.severity, 'ms': 0.0, 'violations': 0} for entry in rules}
+    for name, result in audited:
+        path = output_dir / name
+        stat = path.stat()
+        pages[name] = dict(result, size=stat.st_size, mtime_ns=stat.st_mtime_ns, digest=page_digest(path))
+        for rule_name, ms in result['timings'].items():
+            rule_stats[rule_name]['ms'] += ms
+
+    violations = []
+    for name in names:
+        for violation in pages[name]['violations']:
+            violations.append(dict(violation, page=name))
+            rule_stats[violation['rule']]['violations'] += 1
+    for stats in rule_stats.values():
+        stats['ms'] = round(stats['ms'], 3)
+
+    if manifest_path is not None:
+        save_manifest(manifest_path, version, pages)
+
+    return {
+        'pages': len(names),
+        'audited': len(pending),
+        'reused': len(names) - len(pending),
+        'violations': violations,
+        'rules': rule_stats,
+        'seconds': round(time.perf_counter() - started, 3)
+    }
+
+
+def main():
+    """Função principal."""
+    parser = argparse.ArgumentParser(description='Auditoria de SEO das páginas geradas')
+    parser.add_argument('--output', default='output', help='Pasta com o site gerado')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1, help='Processos da auditoria')
+    parser.add_argument('--url', default=None, help='URL base do site (padrão: DEFAULT_CONFIG)')
+    parser.add_argument('--rules', nargs='+', default=[], metavar='MODULO', help='Módulos com regras adicionais')
+    parser.add_argument('--only', nargs='+', default=None, metavar='REGRA', help='Executa só estas regras')
+    parser.add_argument('--skip', nargs='+', default=None, metavar='REGRA', help='Não executa estas regras')
+    parser.add_argument('--title-max', type=int, default=TITLE_MAX_LENGTH, help='Tamanho máximo do título')
+    parser.add_argument('--description-max', type=int, default=DESCRIPTION_MAX_LENGTH, help='Tamanho máximo da description')
+    parser.add_argument('--description-min', type=int, default=DESCRIPTION_MIN_LENGTH, help='Tamanho mínimo da description')
+    parser.add_argument('--manifest', default=str(DEFAULT_MANIFEST_PATH), help='Manifesto da auditoria')
+    parser.add_argument('--db', default=str(DEFAULT_CATALOG_PATH), help='Catálogo com as páginas dos artigos')
+    parser.add_argument('--all-pages', action='store_true',
+                        help='Audita todos os HTML da saída, inclusive as listagens por tag e categoria')
+    parser.add_argument('--force', action='store_true', help='Audita todas as páginas (ignora o manifesto)')
+    parser.add_argument('--fail-on', choices=['error', 'warning', 'never'], default='error',
+                        help='Severidade que faz o comando sair com código 1')
+    parser.add_argument('--list-rules', action='store_true', help='Lista as regras disponíveis')
+    parser.add_argument('--json', action='store_true', help='Saída em JSON')
+
+    args = parser.parse_args()
+
+    try:
+        load_rule_modules(args.rules)
+        rules = select_rules(args.only, args.skip)
+    except (ImportError, ValueError) as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+
+    if args.list_rules:
+        for entry in RULES.values():
+            print(f"  • {entry.name} ({entry.severity}): {entry.description}")
+        return
+
+    output_dir = Path(args.output)
+    if not output_dir.exists():
+        print(f"[ERROR] Pasta não encontrada: {output_dir}")
+        print("💡 Execute primeiro: python start.py")
+        sys.exit(1)
+
+    pages = None
+    if not args.all_pages:
+        if not Path(args.db).exists():
+            print(f"[ERROR] Catálogo não encontrado: {args.db}")
+            print("💡 Execute primeiro: python start.py (ou use --all-pages)")
+            sys.exit(1)
+        with ArticleCatalog(args.db) as catalog:
+            pages = article_pages(catalog, output_dir)
+
+    base_url = args.url if args.url is not None else DEFAULT_CONFIG.get('base_url', '')
+    limits = {'title_max_length': args.title_max, 'description_max_length': args.description_max,
+              'description_min_length': args.description_min}
+    report = run_audit(output_dir, rules, base_url, limits, Path(args.manifest), max(1, args.jobs),
+                       args.force, args.rules, pages)
+
+    failing = {'error': ('error',), 'warning': SEVERITIES, 'never': ()}[args.fail_on]
+    failed = any(violation['severity'] in failing for violation in report['violations'])
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        sys.exit(1 if failed else 0)
+
+    print("[INFO] Auditoria de SEO")
+    print("=" * 50)
+    print(f"Páginas: {report['pages']} ({report['audited']} auditada(s), {report['reused']} do manifesto)")
+    for violation in report['violations']:
+        icon = "❌" if violation['severity'] == 'error' else "⚠️"
+        print(f"  {icon} {violation['page']} [{violation['rule']}] {violation['message']}")
+    print()
+    print("Tempo por regra:")
+    for name, stats in sorted(report['rules'].items(), key=lambda item: -item[1]['ms']):
+        print(f"  • {name}: {stats['ms']:.1f} ms, {stats['violations']} violação(ões)")
+
+    if failed:
+        print(f"[ERROR] Auditoria reprovada ({len(report['violations'])} violação(ões))")
+        sys.exit(1)
+    print(f"[INFO] ✅ Auditoria concluída em {report['seconds']}s")
+
+
+if __name__ == "__main__":
+    main()
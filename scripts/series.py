@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+series.py
+
+Resolução de séries de artigos (ex.: Parte I → Parte II → Parte Final).
+
+Uma série pode ser declarada em SERIES_CONFIGS (config/seo_config.py) ou no
+front matter de cada artigo:
+
+    ---
+    series: kafka-java
+    series_order: 2
+    ---
+
+O resultado é, para cada artigo da série, o bloco de navegação com o
+anterior e o próximo. Esse bloco entra na impressão digital do build, então
+mudar a ordem da série reconverte apenas os artigos cujos vizinhos mudaram.
+"""
+
+import posixpath
+from pathlib import PurePosixPath
+from typing import Any, Dict, List, Optional
+
+
+def _article_link(name: str, config: Dict[str, Any], current: str) -> Dict[str, str]:
+    """Dados do link para um artigo vizinho na série (href relativo à pasta do artigo `current`)."""
+    target = str(PurePosixPath(name).with_suffix('.html'))
+    return {
+        'name': name,
+        'title': str(config.get('title', PurePosixPath(name).stem)),
+        'href': posixpath.relpath(target, posixpath.dirname(current) or '.')
+    }
+
+
+def collect_series(configs: Dict[str, Dict[str, Any]],
+                   series_configs: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Agrupa os artigos por série.
+
+    Artigos listados em SERIES_CONFIGS mantêm a ordem da lista; artigos que
+    declaram `series` no front matter são ordenados por `series_order` (e
+    pelo nome, em caso de empate) depois dos listados.
+    """
+    series = {}
+    for series_id, definition in (series_configs or {}).items():
+        members = [name for name in definition.get('articles', []) if name in configs]
+        series[series_id] = {'title': definition.get('title', series_id), 'articles': members}
+
+    declared = {}
+    for name, config in configs.items():
+        series_id = config.get('series')
+        if not series_id:
+            continue
+        series_id = str(series_id)
+        series.setdefault(series_id, {'title': config.get('series_title', series_id), 'articles': []})
+        if name not in series[series_id]['articles']:
+            declared.setdefault(series_id, []).append((config.get('series_order', float('inf')), name))
+
+    for series_id, members in declared.items():
+        series[series_id]['articles'].extend(name for _, name in sorted(members))
+
+    return {series_id: data for series_id, data in series.items() if data['articles']}
+
+
+def resolve_series_navigation(configs: Dict[str, Dict[str, Any]],
+                              series_configs: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Calcula a navegação anterior/próximo de cada artigo que pertence a uma série.
+
+    Args:
+        configs (dict): configuração resolvida de cada artigo, por nome
+        series_configs (dict): séries declaradas em SERIES_CONFIGS
+
+    Returns:
+        dict: nome do artigo → {'series', 'title', 'position', 'total', 'prev', 'next'}
+    """
+    navigation = {}
+    for series_id, data in collect_series(configs, series_configs).items():
+        members: List[str] = data['articles']
+        for index, name in enumerate(members):
+            navigation[name] = {
+                'series': series_id,
+                'title': str(data['title']),
+                'position': index + 1,
+                'total': len(members),
+                'prev': _article_link(members[index - 1], configs[members[index - 1]], name) if index > 0 else None,
+                'next': (_article_link(members[index + 1], configs[members[index + 1]], name)
+                         if index + 1 < len(members) else None)
+            }
+    return navigation
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+site_artifacts.py
+
+Geração dos artefatos globais do site (sitemap.xml, feed RSS, índice de busca
+e páginas de listagem) a partir do catálogo de artigos, sem reler nem
+reprocessar os arquivos Markdown.
+"""
+
+import os
+import json
+import logging
+from pathlib import Path
+from email.utils import format_datetime
+from datetime import datetime
+from xml.sax.saxutils import escape
+
+from catalog import ArticleCatalog
+from listing_pages import generate_listing_pages
+from toc_index import search_sections
+
+FEED_LIMIT = 20
+
+
+def article_href(row, output_dir: Path) -> str:
+    """Caminho do HTML do artigo relativo à pasta de saída (ex.: parte1-fundamentos.html)."""
+    return os.path.relpath(row['output_path'], output_dir).replace(os.sep, '/')
+
+
+def write_sitemap(catalog: ArticleCatalog, output_dir: Path) -> Path:
+    """Gera output/sitemap.xml com os artigos catalogados."""
+    entries = []
+    for row in catalog.articles():
+        if not row['canonical_url']:
+            continue
+        lastmod = (row['built_at'] or '')[:10]
+        entries.append(
+            "  <url>\n"
+            f"    <loc>{escape(row['canonical_url'])}</loc>\n"
+            + (f"    <lastmod>{lastmod}</lastmod>\n" if lastmod else "")
+            + "  </url>"
+        )
+
+    sitemap = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        + "\n".join(entries)
+        + "\n</urlset>\n"
+    )
+
+    sitemap_path = Path(output_dir) / "sitemap.xml"
+    sitemap_path.write_text(sitemap, encoding='utf-8')
+    logging.info(f"SITEMAP GERADO: {sitemap_path} ({len(entries)} URL(s))")
+    return sitemap_path
+
+
+def write_feed(catalog: ArticleCatalog, output_dir: Path, base_url: str = '',
+               title: str = 'SEO Article Builder', limit: int = FEED_LIMIT) -> Path:
+    """Gera output/feed.xml (RSS 2.0) com os artigos mais recentes."""
+    base_url = base_url.rstrip('/')
+    rows = sorted(catalog.articles(), key=lambda row: row['built_at'] or '', reverse=True)[:limit]
+
+    items = []
+    for row in rows:
+        link = row['canonical_url'] or f"{base_url}/{article_href(row, output_dir)}"
+        pub_date = ''
+        if row['built_at']:
+            pub_date = f"      <pubDate>{format_datetime(datetime.fromisoformat(row['built_at']).astimezone())}</pubDate>\n"
+        items.append(
+            "    <item>\n"
+            f"      <title>{escape(row['title'] or row['stem'])}</title>\n"
+            f"      <link>{escape(link)}</link>\n"
+            f"      <guid>{escape(link)}</guid>\n"
+            f"      <description>{escape(row['description'] or '')}</description>\n"
+            + pub_date
+            + "    </item>"
+        )
+
+    feed = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rss version="2.0">\n'
+        '  <channel>\n'
+        f'    <title>{escape(title)}</title>\n'
+        f'    <link>{escape(base_url or "/")}</link>\n'
+        f'    <description>{escape(title)}</description>\n'
+        + "\n".join(items)
+        + "\n  </channel>\n</rss>\n"
+    )
+
+    feed_path = Path(output_dir) / "feed.xml"
+    feed_path.write_text(feed, encoding='utf-8')
+    logging.info(f"FEED GERADO: {feed_path} ({len(items)} artigo(s))")
+    return feed_path
+
+
+def write_search_index(catalog: ArticleCatalog, output_dir: Path) -> Path:
+    """
+    Gera output/search-index.json (título, descrição, tags, URL e seções de
+    cada artigo) para busca no cliente; as seções levam direto ao título.
+    """
+    index = [
+        {
+            'url': article_href(row, output_dir),
+            'title': row['title'] or row['stem'],
+            'description': row['description'] or '',
+            'keywords': row['keywords'] or '',
+            'category': row['category'] or '',
+            'tags': catalog.tags_for(row['path']),
+            'sections': search_sections(catalog.anchors_for(row['path']), article_href(row, output_dir))
+        }
+        for row in catalog.articles()
+    ]
+
+    index_path = Path(output_dir) / "search-index.json"
+    index_path.write_text(json.dumps(index, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+    logging.info(f"ÍNDICE DE BUSCA GERADO: {index_path} ({len(index)} artigo(s))")
+    return index_path
+
+
+def build_site_artifacts(catalog: ArticleCatalog, output_dir: Path, base_url: str = '', force: bool = False) -> dict:
+    """
+    Gera todos os artefatos globais a partir do catálogo.
+
+    Returns:
+        dict: resumo das páginas de listagem (regravadas, inalteradas, removidas)
+    """
+    output_dir = Path(output_dir)
+    for path, href in catalog.broken_deep_links():
+        logging.warning(f"LINK PARA SEÇÃO INEXISTENTE: {path} → {href}")
+    write_sitemap(catalog, output_dir)
+    write_feed(catalog, output_dir, base_url)
+    write_search_index(catalog, output_dir)
+    listings = generate_listing_pages(catalog, output_dir, base_url, force=force)
+    logging.info(f"LISTAGENS: {listings['written']} atualizada(s), {listings['unchanged']} inalterada(s), {listings['removed']} removida(s)")
+    return listings
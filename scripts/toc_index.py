@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+toc_index.py
+
+Índice de âncoras e barra lateral de conteúdo dos artigos.
+
+A extensão toc do Markdown já monta a árvore de títulos (toc_tokens) durante
+a renderização; o conversor guarda essa árvore achatada em uma lista de
+entradas {id, title, level}, sem percorrer o documento de novo. Com ela:
+
+- a página ganha uma barra lateral fixa com os títulos ## e ###;
+- o catálogo (e o manifesto) guarda o índice de âncoras de cada artigo, o
+  que permite validar links entre artigos (artigo.html#secao) e apontar o
+  índice de busca para as seções.
+
+Em artigos divididos em páginas (ver pagination.py), cada entrada também
+traz a página (arquivo) onde o título ficou.
+"""
+
+import html
+from typing import Any, Dict, Iterable, List, Optional
+
+SIDEBAR_LEVELS = (2, 3)
+MIN_SIDEBAR_ENTRIES = 2
+
+
+def flatten_toc(tokens: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Achata a árvore toc_tokens em entradas {id, title, level}, na ordem do documento."""
+    entries = []
+    for token in tokens:
+        entries.append({'id': token['id'], 'title': html.unescape(token['name']), 'level': token['level']})
+        entries.extend(flatten_toc(token.get('children', [])))
+    return entries
+
+
+def assign_pages(entries: List[Dict[str, Any]], anchor_files: Dict[str, str]) -> List[Dict[str, Any]]:
+    """Acrescenta a página (arquivo) de cada entrada, para artigos divididos em páginas."""
+    return [dict(entry, page=anchor_files.get(entry['id'])) for entry in entries]
+
+
+def entry_href(entry: Dict[str, Any], current_page: Optional[str] = None) -> str:
+    """Link da entrada a partir da página atual (#secao ou pagina.html#secao)."""
+    page = entry.get('page')
+    if page and page != current_page:
+        return f"{page}#{entry['id']}"
+    return f"#{entry['id']}"
+
+
+def sidebar_html(entries: Optional[List[Dict[str, Any]]], current_page: Optional[str] = None) -> str:
+    """
+    Barra lateral com os títulos de SIDEBAR_LEVELS (vazia se houver menos de
+    MIN_SIDEBAR_ENTRIES títulos).
+    """
+    shown = [entry for entry in entries or [] if entry['level'] in SIDEBAR_LEVELS]
+    if len(shown) < MIN_SIDEBAR_ENTRIES:
+        return ""
+    items = []
+    for entry in shown:
+        css = f"toc-level-{entry['level']}"
+        if current_page and entry.get('page') not in (None, current_page):
+            css += " toc-other-page"
+        items.append(f'<li class="{css}"><a href="{html.escape(entry_href(entry, current_page))}">'
+                     f'{html.escape(entry["title"])}</a></li>')
+    return f"""<aside class="toc-sidebar" aria-label="Nesta página">
+        <p class="toc-sidebar-title">Nesta página</p>
+        <ol>
+            {"".join(items)}
+        </ol>
+    </aside>"""
+
+
+def search_sections(entries: Iterable[Dict[str, Any]], page_href: str) -> List[Dict[str, str]]:
+    """
+    Seções do artigo para o índice de busca ({title, url}), com os títulos
+    de SIDEBAR_LEVELS; `page_href` é o link da primeira página do artigo.
+    """
+    folder, _, first_page = page_href.rpartition('/')
+    prefix = f"{folder}/" if folder else ""
+    return [
+        {'title': entry['title'], 'url': f"{prefix}{entry.get('page') or first_page}#{entry['id']}"}
+        for entry in entries
+        if entry['level'] in SIDEBAR_LEVELS
+    ]
@@ -8,8 +8,11 @@ Cara Core Informática - www.caracore.com.br
 
 import sys
 import os
+import time
 import shutil
 import logging
+import argparse
+import itertools
 from datetime import datetime
 from pathlib import Path
 
@@ -17,6 +20,38 @@ from pathlib import Path
 scripts_path = Path(__file__).parent / "scripts"
 sys.path.insert(0, str(scripts_path))
 
+from catalog import ArticleCatalog, build_fingerprint
+from render_version import render_digest
+from site_artifacts import build_site_artifacts
+from manifest import write_manifest
+from front_matter import read_front_matter
+from series import resolve_series_navigation
+from conversion_daemon import convert_via_daemon
+from build_pipeline import (BuildPipeline, DEFAULT_QUEUE_SIZE, compress_output, copy_referenced_images, render_cache_key,
+                            body_cache_key, render_options, page_files)
+from build_cache import BuildCache, DEFAULT_MAX_BYTES, get_cache_dir
+from checkpoint import CheckpointJournal
+from scheduler import (load_build_report, write_build_report, plan_schedule, stream_schedule, build_report,
+                       job_cost_ms, assign_shards)
+from dependency_graph import (article_dependencies, image_dependencies, include_dependencies, recorded_includes,
+                              with_nodes, IMAGE_PREFIX, INCLUDE_PREFIX)
+from includes import read_article
+from large_document import is_large_document
+from pagination import write_extra_pages
+from page_budgets import METRIC_LABELS, check_pages, format_metric, over_budget, resolve_budgets
+from image_graph import referenced_images
+from discovery import ARTICLES_DIR, iter_markdown_files, article_name, output_path_for
+from config.seo_config import DEFAULT_CONFIG, ARTICLE_CONFIGS, SERIES_CONFIGS, get_config_for_file
+
+CONVERTER_PATH = scripts_path / "format-html-seo.py"
+BUILD_DIR = Path(".build")
+
+# Acima disso, a lista de artigos encontrados é resumida no log
+LIST_LOG_LIMIT = 20
+
+# Módulo de conversão carregado uma única vez por execução
+_converter = None
+
 def setup_logging():
     """Configura o sistema de logging."""
     # Cria pasta de logs se não existir
@@ -40,59 +75,88 @@ def setup_logging():
     return log_file
 
 def get_articles_list():
-    """Retorna lista de artigos .md na pasta articles_md."""
-    articles_dir = Path("articles_md")
+    """Retorna lista de artigos .md na pasta articles_md (subpastas incluídas)."""
+    articles_dir = ARTICLES_DIR
     
     if not articles_dir.exists():
         logging.error(f"Pasta {articles_dir} não encontrada!")
         return []
     
-    md_files = list(articles_dir.glob("*.md"))
+    md_files = list(iter_markdown_files(articles_dir))
     logging.info(f"Encontrados {len(md_files)} arquivo(s) .md na pasta articles_md/")
     
-    for md_file in md_files:
-        logging.info(f"  • {md_file.name}")
+    for md_file in md_files[:LIST_LOG_LIMIT]:
+        logging.info(f"  • {article_name(md_file)}")
+    if len(md_files) > LIST_LOG_LIMIT:
+        logging.info(f"  • ... e mais {len(md_files) - LIST_LOG_LIMIT} arquivo(s)")
     
     return md_files
 
-def convert_single_article(md_file):
+def load_converter():
+    """Carrega o módulo format-html-seo.py (uma única vez por execução)."""
+    global _converter
+    if _converter is None:
+        # Importa usando importlib para lidar com hífens no nome
+        import importlib.util
+        spec = importlib.util.spec_from_file_location("format_html_seo", CONVERTER_PATH)
+        _converter = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(_converter)
+    return _converter
+
+def convert_single_article(md_file, info=None, config=None, series_nav=None, output_file=None, paginate=None):
     """Converte um artigo específico."""
     try:
         logging.info(f"Iniciando conversão de {md_file.name}")
         
-        input_file = f"articles_md/{md_file.name}"
-        output_file = f"output/{md_file.stem}.html"
+        input_file = str(md_file)
+        output_file = str(output_file or f"output/{md_file.stem}.html")
         
         logging.info(f"Arquivo de entrada: {input_file}")
         logging.info(f"Arquivo de saída: {output_file}")
         
-        # Importa o módulo de conversão
-        import importlib.util
-        spec = importlib.util.spec_from_file_location("format_html_seo", "scripts/format-html-seo.py")
-        format_html_seo = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(format_html_seo)
+        options = {}
+        if config:
+            options = {'author': config['author'], 'url': config.get('base_url', '')}
+        if paginate:
+            options['paginate'] = paginate
         
-        # Chama a função de conversão
-        success, output_path, error_msg = format_html_seo.convert_md_to_html(input_file, output_file)
+        # Usa o daemon de conversão se estiver em execução
+        result = convert_via_daemon(input_file, output_file, info=info, series_nav=series_nav, **options)
+        
+        if result is None:
+            # Importa o módulo de conversão
+            format_html_seo = load_converter()
+            
+            # Chama a função de conversão
+            result = format_html_seo.convert_md_to_html(
+                input_file, output_file, info=info, series_nav=series_nav, **options
+            )
+        success, output_path, error_msg = result
         
         if success:
             logging.info(f"CONVERSÃO CONCLUÍDA: {md_file.name} → {output_path}")
             return True
         else:
             logging.error(f"FALHA NA CONVERSÃO: {md_file.name} - {error_msg}")
+            if info is not None:
+                info['error'] = error_msg
             return False
             
     except ImportError as e:
         logging.error(f"ERRO DE IMPORTAÇÃO ao converter {md_file.name}: {e}")
+        if info is not None:
+            info['error'] = f"Erro de importação: {e}"
         return False
     except Exception as e:
         logging.error(f"ERRO INESPERADO ao converter {md_file.name}: {e}")
+        if info is not None:
+            info['error'] = f"Erro inesperado: {e}"
         return False
 
-def ensure_output_directory():
+def ensure_output_directory(output_dir=Path("output")):
     """Garante que a pasta de saída existe."""
-    output_dir = Path("output")
-    output_dir.mkdir(exist_ok=True)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
     
     # Cria subpasta de imagens se não existir
     images_dir = output_dir / "images"
@@ -151,8 +215,437 @@ def cleanup_root_md_files():
         logging.error(f"ERRO na limpeza de arquivos .md: {e}")
         return False
 
+def load_article_config(md_file):
+    """Resolve a configuração do artigo lendo apenas o seu front matter."""
+    return get_config_for_file(article_name(md_file), read_front_matter(md_file))
+
+def make_job(md_file, config, series_nav, output_dir, converter_digest, paginate=None):
+    """Trabalho de conversão de um artigo (ver plan_build)."""
+    name = article_name(md_file)
+    # A paginação só entra na impressão digital quando usada (builds sem ela não mudam)
+    build_inputs = (converter_digest, config, series_nav) + ((paginate,) if paginate else ())
+    return {
+        'md_file': md_file,
+        'name': name,
+        'output_file': output_path_for(md_file, output_dir),
+        'config': config,
+        'series_nav': series_nav,
+        'paginate': paginate,
+        'build_key': build_fingerprint(*build_inputs),
+        'dependencies': article_dependencies(name, converter_digest, DEFAULT_CONFIG,
+                                             ARTICLE_CONFIGS.get(name), series_nav, paginate)
+    }
+
+def plan_build(md_files, output_dir=Path("output"), paginate=None):
+    """
+    Prepara os trabalhos de conversão lendo apenas o front matter dos artigos.
+    
+    Cada trabalho traz a configuração resolvida, a navegação da série, a
+    impressão digital (build_key) e os nós do grafo de dependências usados
+    para decidir se o artigo é reconvertido (imagens e includes entram em
+    resolve_file_dependencies, a partir do catálogo).
+    """
+    converter_digest = render_digest()
+    configs = {article_name(md_file): load_article_config(md_file) for md_file in md_files}
+    navigation = resolve_series_navigation(configs, SERIES_CONFIGS)
+    
+    return [
+        make_job(md_file, configs[article_name(md_file)], navigation.get(article_name(md_file)), output_dir,
+                 converter_digest, paginate)
+        for md_file in md_files
+    ]
+
+def iter_build_jobs(md_files, output_dir=Path("output"), paginate=None):
+    """
+    Versão em streaming de plan_build: prepara cada trabalho assim que o
+    artigo é descoberto, sem esperar a lista completa.
+    
+    A navegação das séries vem só de SERIES_CONFIGS: séries declaradas no
+    front matter dependem de ler o corpus inteiro e ficam sem navegação.
+    """
+    converter_digest = render_digest()
+    members = {name for series in SERIES_CONFIGS.values() for name in series.get('articles', [])}
+    configs = {name: load_article_config(ARTICLES_DIR / name) for name in members if (ARTICLES_DIR / name).is_file()}
+    navigation = resolve_series_navigation(configs, SERIES_CONFIGS)
+    
+    for md_file in md_files:
+        name = article_name(md_file)
+        config = configs.get(name) or load_article_config(md_file)
+        if config.get('series') and name not in navigation:
+            logging.warning(f"SÉRIE IGNORADA NO MODO STREAMING: {name} (série declarada no front matter)")
+        yield make_job(md_file, config, navigation.get(name), output_dir, converter_digest, paginate)
+
+def iter_seen(jobs, names):
+    """Repassa os trabalhos anotando os nomes vistos (para o prune após um build em streaming)."""
+    for job in jobs:
+        names.append(job['name'])
+        yield job
+
+def resolve_file_dependencies(jobs, catalog):
+    """Acrescenta aos trabalhos (sob demanda) os nós das imagens e dos includes do último build."""
+    digests = {}
+    for job in jobs:
+        images = catalog.images_for(job['name'])
+        includes = recorded_includes(catalog.dependencies_for(job['name']))
+        dependencies = with_nodes(job['dependencies'], IMAGE_PREFIX, image_dependencies(job['md_file'], images, digests))
+        job['dependencies'] = with_nodes(dependencies, INCLUDE_PREFIX, include_dependencies(includes))
+        yield job
+
+def select_pending(jobs, catalog, args, resume_names, counts, journal=None):
+    """
+    Filtra, sob demanda, os trabalhos a converter: os pendentes e com falha
+    da execução interrompida (retomada) e os com dependências alteradas.
+    
+    Na retomada, os demais artigos passam pela verificação incremental: uma
+    execução em streaming interrompida não chegou a planejar os artigos que
+    ainda não tinha encontrado.
+    
+    Conta os ignorados em counts['skipped'] (e os guarda em
+    counts['skipped_jobs'], para os orçamentos de peso). Com `journal` (modo
+    streaming), cada artigo selecionado entra no plano do diário ao ser
+    entregue.
+    """
+    for job in jobs:
+        if resume_names is not None and job['name'] in resume_names:
+            reasons = ["retomada"]
+        else:
+            # Artigos cujas dependências não mudaram desde o último build são ignorados
+            reasons = ["--force"] if args.force and resume_names is None else rebuild_reasons(job, catalog)
+            if not reasons:
+                logging.info(f"INALTERADO: {job['name']} (conversão ignorada)")
+        
+        if not reasons:
+            counts['skipped'] += 1
+            counts.setdefault('skipped_jobs', []).append(job)
+            continue
+        if args.explain:
+            logging.info(f"MOTIVO DA RECONVERSÃO: {job['name']} - {'; '.join(reasons)}")
+        if journal is not None:
+            journal.plan(job['name'])
+        yield job
+
+def rebuild_reasons(job, catalog):
+    """Motivos para reconverter um trabalho (vazio se estiver atualizado)."""
+    return catalog.rebuild_reasons(job['name'], job['md_file'], job['build_key'], job['output_file'], job['dependencies'])
+
+def record_article(catalog, job, info):
+    """Grava o artigo convertido no catálogo, com as imagens e os includes desta conversão como dependências."""
+    dependencies = with_nodes(job['dependencies'], IMAGE_PREFIX, image_dependencies(job['md_file'], referenced_images(info)))
+    dependencies = with_nodes(dependencies, INCLUDE_PREFIX, include_dependencies(info.get('includes', {})))
+    catalog.upsert(job['name'], job['md_file'], job['output_file'], job['build_key'], job['config'], info, dependencies)
+
+def list_articles_dry_run(jobs, catalog, explain=False):
+    """Lista artigos, metadados e o que seria convertido, sem ler os corpos."""
+    logging.info("SIMULAÇÃO (DRY RUN) - nenhum arquivo será convertido")
+    pending = total = 0
+    for job in jobs:
+        total += 1
+        config = job['config']
+        reasons = rebuild_reasons(job, catalog)
+        pending += bool(reasons)
+        status = "INALTERADO" if not reasons else "SERIA CONVERTIDO"
+        if reasons and explain:
+            status += f" ({'; '.join(reasons)})"
+        tags = ', '.join(str(tag) for tag in config.get('tags', []))
+        logging.info(f"  • {job['name']}: {config['title']} [{config.get('category', config['default_category'])}] {tags} - {status}")
+    logging.info(f"TOTAL: {total} artigo(s), {pending} a converter")
+
+def measure_result(info, success):
+    """Dados de um artigo convertido para o histórico do relatório de build."""
+    return {
+        'success': success,
+        'cached': bool(info.get('cached') or info.get('body_cached')),
+        'cost_ms': job_cost_ms(info),
+        'bytes_in': info.get('bytes_in'),
+        'bytes_out': info.get('bytes_out'),
+        'timings': info.get('timings', {})
+    }
+
+def check_page_budgets(job, info, result, args):
+    """
+    Mede as páginas gravadas do artigo e aplica os orçamentos de peso (ver
+    page_budgets.py). As medidas e os excessos vão para `result` (histórico
+    do relatório de build).
+    """
+    if args.budgets == 'off':
+        return
+    pages = [job['output_file'], *page_files(job['output_file'], info)]
+    checked = check_pages(pages, args.output_dir, job['config'])
+    result['pages'] = checked['pages']
+    result['budget_violations'] = checked['violations']
+    log_budget_violations(job['name'], checked['violations'], args)
+
+def log_budget_violations(name, violations, args):
+    """Registra no log as páginas de um artigo acima do orçamento de peso."""
+    log = logging.error if args.budgets == 'fail' else logging.warning
+    for violation in violations:
+        log(f"ORÇAMENTO EXCEDIDO: {name} → {violation['page']}: {METRIC_LABELS[violation['metric']]} "
+            f"{format_metric(violation['metric'], violation['value'])} "
+            f"(limite: {format_metric(violation['metric'], violation['budget'])})")
+
+def check_skipped_budgets(jobs, catalog, report, args):
+    """
+    Aplica os orçamentos de peso atuais aos artigos não reconvertidos, com as
+    medidas do relatório de build (ou, sem elas, medindo a saída existente).
+    Os limites podem ter mudado desde a última conversão; as medidas e os
+    excessos atualizam `report`.
+    
+    Returns:
+        int: número de excessos
+    """
+    if args.budgets == 'off':
+        return 0
+    total = 0
+    for job in jobs:
+        entry = report['articles'].setdefault(job['name'], {})
+        pages = entry.get('pages')
+        if not pages:
+            output_file = Path(job['output_file'])
+            files = [output_file, *(output_file.parent / name for name in catalog.extra_pages_for(job['name']))]
+            pages = check_pages([path for path in files if path.is_file()], args.output_dir, job['config'])['pages']
+            entry['pages'] = pages
+        budgets = resolve_budgets(job['config'])
+        violations = [dict(violation, page=page)
+                      for page, metrics in pages.items() for violation in over_budget(metrics, budgets)]
+        entry['budget_violations'] = violations
+        log_budget_violations(job['name'], violations, args)
+        total += len(violations)
+    return total
+
+def restore_from_cache(cache, cache_key, job):
+    """
+    Grava o artigo a partir do cache de build, sem renderizar.
+    
+    Returns:
+        dict ou None: dados da renderização (como o `info` do conversor) ou
+        None se a chave não estiver no cache
+    """
+    started = time.perf_counter()
+    cached = cache.get(cache_key)
+    if cached is None:
+        return None
+    
+    html, info = cached
+    output_file = Path(job['output_file'])
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_text(html, encoding='utf-8')
+    if 'extra_pages' in info:
+        write_extra_pages(output_file, info['extra_pages'])
+    info.update({
+        'cached': True,
+        'bytes_in': Path(job['md_file']).stat().st_size,
+        'bytes_out': output_file.stat().st_size,
+        'timings': {'cache': round((time.perf_counter() - started) * 1000, 3)}
+    })
+    logging.info(f"CACHE: {job['name']} restaurado do cache de build → {output_file}")
+    return info
+
+def rewrap_from_cache(cache, body_key, job, md_content):
+    """
+    Grava o artigo aplicando o template a um corpo em cache (sem Markdown
+    nem pós-processamento), como após uma mudança só no layout.
+    
+    Returns:
+        dict ou None: dados da renderização ou None se o corpo não estiver no cache
+    """
+    started = time.perf_counter()
+    body = cache.get_body(body_key)
+    if body is None:
+        return None
+    
+    converter = load_converter()
+    timer = converter.StageTimer()
+    html, info = converter.render_article(md_content, Path(job['md_file']), series_nav=job['series_nav'],
+                                          timer=timer, body=body, **render_options(job))
+    output_file = Path(job['output_file'])
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_text(html, encoding='utf-8')
+    if 'extra_pages' in info:
+        write_extra_pages(output_file, info['extra_pages'])
+    timer.lap('write')
+    info.update({
+        'body_cached': True,
+        'bytes_in': Path(job['md_file']).stat().st_size,
+        'bytes_out': output_file.stat().st_size,
+        'timings': {'cache': round((time.perf_counter() - started) * 1000, 3), **timer.timings}
+    })
+    logging.info(f"CACHE: {job['name']} reaproveitou o corpo em cache (só o template) → {output_file}")
+    return info
+
+def run_sequential_build(jobs, catalog, args, converted, journal, failures, cache=None):
+    """
+    Converte os artigos pendentes um a um, com até `args.retries` novas
+    tentativas por artigo. Artigos presentes no cache de build não são
+    renderizados; se só o corpo estiver em cache, apenas o template é aplicado.
+    Documentos grandes (gravados seção por seção) não passam pelo cache.
+    
+    Returns:
+        int: número de sucessos
+    """
+    success_count = 0
+    for job in jobs:
+        logging.info("-" * 50)
+        md_file = job['md_file']
+        
+        cache_key = body_key = md_content = None
+        info = None
+        attempt = 1
+        if cache is not None and not is_large_document(md_file):
+            try:
+                md_content, includes = read_article(md_file)
+            except (OSError, ValueError):
+                pass  # o erro aparece (e é registrado) na conversão abaixo
+        if md_content is not None:
+            cache_key = render_cache_key(cache, job, md_content)
+            info = restore_from_cache(cache, cache_key, job)
+            if info is None:
+                body_key = body_cache_key(cache, job, md_content)
+                info = rewrap_from_cache(cache, body_key, job, md_content)
+                if info is not None:
+                    cache.put(cache_key, Path(job['output_file']).read_text(encoding='utf-8'), info)
+            if info is not None:
+                info['includes'] = includes
+        
+        success = info is not None
+        if not success:
+            for attempt in range(1, args.retries + 2):
+                info = {}
+                success = convert_single_article(md_file, info, job['config'], job['series_nav'], job['output_file'],
+                                                 job['paginate'])
+                if success or attempt > args.retries:
+                    break
+                logging.warning(f"NOVA TENTATIVA: {md_file.name} ({attempt + 1}/{args.retries + 1})")
+            
+            if success and cache_key is not None:
+                if info.get('body'):
+                    cache.put_body(body_key, info['body'])
+                cache.put(cache_key, Path(job['output_file']).read_text(encoding='utf-8'), info)
+        
+        converted[job['name']] = measure_result(info, success)
+        journal.record(job['name'], success, attempt, info.get('error', ""))
+        
+        if success:
+            success_count += 1
+            copy_referenced_images(md_file, referenced_images(info), args.output_dir, Path(job['output_file']).parent)
+            if args.compress:
+                for output_file in [job['output_file'], *page_files(job['output_file'], info)]:
+                    compress_output(output_file)
+            check_page_budgets(job, info, converted[job['name']], args)
+            record_article(catalog, job, info)
+        else:
+            failures[job['name']] = {'attempts': attempt, 'error': info.get('error', "")}
+            logging.error(f"FALHA CRÍTICA na conversão de {md_file.name}")
+            if not args.continue_on_error:
+                break
+    return success_count
+
+def run_pipeline_build(jobs, catalog, args, converted, journal, failures, cache=None):
+    """
+    Converte os artigos pendentes no pipeline assíncrono (leitura, renderização
+    em processos, imagens, gravação e compressão sobrepostas).
+    
+    Artigos com falha voltam ao pipeline em uma nova rodada enquanto houver
+    tentativas (`args.retries`). `jobs` pode ser um gerador (modo streaming):
+    é consumido uma única vez, e o que uma rodada interrompida não chegou a
+    pedir fica para a seguinte.
+    
+    Returns:
+        int: número de sucessos
+    """
+    counts = {'success': 0}
+    attempts = {}
+    
+    def on_result(result):
+        job = result['job']
+        name = job['name']
+        attempts[name] = attempts.get(name, 0) + 1
+        converted[name] = measure_result(result['info'], result['success'])
+        if result['success']:
+            counts['success'] += 1
+            check_page_budgets(job, result['info'], converted[name], args)
+            record_article(catalog, job, result['info'])
+            journal.record(name, True, attempts[name])
+            logging.info(f"CONVERSÃO CONCLUÍDA: {name} → {result['output_path']} ({result['elapsed_ms']:.0f} ms)")
+        elif attempts[name] > args.retries:
+            failures[name] = {'attempts': attempts[name], 'error': result['error']}
+            journal.record(name, False, attempts[name], result['error'])
+            logging.error(f"FALHA NA CONVERSÃO: {name} - {result['error']}")
+        else:
+            logging.warning(f"FALHA NA CONVERSÃO: {name} - {result['error']} (nova tentativa: {attempts[name] + 1}/{args.retries + 1})")
+    
+    source = iter(jobs)
+    retry = []
+    while True:
+        pipeline = BuildPipeline(workers=args.jobs, queue_size=args.queue_size, compress=args.compress,
+                                 output_dir=args.output_dir, stop_on_error=not args.continue_on_error, cache=cache)
+        results = pipeline.run(itertools.chain(retry, source), on_result)
+        if failures and not args.continue_on_error:
+            break
+        # Próxima rodada: falhas com tentativas restantes, seguidas dos artigos ainda não alimentados
+        retry = [result['job'] for result in results
+                 if not result['success'] and result['job']['name'] not in failures]
+        if not retry:
+            break
+    
+    return counts['success']
+
+def log_failure_summary(failures):
+    """Resumo dos artigos que falharam após todas as tentativas."""
+    logging.error("=" * 60)
+    logging.error(f"RESUMO DE FALHAS: {len(failures)} artigo(s)")
+    for name, failure in failures.items():
+        logging.error(f"  • {name} ({failure['attempts']} tentativa(s)): {failure['error']}")
+    logging.error("Use 'python start.py --resume' para reprocessar apenas os pendentes e as falhas")
+
+def parse_shard(value):
+    """Converte 'i/N' (1 ≤ i ≤ N) em (i, N)."""
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"shard inválido: {value} (use i/N, ex.: 1/3)")
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard inválido: {value} (i deve estar entre 1 e N)")
+    return index, count
+
+def parse_args():
+    """Lê as opções de linha de comando."""
+    parser = argparse.ArgumentParser(description='SEO Article Builder - Conversão Automatizada')
+    parser.add_argument('--force', action='store_true', help='Reconverte todos os artigos, mesmo os inalterados (sem ler o cache de build)')
+    parser.add_argument('--dry-run', action='store_true', help='Lista os artigos e metadados (só o front matter é lido) sem converter')
+    parser.add_argument('--explain', action='store_true', help='Mostra por que cada artigo é reconvertido (dependências alteradas)')
+    parser.add_argument('--stream', action='store_true', help='Começa a converter enquanto articles_md/ ainda é percorrida (árvores muito grandes)')
+    parser.add_argument('--jobs', '-j', type=int, default=1, help='Processos de renderização; com mais de 1 usa o pipeline assíncrono')
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE, help='Capacidade das filas entre as etapas do pipeline (limita a memória)')
+    parser.add_argument('--compress', action='store_true', help='Grava também a versão .html.gz de cada artigo')
+    parser.add_argument('--paginate-words', type=int, default=None, help='Divide artigos longos em páginas de até N palavras (nos títulos ##)')
+    parser.add_argument('--paginate-bytes', type=int, default=None, help='Divide artigos longos em páginas de até N bytes de HTML (nos títulos ##)')
+    parser.add_argument('--budgets', choices=['warn', 'fail', 'off'], default='warn',
+                        help='Orçamentos de peso por página: avisa, falha o build ou não verifica')
+    parser.add_argument('--continue-on-error', action='store_true', help='Continua após falhas e mostra um resumo no final')
+    parser.add_argument('--resume', action='store_true', help='Retoma a última execução interrompida: só os artigos pendentes e com falha')
+    parser.add_argument('--retries', type=int, default=0, help='Novas tentativas por artigo antes de considerá-lo com falha')
+    parser.add_argument('--shard', type=parse_shard, metavar='i/N', help='Converte apenas a parte i de N do corpus (build distribuído)')
+    parser.add_argument('--output-dir', type=Path, help='Pasta de saída (padrão: output/, ou .build/shard-i-of-N/output com --shard)')
+    parser.add_argument('--cache-dir', type=Path, default=None, help='Cache de build compartilhado (padrão: $SEO_BUILD_CACHE ou .build/cache)')
+    parser.add_argument('--cache-size', type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024), help='Orçamento do cache de build em MB (LRU)')
+    parser.add_argument('--no-cache', action='store_true', help='Não usa o cache de build')
+    args = parser.parse_args()
+    args.paginate = {key: value for key, value in (('max_words', args.paginate_words), ('max_bytes', args.paginate_bytes))
+                     if value} or None
+    if args.stream and args.shard:
+        parser.error("--stream não pode ser usado com --shard (a partição precisa da lista completa)")
+    
+    # Cada shard tem sua pasta de saída e seu estado de build (catálogo, checkpoint, relatório)
+    args.build_dir = BUILD_DIR
+    if args.shard:
+        args.build_dir = BUILD_DIR / f"shard-{args.shard[0]}-of-{args.shard[1]}"
+    if args.output_dir is None:
+        args.output_dir = args.build_dir / "output" if args.shard else Path("output")
+    return args
+
 def main():
     """Função principal - execução automatizada."""
+    args = parse_args()
     
     # Configura logging
     log_file = setup_logging()
@@ -166,43 +659,150 @@ def main():
     try:
         # Verifica e prepara ambiente
         logging.info("PREPARANDO AMBIENTE...")
-        ensure_output_directory()
+        ensure_output_directory(args.output_dir)
         
         # Busca artigos para conversão
         logging.info("BUSCANDO ARTIGOS PARA CONVERSÃO...")
-        md_files = get_articles_list()
+        if args.stream:
+            # Streaming: a árvore é percorrida enquanto os artigos já são convertidos
+            if not ARTICLES_DIR.exists():
+                logging.error(f"Pasta {ARTICLES_DIR} não encontrada!")
+                sys.exit(1)
+            logging.info("STREAMING: conversões começam durante a busca (ordem de descoberta)")
+            jobs = iter_build_jobs(iter_markdown_files(ARTICLES_DIR), args.output_dir, args.paginate)
+        else:
+            md_files = get_articles_list()
+            
+            if not md_files:
+                logging.error("ERRO: Nenhum arquivo .md encontrado na pasta articles_md/")
+                logging.error("EXECUÇÃO INTERROMPIDA - nada para converter")
+                sys.exit(1)
+            
+            jobs = plan_build(md_files, args.output_dir, args.paginate)
         
-        if not md_files:
-            logging.error("ERRO: Nenhum arquivo .md encontrado na pasta articles_md/")
-            logging.error("EXECUÇÃO INTERROMPIDA - nada para converter")
-            sys.exit(1)
+        if args.shard:
+            shard_index, shard_count = args.shard
+            assignment = assign_shards(jobs, shard_count)
+            jobs = [job for job in jobs if assignment[job['name']] == shard_index - 1]
+            logging.info(f"SHARD {shard_index}/{shard_count}: {len(jobs)} artigo(s) → {args.output_dir}")
+        
+        if args.dry_run:
+            with ArticleCatalog(args.build_dir / "catalog.sqlite3") as catalog:
+                list_articles_dry_run(resolve_file_dependencies(jobs, catalog), catalog, args.explain)
+            return
         
         # Inicia conversões
         logging.info("INICIANDO CONVERSÕES...")
         success_count = 0
         error_count = 0
+        counts = {'skipped': 0}
         
-        for md_file in md_files:
-            logging.info("-" * 50)
-            
-            success = convert_single_article(md_file)
+        catalog = ArticleCatalog(args.build_dir / "catalog.sqlite3")
+        
+        journal = CheckpointJournal(args.build_dir / "checkpoint.jsonl")
+        resume_names = journal.remaining() if args.resume else None
+        if args.resume and resume_names is None:
+            logging.info("RETOMADA: nenhuma execução interrompida - build incremental normal")
+        
+        # Nomes de todos os artigos vistos (o prune roda depois do build em streaming)
+        seen_names = []
+        pending = select_pending(resolve_file_dependencies(iter_seen(jobs, seen_names), catalog), catalog, args,
+                                 resume_names, counts, journal if args.stream else None)
+        
+        report_path = args.build_dir / "build_report.json"
+        previous_report = load_build_report(report_path)
+        if args.stream:
+            schedule = stream_schedule(pending, max(1, args.jobs))
+        else:
+            pending_jobs = list(pending)
+            if resume_names is not None:
+                logging.info(f"RETOMADA: {len(pending_jobs)} artigo(s) pendente(s) ou com falha")
             
-            if success:
-                success_count += 1
-            else:
-                error_count += 1
-                logging.error(f"FALHA CRÍTICA na conversão de {md_file.name}")
+            # Maior custo esperado primeiro (histórico do último build ou tamanho do arquivo)
+            schedule = plan_schedule(pending_jobs, max(1, args.jobs), previous_report)
+            if pending_jobs:
+                logging.info(f"ESCALONAMENTO: {', '.join(schedule['order'])} "
+                             f"(previsão: {schedule['predicted_makespan_ms'] / 1000:.2f}s)")
+        
+        cache = None
+        if not args.no_cache:
+            cache = BuildCache(args.cache_dir or get_cache_dir(), int(args.cache_size * 1024 * 1024),
+                               version=render_digest(), body_version=load_converter().body_version(),
+                               refresh=args.force)
+        
+        converted = {}
+        failures = {}
+        conversion_started = time.perf_counter()
+        
+        with journal:
+            journal.start(schedule['order'], resume=resume_names is not None)
+            build = run_pipeline_build if args.jobs > 1 else run_sequential_build
+            success_count = build(schedule['jobs'], catalog, args, converted, journal, failures, cache)
+            error_count = len(failures)
+            skipped_count = counts['skipped']
+            if not failures:
+                journal.finish()
+        
+        if cache is not None:
+            if cache.counters['hits'] or cache.counters['misses']:
+                logging.info(f"CACHE DE BUILD: {cache.counters['hits']} acerto(s), {cache.counters['misses']} falta(s) ({cache.root})")
+            if cache.counters['body_hits'] or cache.counters['body_misses']:
+                logging.info(f"CACHE DE CORPOS: {cache.counters['body_hits']} corpo(s) reaproveitado(s), "
+                             f"{cache.counters['body_misses']} renderizado(s)")
+            evicted = cache.gc()
+            if evicted['removed']:
+                logging.info(f"CACHE DE BUILD: {evicted['removed']} entrada(s) despejada(s) ({evicted['removed_bytes']} bytes)")
+            cache.flush_stats()
+        
+        actual_makespan_ms = (time.perf_counter() - conversion_started) * 1000
+        report = build_report(previous_report, schedule, converted, actual_makespan_ms)
+        # Artigos inalterados também passam pelos orçamentos (os limites podem ter mudado)
+        over_budget_count = sum(len(result.get('budget_violations', [])) for result in converted.values())
+        over_budget_count += check_skipped_budgets(counts.get('skipped_jobs', []), catalog, report, args)
+        write_build_report(report, report_path)
+        if converted and not args.stream:
+            logging.info(f"TEMPO DE CONVERSÃO: {actual_makespan_ms / 1000:.2f}s "
+                         f"(previsto: {schedule['predicted_makespan_ms'] / 1000:.2f}s)")
+        elif converted:
+            logging.info(f"TEMPO DE CONVERSÃO: {actual_makespan_ms / 1000:.2f}s ({len(converted)} artigo(s) em streaming)")
+        
+        if failures:
+            log_failure_summary(failures)
+            if not args.continue_on_error:
                 logging.error("EXECUÇÃO INTERROMPIDA devido a erro")
                 sys.exit(1)
         
+        removed = catalog.prune(seen_names)
+        for path in removed:
+            logging.info(f"REMOVIDO DO CATÁLOGO: {path}")
+        
+        if args.shard:
+            # Artefatos globais ficam para a junção (scripts/merge_shards.py)
+            manifest_path = write_manifest(catalog, args.output_dir, f"{args.shard[0]}/{args.shard[1]}")
+            logging.info(f"MANIFESTO PARCIAL GERADO: {manifest_path}")
+        else:
+            # Artefatos globais a partir do catálogo
+            build_site_artifacts(catalog, args.output_dir, DEFAULT_CONFIG['base_url'], force=args.force)
+        catalog.close()
+        
         # Relatório final
         logging.info("=" * 60)
         logging.info("RELATÓRIO FINAL")
         logging.info(f"CONVERSÕES BEM-SUCEDIDAS: {success_count}")
+        logging.info(f"CONVERSÕES IGNORADAS (INALTERADAS): {skipped_count}")
         logging.info(f"CONVERSÕES FALHARAM: {error_count}")
-        logging.info(f"ARQUIVOS HTML GERADOS EM: output/")
+        logging.info(f"ARQUIVOS HTML GERADOS EM: {args.output_dir}/")
+        if over_budget_count:
+            log = logging.error if args.budgets == 'fail' else logging.warning
+            log(f"ORÇAMENTOS DE PESO EXCEDIDOS: {over_budget_count} (medidas em {report_path})")
         
-        if success_count > 0:
+        if error_count:
+            logging.error(f"CONVERSÕES CONCLUÍDAS COM {error_count} FALHA(S) - veja o resumo de falhas")
+            sys.exit(1)
+        elif over_budget_count and args.budgets == 'fail':
+            logging.error("BUILD REPROVADO: páginas acima do orçamento de peso (--budgets fail)")
+            sys.exit(1)
+        elif success_count > 0 or skipped_count > 0:
             logging.info("TODAS AS CONVERSÕES FORAM CONCLUÍDAS COM SUCESSO!")
             
             # Executa limpeza automática
@@ -0,0 +1,59 @@
+"""Configuração comum dos testes: os módulos de scripts/ são importados pelo nome, como no build."""
+
+import os
+import sys
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(ROOT))
+
+IMAGE = ROOT / "articles_md" / "images" / "software.png"
+
+
+def series_article(title: str, order: int, body: str = "Texto do artigo.") -> str:
+    """Artigo de uma série 'kafka' com front matter completo (passa na auditoria)."""
+    return f"""---
+title: {title}
+description: Parte {order} da série de testes sobre Apache Kafka, com produtores e consumidores.
+tags: [kafka, testes]
+category: Tecnologia
+series: kafka
+series_order: {order}
+---
+
+# {title}
+
+![Diagrama da parte {order}](images/software.png)
+
+{body}
+"""
+
+
+@pytest.fixture
+def build_site(tmp_path, monkeypatch):
+    """
+    Roda start.py em uma pasta temporária com os artigos dados
+    ({nome relativo: Markdown}) e devolve a pasta; a cwd do teste passa a ser ela.
+    """
+    monkeypatch.chdir(tmp_path)
+
+    def build(articles, *args, check=True):
+        articles_dir = tmp_path / "articles_md"
+        (articles_dir / "images").mkdir(parents=True, exist_ok=True)
+        shutil.copy(IMAGE, articles_dir / "images" / IMAGE.name)
+        for name, text in articles.items():
+            (articles_dir / name).parent.mkdir(parents=True, exist_ok=True)
+            (articles_dir / name).write_text(text, encoding='utf-8')
+        env = dict(os.environ, SEO_NO_DAEMON='1', SEO_BUILD_CACHE=str(tmp_path / ".build" / "cache"))
+        result = subprocess.run([sys.executable, str(ROOT / "start.py"), *args], cwd=tmp_path, env=env,
+                                capture_output=True, text=True, timeout=300)
+        if check:
+            assert result.returncode == 0, result.stdout + result.stderr
+        return result
+
+    return build
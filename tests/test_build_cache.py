@@ -0,0 +1,85 @@
+"""Cache de build: chaves, modo --force, despejo LRU e reaproveitamento entre builds."""
+
+import os
+import shutil
+from pathlib import Path
+
+from build_cache import BuildCache
+from conftest import series_article
+
+ARTICLES = {'um.md': series_article("Kafka parte um", 1), 'dois.md': series_article("Kafka parte dois", 2)}
+
+
+def test_page_key_depends_on_render_version(tmp_path):
+    first = BuildCache(tmp_path, version='v1')
+    second = BuildCache(tmp_path, version='v2')
+
+    assert first.key('artigo', {'lang': 'pt-BR'}) == BuildCache(tmp_path, version='v1').key('artigo', {'lang': 'pt-BR'})
+    assert first.key('artigo', {'lang': 'pt-BR'}) != second.key('artigo', {'lang': 'pt-BR'})
+    assert first.key('artigo', {'lang': 'pt-BR'}) != first.key('artigo', {'lang': 'en'})
+
+
+def test_body_key_ignores_page_version(tmp_path):
+    first = BuildCache(tmp_path, version='v1', body_version='corpo')
+    second = BuildCache(tmp_path, version='v2', body_version='corpo')
+
+    assert first.body_key('artigo') == second.body_key('artigo')
+    assert first.body_key('artigo') != BuildCache(tmp_path, body_version='outro').body_key('artigo')
+    assert first.body_key('artigo') != first.key('artigo')
+
+
+def test_put_and_get_round_trip(tmp_path):
+    cache = BuildCache(tmp_path, version='v1')
+    key = cache.key('artigo')
+    cache.put(key, '<html></html>', {'word_count': 10, 'timings': {'total': 1.0}})
+
+    assert cache.get(key) == ('<html></html>', {'word_count': 10})
+    assert cache.get(cache.key('outro')) is None
+    assert cache.counters['hits'] == 1
+    assert cache.counters['misses'] == 1
+
+
+def test_refresh_skips_reads_but_still_writes(tmp_path):
+    BuildCache(tmp_path, version='v1').put(BuildCache(tmp_path, version='v1').key('artigo'), 'antigo', {})
+
+    forced = BuildCache(tmp_path, version='v1', refresh=True)
+    key = forced.key('artigo')
+    assert forced.get(key) is None
+    assert forced.get_body(forced.body_key('artigo')) is None
+    assert forced.counters['misses'] == 1
+    assert forced.counters['body_misses'] == 1
+
+    forced.put(key, 'novo', {})
+    assert BuildCache(tmp_path, version='v1').get(key) == ('novo', {})
+
+
+def test_gc_evicts_least_recently_used(tmp_path):
+    cache = BuildCache(tmp_path)
+    keys = [cache.key(name) for name in ('a', 'b', 'c')]
+    for age, key in enumerate(keys):
+        cache.put(key, 'x' * 2000, {})
+        path = cache._object_path(key)
+        os.utime(path, (1_000_000 + age, 1_000_000 + age))
+    cache.get(keys[0])  # acerto: 'a' passa a ser a mais recente
+
+    sizes = {key: cache._object_path(key).stat().st_size for key in keys}
+    result = cache.gc(max_bytes=sizes[keys[0]] + sizes[keys[2]])
+
+    assert result['removed'] == 1
+    assert [cache.get(key) is not None for key in keys] == [True, False, True]
+
+
+def test_build_restores_from_cache_and_force_skips_it(build_site):
+    build_site(ARTICLES)
+    # Catálogo e saída apagados: tudo precisa ser reconvertido, mas as páginas vêm do cache
+    shutil.rmtree('output')
+    Path('.build/catalog.sqlite3').unlink()
+
+    result = build_site(ARTICLES)
+    log = result.stdout + result.stderr
+    assert log.count("restaurado do cache de build") == 2
+    assert Path('output/um.html').is_file()
+
+    forced = build_site(ARTICLES, '--force')
+    assert "restaurado do cache de build" not in forced.stdout + forced.stderr
+    assert BuildCache(Path('.build/cache')).load_stats()['hits'] == 2
@@ -0,0 +1,82 @@
+"""Catálogo: links internos e decisão de reconverter (build incremental)."""
+
+import os
+
+import pytest
+
+from catalog import ArticleCatalog, is_internal_link
+
+BASE_URL = 'https://christian-mulato.dev'
+
+
+@pytest.mark.parametrize('href, internal', [
+    ('outro-artigo.html', True),
+    ('#secao', True),
+    ('/tags/kafka.html', True),
+    (f'{BASE_URL}/artigo.html', True),
+    (f'{BASE_URL}/', True),
+    ('https://christian-mulato.dev.evil.com/artigo.html', False),
+    ('https://christian-mulato.devtools.io/', False),
+    ('https://kafka.apache.org/', False),
+    ('mailto:autor@example.com', False),
+])
+def test_is_internal_link(href, internal):
+    assert is_internal_link(href, BASE_URL) is internal
+    assert is_internal_link(href, BASE_URL + '/') is internal
+
+
+@pytest.fixture
+def built(tmp_path):
+    """Catálogo com um artigo já convertido (fonte, saída e dependências registradas)."""
+    md_file = tmp_path / 'artigo.md'
+    md_file.write_text('# Artigo\n\nTexto.\n', encoding='utf-8')
+    output_file = tmp_path / 'artigo.html'
+    output_file.write_text('<html></html>', encoding='utf-8')
+    catalog = ArticleCatalog(tmp_path / 'catalog.sqlite3')
+    catalog.upsert('artigo.md', md_file, output_file, 'chave', {}, {}, {'conversor': 'v1', 'fonte': 'a'})
+    yield catalog, md_file, output_file
+    catalog.close()
+
+
+def test_never_built_article_is_rebuilt(tmp_path):
+    with ArticleCatalog(tmp_path / 'catalog.sqlite3') as catalog:
+        reasons = catalog.rebuild_reasons('novo.md', tmp_path / 'novo.md', 'chave', tmp_path / 'novo.html')
+    assert reasons == ["nunca convertido"]
+
+
+def test_unchanged_article_is_up_to_date(built):
+    catalog, md_file, output_file = built
+    assert catalog.is_up_to_date('artigo.md', md_file, 'chave', output_file, {'conversor': 'v1', 'fonte': 'a'})
+
+
+def test_touch_does_not_force_rebuild(built):
+    catalog, md_file, output_file = built
+    stat = md_file.stat()
+    os.utime(md_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+    assert catalog.rebuild_reasons('artigo.md', md_file, 'chave', output_file) == []
+    # O novo mtime fica registrado: a próxima verificação nem recalcula o hash
+    assert catalog.get('artigo.md')['source_mtime_ns'] == md_file.stat().st_mtime_ns
+
+
+def test_changed_source_and_missing_output(built):
+    catalog, md_file, output_file = built
+    md_file.write_text('# Artigo\n\nTexto novo.\n', encoding='utf-8')
+    output_file.unlink()
+
+    assert catalog.rebuild_reasons('artigo.md', md_file, 'chave', output_file) == ["saída ausente", "fonte alterada"]
+
+
+def test_changed_dependencies_are_explained(built):
+    catalog, md_file, output_file = built
+
+    reasons = catalog.rebuild_reasons('artigo.md', md_file, 'outra-chave', output_file,
+                                      {'conversor': 'v2', 'fonte': 'a', 'include:trecho.md': 'b'})
+
+    assert reasons == ["conversor alterado", "nova dependência include:trecho.md"]
+
+
+def test_build_key_change_without_dependencies(built):
+    catalog, md_file, output_file = built
+    assert catalog.rebuild_reasons('artigo.md', md_file, 'outra-chave', output_file) == \
+        ["configuração ou conversor alterados"]
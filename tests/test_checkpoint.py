@@ -0,0 +1,75 @@
+"""Diário de checkpoint e `start.py --resume`: só os pendentes e as falhas são reprocessados."""
+
+import json
+from pathlib import Path
+
+from checkpoint import CheckpointJournal
+from conftest import series_article
+
+ARTICLES = {
+    'um.md': series_article("Kafka parte um", 1),
+    # Fora da série: consertá-lo não altera a navegação dos outros dois
+    'dois.md': series_article("Kafka avulso", 2).replace("series: kafka\nseries_order: 2\n", ""),
+    'tres.md': series_article("Kafka parte três", 3),
+}
+
+BROKEN = "---\ntitle: [sem fechamento\n---\n\n# Quebrado\n"
+
+
+def test_remaining_lists_pending_and_failed(tmp_path):
+    path = tmp_path / 'checkpoint.jsonl'
+    with CheckpointJournal(path) as journal:
+        journal.start(['a.md', 'b.md', 'c.md'])
+        journal.record('a.md', True, 1)
+        journal.record('b.md', False, 2, "erro")
+
+    assert CheckpointJournal(path).remaining() == ['b.md', 'c.md']
+    assert CheckpointJournal(path).load()['failed']['b.md']['attempts'] == 2
+
+
+def test_resume_appends_and_finish_clears(tmp_path):
+    path = tmp_path / 'checkpoint.jsonl'
+    with CheckpointJournal(path) as journal:
+        journal.start(['a.md', 'b.md'])
+        journal.record('a.md', True, 1)
+
+    with CheckpointJournal(path) as journal:
+        journal.start(['b.md'], resume=True)
+        journal.record('b.md', True, 1)
+        assert CheckpointJournal(path).remaining() == []
+        journal.finish()
+
+    assert CheckpointJournal(path).remaining() is None
+    assert [json.loads(line)['event'] for line in path.read_text(encoding='utf-8').splitlines()] == [
+        'start', 'done', 'resume', 'done', 'finish']
+
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    path = tmp_path / 'checkpoint.jsonl'
+    with CheckpointJournal(path) as journal:
+        journal.start(['a.md', 'b.md'])
+        journal.record('a.md', True, 1)
+    with path.open('a', encoding='utf-8') as f:
+        f.write('{"event": "done", "na')
+
+    assert CheckpointJournal(path).remaining() == ['b.md']
+
+
+def test_build_resumes_only_failed_articles(build_site):
+    articles = dict(ARTICLES, **{'dois.md': BROKEN})
+    failed = build_site(articles, '--continue-on-error', check=False)
+
+    assert failed.returncode != 0
+    assert CheckpointJournal(Path('.build/checkpoint.jsonl')).remaining() == ['dois.md']
+    assert not Path('output/dois.html').exists()
+
+    resumed = build_site(ARTICLES, '--resume', '--explain')
+    log = resumed.stdout + resumed.stderr
+    assert "MOTIVO DA RECONVERSÃO: dois.md - retomada" in log
+    assert "INALTERADO: um.md" in log and "INALTERADO: tres.md" in log
+    assert Path('output/dois.html').is_file()
+    assert CheckpointJournal(Path('.build/checkpoint.jsonl')).remaining() is None
+
+    # Execução concluída: --resume volta ao build incremental normal
+    again = build_site(ARTICLES, '--resume')
+    assert "nenhuma execução interrompida" in again.stdout + again.stderr
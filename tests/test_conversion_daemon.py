@@ -0,0 +1,57 @@
+"""Daemon de conversão: recarga do conversor e contagem de trabalhos."""
+
+import os
+import socket
+import threading
+
+import pytest
+
+import render_version
+from conversion_daemon import ConversionServer, WarmConverter
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason="sockets Unix indisponíveis")
+
+
+def write(path, text):
+    path.write_text(text, encoding='utf-8')
+    # mtime garantidamente diferente mesmo em sistemas de arquivos com pouca resolução
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_warm_converter_reloads_when_a_helper_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(render_version, 'SCRIPTS_DIR', tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    helper = tmp_path / 'ajudante_daemon.py'
+    write(helper, "VALOR = 1\n")
+    converter_path = tmp_path / 'conversor.py'
+    write(converter_path, "from ajudante_daemon import VALOR\n\ndef warm_up():\n    pass\n")
+    converter = WarmConverter(converter_path)
+
+    first = converter.get()
+    assert first.VALOR == 1
+    assert converter.get() is first
+
+    write(helper, "VALOR = 2\n")
+    assert converter.get().VALOR == 2
+
+
+class StubConverter:
+    def convert_md_to_html(self, md_file, *args, **kwargs):
+        return True, md_file, ''
+
+
+def test_jobs_done_counts_concurrent_jobs(tmp_path, monkeypatch):
+    server = ConversionServer(tmp_path / 'converter.sock')
+    try:
+        monkeypatch.setattr(server.converter, 'get', StubConverter)
+        threads = [threading.Thread(target=lambda: [server.run_job({'md_file': 'a.md'}) for _ in range(50)])
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        server.server_close()
+
+    assert server.jobs_done == 400
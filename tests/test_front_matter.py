@@ -0,0 +1,44 @@
+"""Leitura e normalização do front matter."""
+
+from pathlib import Path
+
+import pytest
+
+from conftest import series_article
+from front_matter import FrontMatterError, parse_front_matter, read_front_matter, split_front_matter
+
+
+@pytest.mark.parametrize('raw, fmt, tags', [
+    ("tags: kafka", 'yaml', ['kafka']),
+    ("tags: kafka, java", 'yaml', ['kafka', 'java']),
+    ("tags: [Kafka, Java]", 'yaml', ['Kafka', 'Java']),
+    ("tags:\n  - Kafka\n  - 2024", 'yaml', ['Kafka', '2024']),
+    ("tags:", 'yaml', []),
+    ('tags = "kafka, java"', 'toml', ['kafka', 'java']),
+    ('tags = ["kafka"]', 'toml', ['kafka']),
+])
+def test_tags_are_always_a_list_of_strings(raw, fmt, tags):
+    assert parse_front_matter(raw, fmt)['tags'] == tags
+
+
+def test_category_must_be_text():
+    assert parse_front_matter("category: Tecnologia ", 'yaml')['category'] == 'Tecnologia'
+    assert parse_front_matter("category: 2024", 'yaml')['category'] == '2024'
+    with pytest.raises(FrontMatterError, match='category'):
+        parse_front_matter("category: [Kafka, Java]", 'yaml')
+
+
+def test_malformed_front_matter(tmp_path):
+    with pytest.raises(FrontMatterError):
+        split_front_matter("---\ntitle: [sem fechamento\n---\n\n# Corpo\n")
+
+    broken = tmp_path / 'quebrado.md'
+    broken.write_text("---\ntitle: [sem fechamento\n---\n\n# Corpo\n", encoding='utf-8')
+    assert read_front_matter(broken) == {}
+
+
+def test_scalar_tag_builds_a_single_listing(build_site):
+    article = series_article("Kafka parte um", 1).replace("tags: [kafka, testes]", "tags: kafka")
+    build_site({'um.md': article})
+
+    assert sorted(path.name for path in Path('output/tags').iterdir()) == ['kafka.html']
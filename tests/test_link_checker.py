@@ -0,0 +1,155 @@
+"""Verificação de links: internos e âncoras sobre uma saída gerada, externos contra um servidor HTTP local."""
+
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from link_checker import (ExternalLinkCache, HttpResolver, RateLimiter, build_index, check_external_links,
+                          check_internal_links)
+
+SITE = "https://example.test"
+
+
+def write_page(path, body):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"<!DOCTYPE html>\n<html><body>\n{body}\n</body></html>\n", encoding='utf-8')
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_internal_links_and_anchors(tmp_path, jobs):
+    write_page(tmp_path / 'a.html', '<h2 id="intro">Intro</h2>\n<a href="#intro">ok</a>\n<a href="#sumiu">âncora</a>\n'
+                                    '<a href="kafka/b.html#parte">ok</a>\n<a href="c.html">arquivo</a>\n'
+                                    f'<a href="{SITE}/kafka/b.html#nada">base_url</a>')
+    write_page(tmp_path / 'kafka' / 'b.html', '<p id="parte">Parte</p>\n<a href="../a.html">ok</a>\n'
+                                              '<a href="/a.html#intro">raiz</a>')
+    # Muitas páginas para que jobs=2 use o pool de processos
+    for number in range(40):
+        write_page(tmp_path / 'extra' / f'{number}.html', '<a href="../a.html#intro">ok</a>')
+
+    files, anchors, hrefs = build_index(tmp_path, jobs)
+    checked, broken = check_internal_links(files, anchors, hrefs, SITE, jobs)
+
+    assert checked == 47
+    assert [(item['page'], item['href'], item['line']) for item in broken] == [
+        ('a.html', '#sumiu', 5),
+        ('a.html', 'c.html', 7),
+        ('a.html', f'{SITE}/kafka/b.html#nada', 8),
+    ]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """/ok responde 200, /head-only-get recusa HEAD (405) e o resto é 404."""
+
+    def _respond(self):
+        self.server.requests.append((self.command, self.path))
+        if self.path == '/ok':
+            status = 200
+        elif self.path == '/head-only-get':
+            status = 405 if self.command == 'HEAD' else 200
+        else:
+            status = 404
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    do_HEAD = _respond
+    do_GET = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def resolver(stub_server):
+    return HttpResolver(rewrite={SITE: f"http://127.0.0.1:{stub_server.server_address[1]}"}, timeout=5)
+
+
+def hrefs_for(*paths):
+    return {'artigo.html': [(f"{SITE}{path}", line) for line, path in enumerate(paths, 1)]}
+
+
+def test_reports_broken_links_and_falls_back_to_get(stub_server, resolver):
+    summary, broken = check_external_links(hrefs_for('/ok', '/head-only-get', '/missing'), resolver, rate=0)
+
+    assert summary == {'urls': 3, 'cached': 0, 'requested': 3}
+    assert broken == [{'page': 'artigo.html', 'href': f"{SITE}/missing", 'line': 3,
+                       'status': 404, 'reason': 'HTTP 404'}]
+    assert ('GET', '/head-only-get') in stub_server.requests
+
+
+def test_each_url_is_requested_once(stub_server, resolver):
+    hrefs = {'a.html': [(f"{SITE}/ok", 1), (f"{SITE}/ok#secao", 2)], 'b.html': [(f"{SITE}/ok", 5)]}
+
+    summary, broken = check_external_links(hrefs, resolver, rate=0)
+
+    assert summary['urls'] == 1
+    assert broken == []
+    assert stub_server.requests == [('HEAD', '/ok')]
+
+
+def test_rate_limit_spaces_requests(stub_server, resolver):
+    paths = [f"/missing-{number}" for number in range(5)]
+
+    started = time.monotonic()
+    summary, _ = check_external_links(hrefs_for(*paths), resolver, concurrency=5, rate=20)
+    elapsed = time.monotonic() - started
+
+    assert summary['requested'] == 5
+    # 5 requisições a 20/s: a última sai pelo menos 4 intervalos (0,2 s) depois da primeira
+    assert elapsed >= 0.2
+
+
+def test_rate_limiter_without_rate_does_not_block():
+    limiter = RateLimiter(0)
+    started = time.monotonic()
+    for _ in range(100):
+        limiter.wait()
+    assert time.monotonic() - started < 0.1
+
+
+def test_cache_skips_requests_within_ttl(stub_server, resolver, tmp_path):
+    cache_path = tmp_path / 'external_links.json'
+
+    check_external_links(hrefs_for('/ok', '/missing'), resolver, ExternalLinkCache(cache_path, ttl=60), rate=0)
+    assert len(stub_server.requests) == 2
+
+    summary, broken = check_external_links(hrefs_for('/ok', '/missing'), resolver,
+                                           ExternalLinkCache(cache_path, ttl=60), rate=0)
+    assert summary == {'urls': 2, 'cached': 2, 'requested': 0}
+    assert [item['href'] for item in broken] == [f"{SITE}/missing"]
+    assert len(stub_server.requests) == 2
+
+
+def test_cache_entries_expire_after_ttl(stub_server, resolver, tmp_path):
+    cache = ExternalLinkCache(tmp_path / 'external_links.json', ttl=60)
+    cache.put(f"{SITE}/ok", True, 200, '')
+    cache.entries[f"{SITE}/ok"]['checked_at'] -= 120
+
+    summary, _ = check_external_links(hrefs_for('/ok'), resolver, cache, rate=0)
+
+    assert summary == {'urls': 1, 'cached': 0, 'requested': 1}
+    assert stub_server.requests == [('HEAD', '/ok')]
+
+
+def test_cache_save_drops_expired_entries(tmp_path):
+    cache_path = tmp_path / 'external_links.json'
+    cache = ExternalLinkCache(cache_path, ttl=60)
+    cache.put(f"{SITE}/novo", True, 200, '')
+    cache.put(f"{SITE}/velho", True, 200, '')
+    cache.entries[f"{SITE}/velho"]['checked_at'] -= 120
+    cache.save()
+
+    assert list(ExternalLinkCache(cache_path, ttl=60).entries) == [f"{SITE}/novo"]
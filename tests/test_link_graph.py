@@ -0,0 +1,50 @@
+"""Grafo de links internos a partir de um build real."""
+
+from pathlib import Path
+
+from catalog import ArticleCatalog
+from conftest import series_article
+from link_graph import analyze, build_graph
+
+
+def open_catalog():
+    return ArticleCatalog(Path('.build') / 'catalog.sqlite3')
+
+
+def test_series_navigation_links_become_edges(build_site):
+    build_site({'um.md': series_article("Kafka parte um", 1), 'dois.md': series_article("Kafka parte dois", 2)})
+
+    with open_catalog() as catalog:
+        graph, counts = build_graph(catalog)
+        report = analyze(catalog)
+
+    edges = {(graph.nodes[source], graph.nodes[target]) for source, target in zip(graph.sources, graph.targets)}
+    assert edges == {('um.md', 'dois.md'), ('dois.md', 'um.md')}
+    # prev/next/prefetch e o link da barra da série apontam para o mesmo arquivo: um link por artigo
+    assert counts == {'links': 2, 'unresolved': 0}
+    assert report['orphans'] == []
+
+
+def test_series_links_in_subfolders_resolve(build_site):
+    build_site({'kafka/um.md': series_article("Kafka parte um", 1),
+                'kafka/dois.md': series_article("Kafka parte dois", 2)})
+
+    with open_catalog() as catalog:
+        graph, counts = build_graph(catalog)
+
+    assert len(graph.sources) == 2
+    assert counts['unresolved'] == 0
+
+
+def test_pagination_links_are_stored_without_self_edges(build_site):
+    body = "\n\n".join(f"## Seção {number}\n\n" + "palavra " * 80 for number in range(1, 4))
+    build_site({'longo.md': series_article("Artigo longo", 1, body)}, '--paginate-words', '100')
+
+    with open_catalog() as catalog:
+        hrefs = {row['href'] for row in catalog.internal_links()}
+        graph, counts = build_graph(catalog)
+
+    assert {'longo-pagina-2.html', 'longo-pagina-3.html', 'longo.html'} <= hrefs
+    assert 'longo-pagina-3.html#secao-3' in hrefs
+    assert counts['unresolved'] == 0
+    assert graph.sources == []
@@ -0,0 +1,53 @@
+"""Listagens por tag e categoria: slugs sem colisão e estáveis entre builds."""
+
+from pathlib import Path
+
+from conftest import series_article
+from listing_pages import listing_slugs, page_filename, slugify
+
+
+def tagged(title, tag, order=1):
+    return series_article(title, order).replace("tags: [kafka, testes]", f'tags: ["{tag}"]')
+
+
+def test_slugify():
+    assert slugify("Programação") == 'programacao'
+    assert slugify("Event-Driven") == 'event-driven'
+    assert slugify("C++") == 'c'
+    assert slugify("???") == 'sem-nome'
+
+
+def test_colliding_names_get_distinct_slugs():
+    slugs = listing_slugs(["C++", "C", "C#", "Java"])
+
+    assert slugs == {'C': 'c', 'C#': 'c--2', 'C++': 'c--3', 'Java': 'java'}
+    # O sufixo "--N" nunca coincide com o "-N" das páginas seguintes
+    assert page_filename(slugs['C'], 2) not in {page_filename(slug, 1) for slug in slugs.values()}
+
+
+def test_stored_slugs_are_kept():
+    slugs = listing_slugs(["C", "C#", "C++"], {"C#": 'c--2', "C++": 'c--3'})
+    assert slugs == {'C': 'c', 'C#': 'c--2', 'C++': 'c--3'}
+
+    # Uma tag nova que colide não toma o slug de quem já tem página
+    assert listing_slugs(["C", "c"], {"c": 'c'}) == {'c': 'c', 'C': 'c--2'}
+
+
+def listing_titles():
+    return {path.name: path.read_text(encoding='utf-8').split('<h1>', 1)[1].split('</h1>', 1)[0]
+            for path in Path('output/tags').glob('c*.html')}
+
+
+def test_colliding_tags_build_separate_pages(build_site):
+    articles = {'a.md': tagged("Artigo C", "C"), 'b.md': tagged("Artigo C#", "C#"),
+                'c.md': tagged("Artigo C++", "C++")}
+    build_site(articles)
+
+    assert listing_titles() == {'c.html': 'Artigos com a tag C', 'c--2.html': 'Artigos com a tag C#',
+                                'c--3.html': 'Artigos com a tag C++'}
+
+    # Sem "C", as outras listagens mantêm o endereço e c.html é removida
+    Path('articles_md/a.md').unlink()
+    del articles['a.md']
+    build_site(articles)
+    assert listing_titles() == {'c--2.html': 'Artigos com a tag C#', 'c--3.html': 'Artigos com a tag C++'}
@@ -0,0 +1,87 @@
+"""Paginação de artigos longos, registro das páginas extras no catálogo e junção de shards."""
+
+from pathlib import Path
+
+from catalog import ArticleCatalog
+from conftest import series_article
+from merge_shards import merge_shards
+from pagination import paginate, table_of_contents, write_extra_pages
+
+BODY = "\n".join([
+    '<p>Introdução com <a href="#terceira">link</a>.</p>',
+    '<h2 id="primeira">Primeira</h2>',
+    '<p>' + 'palavra ' * 30 + '</p>',
+    '<h2 id="segunda">Segunda <code>x</code></h2>',
+    '<p>' + 'palavra ' * 30 + '</p>',
+    '<h2 id="terceira">Terceira</h2>',
+    '<p>' + 'palavra ' * 30 + '</p>',
+])
+
+
+def test_short_body_is_a_single_page():
+    pages = paginate(BODY, 'artigo')
+
+    assert [page['file'] for page in pages] == ['artigo.html']
+
+
+def test_body_is_split_at_h2_within_budget():
+    pages = paginate(BODY, 'artigo', max_words=40)
+
+    assert [page['file'] for page in pages] == ['artigo.html', 'artigo-pagina-2.html', 'artigo-pagina-3.html']
+    assert pages[0]['html_body'].startswith('<p>Introdução')
+    assert pages[1]['headings'] == [('segunda', 'Segunda x')]
+    # O link para uma seção de outra página aponta para o arquivo dela
+    assert 'href="artigo-pagina-3.html#terceira"' in pages[0]['html_body']
+
+
+def test_table_of_contents_links_every_page():
+    toc = table_of_contents(paginate(BODY, 'artigo', max_words=40))
+
+    assert [entry['href'] for entry in toc] == [
+        'artigo.html#primeira', 'artigo-pagina-2.html#segunda', 'artigo-pagina-3.html#terceira'
+    ]
+
+
+def test_write_extra_pages_removes_stale_pages(tmp_path):
+    output_file = tmp_path / 'artigo.html'
+    write_extra_pages(output_file, {'artigo-pagina-2.html': 'dois', 'artigo-pagina-3.html': 'tres'})
+    (tmp_path / 'artigo-pagina-3.html.gz').write_bytes(b'')
+    (tmp_path / 'outro-pagina-2.html').write_text('outro', encoding='utf-8')
+
+    written = write_extra_pages(output_file, {'artigo-pagina-2.html': 'dois'})
+
+    assert written == [tmp_path / 'artigo-pagina-2.html']
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['artigo-pagina-2.html', 'outro-pagina-2.html']
+
+
+def test_catalog_keeps_extra_pages_through_manifest(tmp_path):
+    md_file = tmp_path / 'artigo.md'
+    md_file.write_text('# Artigo\n', encoding='utf-8')
+    output_file = tmp_path / 'artigo.html'
+    output_file.write_text('<html></html>', encoding='utf-8')
+    info = {'extra_pages': {'artigo-pagina-3.html': '', 'artigo-pagina-2.html': ''}}
+
+    with ArticleCatalog(tmp_path / 'shard.sqlite3') as shard:
+        shard.upsert('artigo.md', md_file, output_file, 'chave', {}, info)
+        assert shard.extra_pages_for('artigo.md') == ['artigo-pagina-2.html', 'artigo-pagina-3.html']
+        records = shard.export_records()
+
+    with ArticleCatalog(tmp_path / 'merged.sqlite3') as merged:
+        for record in records:
+            merged.import_record(record)
+        assert merged.extra_pages_for('artigo.md') == ['artigo-pagina-2.html', 'artigo-pagina-3.html']
+
+
+def test_shard_merge_copies_every_page(build_site):
+    body = "\n\n".join(f"## Seção {number}\n\n" + "palavra " * 80 for number in range(1, 4))
+    articles = {'longo.md': series_article("Artigo longo", 1, body), 'kafka/outro.md': series_article("Outro", 2, body)}
+    options = ('--paginate-words', '100', '--compress')
+    build_site(articles, '--shard', '1/2', *options)
+    build_site(articles, '--shard', '2/2', *options)
+
+    assert merge_shards(sorted(Path('.build').glob('shard-*/output')), Path('output')) == 0
+
+    for first in ('longo', 'kafka/outro'):
+        for name in (f'{first}.html', f'{first}-pagina-2.html', f'{first}-pagina-3.html'):
+            assert (Path('output') / name).is_file()
+            assert (Path('output') / f'{name}.gz').is_file()
@@ -0,0 +1,84 @@
+"""Versão do código de renderização (módulos importados) e do corpo em cache (body_version)."""
+
+import os
+import shutil
+import importlib.util
+
+import render_version
+
+CONVERTER = render_version.CONVERTER_PATH
+
+
+def write_modules(directory, modules):
+    for name, source in modules.items():
+        path = directory / f"{name}.py"
+        path.write_text(source, encoding='utf-8')
+        # mtime diferente a cada escrita: local_imports é memorizado por mtime e tamanho
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_render_modules_follow_module_level_imports(tmp_path, monkeypatch):
+    monkeypatch.setattr(render_version, 'SCRIPTS_DIR', tmp_path)
+    write_modules(tmp_path, {
+        'conversor': "import os\nfrom ajudante import f\ntry:\n    import opcional\nexcept ImportError:\n    pass\n"
+                     "def main():\n    import cliente\n",
+        'ajudante': "import indireto\ndef f():\n    pass\n",
+        'indireto': "X = 1\n",
+        'opcional': "Y = 2\n",
+        'cliente': "Z = 3\n",
+    })
+
+    names = [path.stem for path in render_version.render_modules([tmp_path / 'conversor.py'])]
+
+    assert names == ['ajudante', 'conversor', 'indireto', 'opcional']
+
+
+def test_render_digest_changes_with_imported_helper(tmp_path, monkeypatch):
+    monkeypatch.setattr(render_version, 'SCRIPTS_DIR', tmp_path)
+    write_modules(tmp_path, {'conversor': "from ajudante import f\n", 'ajudante': "def f():\n    return 1\n",
+                             'solto': "A = 1\n"})
+    roots = [tmp_path / 'conversor.py']
+    before = render_version.render_digest(roots)
+
+    write_modules(tmp_path, {'solto': "A = 2\n"})
+    assert render_version.render_digest(roots) == before
+
+    write_modules(tmp_path, {'ajudante': "def f():\n    return 2\n"})
+    assert render_version.render_digest(roots) != before
+    assert set(render_version.render_mtimes(roots)) == {(tmp_path / 'ajudante.py').resolve(), roots[0].resolve()}
+
+
+def test_real_converter_closure_includes_body_helpers():
+    names = {path.name for path in render_version.render_modules()}
+    assert {'format-html-seo.py', 'series.py', 'reading_stats.py', 'pagination.py', 'front_matter.py'} <= names
+
+
+def load_converter_copy(tmp_path):
+    copy = tmp_path / CONVERTER.name
+    shutil.copy(CONVERTER, copy)
+    spec = importlib.util.spec_from_file_location("format_html_seo_copia", copy)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return copy, module
+
+
+def replace_in(path, old, new):
+    text = path.read_text(encoding='utf-8')
+    assert old in text
+    path.write_text(text.replace(old, new, 1), encoding='utf-8')
+
+
+def test_body_version_ignores_template_functions(tmp_path):
+    copy, converter = load_converter_copy(tmp_path)
+    before = converter.body_version()
+
+    # Só o template muda: os corpos em cache continuam válidos
+    replace_in(copy, '<nav class="series-nav"', '<nav class="series-nav series-nav-nova"')
+    replace_in(copy, "'links': navigation_links(body['links'], series_nav, pagination),",
+               "'links': list(navigation_links(body['links'], series_nav, pagination)),")
+    assert converter.body_version() == before
+
+    # render_body muda: a versão do corpo também
+    replace_in(copy, "timer.lap('postprocess')", "timer.lap('pos-processamento')")
+    assert converter.body_version() != before
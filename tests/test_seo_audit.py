@@ -0,0 +1,45 @@
+"""Auditoria de SEO sobre uma saída gerada pelo build."""
+
+from pathlib import Path
+
+from catalog import ArticleCatalog
+from conftest import series_article
+from seo_audit import article_pages, run_audit, select_rules
+
+ARTICLES = {
+    'um.md': series_article("Kafka parte um", 1),
+    'dois.md': series_article("Kafka parte dois", 2),
+}
+
+
+def audit(pages=None):
+    return run_audit(Path('output'), select_rules(), 'https://example.test', manifest_path=None, pages=pages)
+
+
+def test_audit_covers_only_article_pages(build_site):
+    build_site(ARTICLES)
+    with ArticleCatalog(Path('.build') / 'catalog.sqlite3') as catalog:
+        pages = article_pages(catalog, Path('output'))
+
+    assert sorted(pages) == ['dois.html', 'um.html']
+    report = audit(pages)
+    assert report['pages'] == 2
+    assert [violation for violation in report['violations'] if violation['severity'] == 'error'] == []
+
+
+def test_listing_pages_are_audited_only_with_all_pages(build_site):
+    build_site(ARTICLES)
+
+    report = audit()
+
+    assert {'tags/kafka.html', 'categories/tecnologia.html'} <= {violation['page'] for violation in report['violations']}
+
+
+def test_audit_includes_extra_pages_of_paginated_articles(build_site):
+    body = "\n\n".join(f"## Seção {number}\n\n" + "palavra " * 80 for number in range(1, 4))
+    build_site({'longo.md': series_article("Artigo longo", 1, body)}, '--paginate-words', '100')
+    with ArticleCatalog(Path('.build') / 'catalog.sqlite3') as catalog:
+        pages = article_pages(catalog, Path('output'))
+
+    assert sorted(pages) == ['longo-pagina-2.html', 'longo-pagina-3.html', 'longo.html']
+    assert audit(pages)['pages'] == 3
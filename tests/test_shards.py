@@ -0,0 +1,80 @@
+"""Build distribuído: partição dos artigos entre shards e junção das saídas."""
+
+import json
+import shutil
+from pathlib import Path
+
+from conftest import series_article
+from merge_shards import merge_shards
+from scheduler import assign_shards
+
+ARTICLES = {
+    'um.md': series_article("Kafka parte um", 1),
+    'dois.md': series_article("Kafka parte dois", 2),
+    'tres.md': series_article("Kafka parte três", 3, "Texto mais longo. " * 200),
+    'java/quatro.md': series_article("Kafka parte quatro", 4),
+}
+
+
+def make_jobs(tmp_path, sizes):
+    jobs = []
+    for name, size in sizes.items():
+        md_file = tmp_path / name
+        md_file.write_text('x' * size, encoding='utf-8')
+        jobs.append({'name': name, 'md_file': str(md_file)})
+    return jobs
+
+
+def test_assign_shards_is_balanced_and_independent_of_order(tmp_path):
+    sizes = {'a.md': 900, 'b.md': 500, 'c.md': 400, 'd.md': 300, 'e.md': 200, 'f.md': 100}
+    jobs = make_jobs(tmp_path, sizes)
+
+    assignment = assign_shards(jobs, 2)
+
+    assert assign_shards(list(reversed(jobs)), 2) == assignment
+    assert sorted(assignment) == sorted(sizes)
+    loads = [sum(sizes[name] + 1 for name, shard in assignment.items() if shard == index) for index in range(2)]
+    assert sorted(loads) == [1202, 1204]  # 2406 bytes (tamanho + 1 por artigo) quase ao meio
+
+
+def test_more_shards_than_articles(tmp_path):
+    assignment = assign_shards(make_jobs(tmp_path, {'a.md': 10, 'b.md': 20}), 4)
+    assert sorted(assignment.values()) == [0, 1]
+
+
+def build_shards(build_site, count):
+    for index in range(1, count + 1):
+        build_site(ARTICLES, '--shard', f'{index}/{count}')
+    return [Path(f'.build/shard-{index}-of-{count}/output') for index in range(1, count + 1)]
+
+
+def test_shards_partition_the_corpus_and_merge_matches_full_build(build_site):
+    shard_dirs = build_shards(build_site, 2)
+    names = [{record['path'] for record in json.loads((shard / 'manifest.json').read_text(encoding='utf-8'))['articles']}
+             for shard in shard_dirs]
+    assert names[0] and names[1] and not names[0] & names[1]
+    assert names[0] | names[1] == set(ARTICLES)
+
+    assert merge_shards(shard_dirs, Path('merged')) == 0
+    build_site(ARTICLES)
+
+    merged = {path.relative_to('merged').as_posix() for path in Path('merged').rglob('*') if path.is_file()}
+    full = {path.relative_to('output').as_posix() for path in Path('output').rglob('*') if path.is_file()}
+    assert merged == full
+    assert Path('merged/tags/kafka.html').read_text(encoding='utf-8').count('<li>') == 4
+
+
+def test_merge_rejects_an_article_in_two_shards(build_site, capsys):
+    shard_dirs = build_shards(build_site, 2)
+    duplicate = Path('.build/copia/output')
+    shutil.copytree(shard_dirs[0], duplicate)
+
+    assert merge_shards([*shard_dirs, duplicate], Path('merged')) == 1
+    assert "aparece em dois shards" in capsys.readouterr().out
+
+
+def test_merge_warns_about_missing_shards(build_site, capsys):
+    shard_dirs = build_shards(build_site, 2)
+
+    assert merge_shards(shard_dirs[:1], Path('merged')) == 0
+    assert "Shards ausentes (de 2): 2" in capsys.readouterr().out